@@ -1,25 +1,49 @@
 """Claude Tooling Index.
 
 Catalog and analyze Claude Code tooling with usage analytics and a TUI dashboard.
+
+Public names are resolved lazily, so `import claude_tooling_index` (and with it
+every CLI start) does not import the scanners, database and analytics modules
+until one of them is actually used.
 """
 
 __version__ = "1.0.0"
 __author__ = "Wolfgang Schoenberger"
 
-from .analytics import AnalyticsTracker
-from .database import ToolingDatabase
-from .models import (
-    BinaryMetadata,
-    CommandMetadata,
-    ComponentMetadata,
-    HookMetadata,
-    InvocationRecord,
-    MCPMetadata,
-    PluginMetadata,
-    ScanResult,
-    SkillMetadata,
-)
-from .scanner import ToolingScanner
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .analytics import AnalyticsTracker
+    from .database import ToolingDatabase
+    from .models import (
+        BinaryMetadata,
+        CommandMetadata,
+        ComponentMetadata,
+        HookMetadata,
+        InvocationRecord,
+        MCPMetadata,
+        PluginMetadata,
+        ScanResult,
+        SkillMetadata,
+    )
+    from .scanner import ToolingScanner
+
+# Exported name -> defining submodule
+_EXPORT_MODULES = {
+    "ToolingScanner": "scanner",
+    "AnalyticsTracker": "analytics",
+    "ToolingDatabase": "database",
+    "ComponentMetadata": "models",
+    "SkillMetadata": "models",
+    "PluginMetadata": "models",
+    "CommandMetadata": "models",
+    "HookMetadata": "models",
+    "MCPMetadata": "models",
+    "BinaryMetadata": "models",
+    "ScanResult": "models",
+    "InvocationRecord": "models",
+}
 
 __all__ = [
     "ToolingScanner",
@@ -35,3 +59,19 @@ __all__ = [
     "ScanResult",
     "InvocationRecord",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the exported object `name` from its submodule on first use."""
+    module_name = _EXPORT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -63,8 +63,8 @@ def scan(platform, claude_home, codex_home, parallel, verbose, no_db):
 
         if platform.lower() == "all":
             by_platform = {}
-            for c in result.all_components:
-                platform_key = getattr(c, "platform", "claude")
+            for c in result.iter_all():
+                platform_key = c.platform
                 by_platform[platform_key] = by_platform.get(platform_key, 0) + 1
             click.echo("")
             click.echo("   By platform:")
@@ -558,12 +558,11 @@ def export(output_format, output, include_disabled, platform, claude_home, codex
         result = scanner.scan_all(platform=platform)
 
         if output_format == "json":
-            exporter = JSONExporter()
-            content = exporter.export_scan_result(result)
+            write_export = JSONExporter().export_scan_result_to_file
             default_filename = "tooling-index.json"
         else:
             exporter = MarkdownExporter(include_disabled=include_disabled)
-            content = exporter.export_scan_result(result)
+            write_export = exporter.export_to_file
             default_filename = "tooling-index.md"
 
         if output:
@@ -571,8 +570,7 @@ def export(output_format, output, include_disabled, platform, claude_home, codex
         else:
             output_path = Path.cwd() / default_filename
 
-        with open(output_path, "w") as f:
-            f.write(content)
+        write_export(result, output_path)
 
         click.echo(f"✅ Exported to {output_path}")
         click.echo(f"   {result.total_count} components")
@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
 from .models import ScanResult
+from .scanner import _SCAN_EXECUTOR
 from .scanners.codex_mcps import CodexMCPScanner
 from .scanners.skills import SkillScanner
 
 
+@lru_cache(maxsize=8)
+def _detect_codex_home_cached(home: Path) -> Path:
+    codex_home = home / ".codex"
+    if not codex_home.exists():
+        raise ValueError("~/.codex directory not found. Install Codex CLI first.")
+    return codex_home
+
+
 class CodexToolingScanner:
     """Scans ~/.codex directory and extracts supported component metadata."""
 
@@ -23,11 +32,14 @@ class CodexToolingScanner:
         )
         self.mcps_scanner = CodexMCPScanner(self.codex_home / "config.toml")
 
-    def scan_all(self, parallel: bool = True) -> ScanResult:
+    def scan_all(
+        self, parallel: bool = True, scan_time: Optional[datetime] = None
+    ) -> ScanResult:
         """Scan all Codex components and return results.
 
         Args:
-            parallel: If True, scan components in parallel using threads.
+            parallel: If True, scan components in parallel on the shared executor.
+            scan_time: Timestamp to record on the result. Defaults to now.
 
         Returns:
             ScanResult containing all discovered components.
@@ -35,22 +47,21 @@ class CodexToolingScanner:
         errors: List[str] = []
 
         if parallel:
-            with ThreadPoolExecutor(max_workers=2) as executor:
-                skills_future = executor.submit(
-                    self._safe_scan, self.skills_scanner.scan, "skills", errors
-                )
-                mcps_future = executor.submit(
-                    self._safe_scan, self.mcps_scanner.scan, "mcps", errors
-                )
-
-                result = ScanResult(
-                    skills=skills_future.result(),
-                    plugins=[],
-                    commands=[],
-                    hooks=[],
-                    mcps=mcps_future.result(),
-                    binaries=[],
-                )
+            skills_future = _SCAN_EXECUTOR.submit(
+                self._safe_scan, self.skills_scanner.scan, "skills", errors
+            )
+            mcps_future = _SCAN_EXECUTOR.submit(
+                self._safe_scan, self.mcps_scanner.scan, "mcps", errors
+            )
+
+            result = ScanResult(
+                skills=skills_future.result(),
+                plugins=[],
+                commands=[],
+                hooks=[],
+                mcps=mcps_future.result(),
+                binaries=[],
+            )
         else:
             result = ScanResult(
                 skills=self._safe_scan(self.skills_scanner.scan, "skills", errors),
@@ -61,7 +72,7 @@ class CodexToolingScanner:
                 binaries=[],
             )
 
-        result.scan_time = datetime.now()
+        result.scan_time = scan_time or datetime.now()
         result.errors = errors
         return result
 
@@ -73,7 +84,9 @@ class CodexToolingScanner:
             return []
 
     def _detect_codex_home(self) -> Path:
-        codex_home = Path.home() / ".codex"
-        if not codex_home.exists():
-            raise ValueError("~/.codex directory not found. Install Codex CLI first.")
-        return codex_home
+        return _detect_codex_home_cached(Path.home())
+
+    @staticmethod
+    def invalidate_home_cache() -> None:
+        """Forget previously detected Codex home directories."""
+        _detect_codex_home_cached.cache_clear()
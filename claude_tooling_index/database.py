@@ -249,7 +249,7 @@ class ToolingDatabase:
         cursor = self.conn.cursor()
         current_time = datetime.now()
 
-        for component in scan_result.all_components:
+        for component in scan_result.iter_all():
             metadata_dict = self._build_metadata_dict(component)
             metadata_json = json.dumps(metadata_dict, default=str)
 
@@ -257,7 +257,7 @@ class ToolingDatabase:
             cursor.execute(
                 "SELECT id, first_seen FROM components WHERE platform = ? AND name = ? AND type = ?",
                 (
-                    getattr(component, "platform", "claude"),
+                    component.platform,
                     component.name,
                     component.type,
                 ),
@@ -311,7 +311,7 @@ class ToolingDatabase:
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """,
                     (
-                        getattr(component, "platform", "claude"),
+                        component.platform,
                         component.name,
                         component.type,
                         component.origin,
@@ -352,7 +352,7 @@ class ToolingDatabase:
                     component_id,
                     component.name,
                     description,
-                    f"{getattr(component, 'platform', 'claude')} {component.type}",
+                    f"{component.platform} {component.type}",
                 ),
             )
 
@@ -5,16 +5,122 @@ component lists.
 """
 
 import json
+from dataclasses import fields, is_dataclass
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
 
 from ..models import ComponentMetadata, ScanResult
 
+_ALWAYS = "always"
+_TRUTHY = "truthy"
+_JSON = "json"
+
+# Optional component fields in export order, paired with how they are emitted:
+# "always" fields are written unconditionally, "truthy" fields only when set, and
+# "json" fields are decoded into a nested object when possible.
+_OPTIONAL_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("version", _TRUTHY),
+    ("description", _TRUTHY),
+    ("file_count", _ALWAYS),
+    ("total_lines", _ALWAYS),
+    ("has_docs", _ALWAYS),
+    ("performance_notes", _JSON),
+    ("dependencies", _TRUTHY),
+    ("dependency_sources", _TRUTHY),
+    ("frontmatter_extra", _TRUTHY),
+    ("invocation_aliases", _TRUTHY),
+    ("invocation_arguments", _TRUTHY),
+    ("invocation_instruction", _TRUTHY),
+    ("references", _TRUTHY),
+    ("context_fork_hint", _TRUTHY),
+    ("when_to_use", _TRUTHY),
+    ("trigger_rules", _TRUTHY),
+    ("detected_tools", _TRUTHY),
+    ("detected_toolkits", _TRUTHY),
+    ("inputs", _TRUTHY),
+    ("outputs", _TRUTHY),
+    ("safety_notes", _TRUTHY),
+    ("capability_tags", _TRUTHY),
+    ("inputs_schema", _TRUTHY),
+    ("outputs_schema", _TRUTHY),
+    ("examples", _TRUTHY),
+    ("prerequisites", _TRUTHY),
+    ("gotchas", _TRUTHY),
+    ("required_env_vars", _TRUTHY),
+    ("trigger_types", _TRUTHY),
+    ("context_behavior", _TRUTHY),
+    ("side_effects", _TRUTHY),
+    ("risk_level", _TRUTHY),
+    ("depends_on_skills", _TRUTHY),
+    ("used_by_skills", _TRUTHY),
+    ("llm_summary", _TRUTHY),
+    ("llm_tags", _TRUTHY),
+    ("marketplace", _TRUTHY),
+    ("author", _TRUTHY),
+    ("homepage", _TRUTHY),
+    ("repository", _TRUTHY),
+    ("license", _TRUTHY),
+    ("provides_commands", _TRUTHY),
+    ("provides_mcps", _TRUTHY),
+    ("trigger", _TRUTHY),
+    ("trigger_event", _TRUTHY),
+    ("language", _TRUTHY),
+    ("file_size", _ALWAYS),
+    ("is_executable", _ALWAYS),
+    ("command", _TRUTHY),
+    ("args", _TRUTHY),
+    ("env_vars", _TRUTHY),
+    ("transport", _TRUTHY),
+    ("source", _TRUTHY),
+    ("source_detail", _TRUTHY),
+    ("git_remote", _TRUTHY),
+    ("config_extra", _TRUTHY),
+    ("shebang", _TRUTHY),
+    ("content_truncated", _TRUTHY),
+    ("commands_detail", _TRUTHY),
+    ("mcps_detail", _TRUTHY),
+)
+
+
+_Getter = Callable[[Any], Tuple[Any, ...]]
+_FieldPlan = Tuple[Tuple[str, ...], _Getter, Tuple[Tuple[str, str], ...], _Getter]
+
+
+def _tuple_getter(attrs: Tuple[str, ...]) -> _Getter:
+    """Build a getter returning the given attributes of an object as a tuple."""
+    if not attrs:
+        return lambda component: ()
+    if len(attrs) == 1:
+        attr = attrs[0]
+        return lambda component: (getattr(component, attr),)
+    return attrgetter(*attrs)
+
+
+def _build_field_plan(entries: Iterable[Tuple[str, str]]) -> _FieldPlan:
+    """Split plan entries into unconditional and conditional fields.
+
+    Unconditional fields are emitted directly after the mandatory keys, so every
+    component of a class builds its dict in the same fixed key order.
+    """
+    entries = tuple(entries)
+    always = tuple(attr for attr, mode in entries if mode is _ALWAYS)
+    conditional = tuple(entry for entry in entries if entry[1] is not _ALWAYS)
+    return (
+        always,
+        _tuple_getter(always),
+        conditional,
+        _tuple_getter(tuple(attr for attr, _ in conditional)),
+    )
+
 
 class JSONExporter:
     """Export scan results and components as structured JSON."""
 
+    # Per-class optional field plans, shared across exporter instances.
+    _field_plans: Dict[type, _FieldPlan] = {}
+
     def __init__(self, include_analytics: bool = True, pretty: bool = True):
         self.include_analytics = include_analytics
         self.pretty = pretty
@@ -28,7 +134,65 @@ class JSONExporter:
         Returns:
             A JSON document as a string.
         """
-        data = {
+        return self._to_json(self._scan_result_data(result))
+
+    def export_components(
+        self, components: List[Union[ComponentMetadata, Dict[str, Any]]]
+    ) -> str:
+        """Export a list of components to JSON.
+
+        Args:
+            components: Components (or already-serialized dicts) to export.
+
+        Returns:
+            A JSON document as a string.
+        """
+        return self._to_json(self._components_data(components))
+
+    def export_scan_result_to_file(self, result: ScanResult, output_path: Path):
+        """Export a full scan result to a JSON file.
+
+        Args:
+            result: Scan result to export.
+            output_path: Destination file path.
+        """
+        self._write_json(self._scan_result_data(result), output_path)
+
+    def export_components_to_file(
+        self,
+        components: List[Union[ComponentMetadata, Dict[str, Any]]],
+        output_path: Path,
+    ):
+        """Export a list of components to a JSON file.
+
+        Args:
+            components: Components (or already-serialized dicts) to export.
+            output_path: Destination file path.
+        """
+        self._write_json(self._components_data(components), output_path)
+
+    def export_to_file(
+        self,
+        result: Union[ScanResult, List[ComponentMetadata]],
+        output_path: Path,
+    ):
+        """Export scan data to a JSON file.
+
+        Prefer `export_scan_result_to_file` or `export_components_to_file` when
+        the input type is known; this wrapper dispatches on it at runtime.
+
+        Args:
+            result: Either a scan result or a list of components.
+            output_path: Destination file path.
+        """
+        if isinstance(result, ScanResult):
+            self.export_scan_result_to_file(result, output_path)
+        else:
+            self.export_components_to_file(result, output_path)
+
+    def _scan_result_data(self, result: ScanResult) -> Dict[str, Any]:
+        """Build the JSON document for a full scan result."""
+        return {
             "version": "1.0.0",
             "generated_at": datetime.now().isoformat(),
             "summary": {
@@ -51,20 +215,11 @@ class JSONExporter:
             "errors": result.errors,
         }
 
-        return self._to_json(data)
-
-    def export_components(
+    def _components_data(
         self, components: List[Union[ComponentMetadata, Dict[str, Any]]]
-    ) -> str:
-        """Export a list of components to JSON.
-
-        Args:
-            components: Components (or already-serialized dicts) to export.
-
-        Returns:
-            A JSON document as a string.
-        """
-        data = {
+    ) -> Dict[str, Any]:
+        """Build the JSON document for a list of components."""
+        return {
             "version": "1.0.0",
             "generated_at": datetime.now().isoformat(),
             "count": len(components),
@@ -74,32 +229,11 @@ class JSONExporter:
             ],
         }
 
-        return self._to_json(data)
-
-    def export_to_file(
-        self,
-        result: Union[ScanResult, List[ComponentMetadata]],
-        output_path: Path,
-    ):
-        """Export scan data to a JSON file.
-
-        Args:
-            result: Either a scan result or a list of components.
-            output_path: Destination file path.
-        """
-        if isinstance(result, ScanResult):
-            json_str = self.export_scan_result(result)
-        else:
-            json_str = self.export_components(result)
-
-        with open(output_path, "w") as f:
-            f.write(json_str)
-
     def _serialize_component(self, component: ComponentMetadata) -> Dict[str, Any]:
         """Serialize a component to a dictionary."""
         data = {
             "name": component.name,
-            "platform": getattr(component, "platform", "claude"),
+            "platform": component.platform,
             "type": component.type,
             "origin": component.origin,
             "status": component.status,
@@ -108,199 +242,65 @@ class JSONExporter:
         }
 
         # Add type-specific fields
-        if hasattr(component, "version") and component.version:
-            data["version"] = component.version
-
-        if hasattr(component, "description") and component.description:
-            data["description"] = component.description
-
-        if hasattr(component, "file_count"):
-            data["file_count"] = component.file_count
-
-        if hasattr(component, "total_lines"):
-            data["total_lines"] = component.total_lines
-
-        if hasattr(component, "has_docs"):
-            data["has_docs"] = component.has_docs
-
-        if hasattr(component, "performance_notes") and component.performance_notes:
-            # Parse JSON string to include as nested object
-            try:
-                data["performance"] = json.loads(component.performance_notes)
-            except (json.JSONDecodeError, TypeError):
-                data["performance_notes"] = component.performance_notes
-
-        if hasattr(component, "dependencies") and component.dependencies:
-            data["dependencies"] = component.dependencies
-
-        if hasattr(component, "dependency_sources") and component.dependency_sources:
-            data["dependency_sources"] = component.dependency_sources
-
-        if hasattr(component, "frontmatter_extra") and component.frontmatter_extra:
-            data["frontmatter_extra"] = component.frontmatter_extra
-
-        if hasattr(component, "invocation_aliases") and component.invocation_aliases:
-            data["invocation_aliases"] = component.invocation_aliases
-
-        if (
-            hasattr(component, "invocation_arguments")
-            and getattr(component, "invocation_arguments", "")
-        ):
-            data["invocation_arguments"] = component.invocation_arguments
-
-        if (
-            hasattr(component, "invocation_instruction")
-            and getattr(component, "invocation_instruction", "")
-        ):
-            data["invocation_instruction"] = component.invocation_instruction
-
-        if hasattr(component, "references") and component.references:
-            data["references"] = component.references
-
-        if hasattr(component, "context_fork_hint") and component.context_fork_hint:
-            data["context_fork_hint"] = component.context_fork_hint
-
-        if hasattr(component, "when_to_use") and component.when_to_use:
-            data["when_to_use"] = component.when_to_use
-
-        if hasattr(component, "trigger_rules") and component.trigger_rules:
-            data["trigger_rules"] = component.trigger_rules
-
-        if hasattr(component, "detected_tools") and component.detected_tools:
-            data["detected_tools"] = component.detected_tools
-
-        if hasattr(component, "detected_toolkits") and component.detected_toolkits:
-            data["detected_toolkits"] = component.detected_toolkits
-
-        if hasattr(component, "inputs") and component.inputs:
-            data["inputs"] = component.inputs
-
-        if hasattr(component, "outputs") and component.outputs:
-            data["outputs"] = component.outputs
-
-        if hasattr(component, "safety_notes") and component.safety_notes:
-            data["safety_notes"] = component.safety_notes
-
-        if hasattr(component, "capability_tags") and component.capability_tags:
-            data["capability_tags"] = component.capability_tags
-
-        if hasattr(component, "inputs_schema") and component.inputs_schema:
-            data["inputs_schema"] = component.inputs_schema
-
-        if hasattr(component, "outputs_schema") and component.outputs_schema:
-            data["outputs_schema"] = component.outputs_schema
-
-        if hasattr(component, "examples") and component.examples:
-            data["examples"] = component.examples
-
-        if hasattr(component, "prerequisites") and component.prerequisites:
-            data["prerequisites"] = component.prerequisites
-
-        if hasattr(component, "gotchas") and component.gotchas:
-            data["gotchas"] = component.gotchas
-
-        if hasattr(component, "required_env_vars") and component.required_env_vars:
-            data["required_env_vars"] = component.required_env_vars
-
-        if hasattr(component, "trigger_types") and component.trigger_types:
-            data["trigger_types"] = component.trigger_types
-
-        if hasattr(component, "context_behavior") and component.context_behavior:
-            data["context_behavior"] = component.context_behavior
-
-        if hasattr(component, "side_effects") and component.side_effects:
-            data["side_effects"] = component.side_effects
-
-        if hasattr(component, "risk_level") and component.risk_level:
-            data["risk_level"] = component.risk_level
-
-        if hasattr(component, "depends_on_skills") and component.depends_on_skills:
-            data["depends_on_skills"] = component.depends_on_skills
-
-        if hasattr(component, "used_by_skills") and component.used_by_skills:
-            data["used_by_skills"] = component.used_by_skills
-
-        if hasattr(component, "llm_summary") and component.llm_summary:
-            data["llm_summary"] = component.llm_summary
-
-        if hasattr(component, "llm_tags") and component.llm_tags:
-            data["llm_tags"] = component.llm_tags
-
-        if hasattr(component, "marketplace") and component.marketplace:
-            data["marketplace"] = component.marketplace
-
-        if hasattr(component, "author") and component.author:
-            data["author"] = component.author
-
-        if hasattr(component, "homepage") and component.homepage:
-            data["homepage"] = component.homepage
-
-        if hasattr(component, "repository") and component.repository:
-            data["repository"] = component.repository
-
-        if hasattr(component, "license") and component.license:
-            data["license"] = component.license
-
-        if hasattr(component, "provides_commands") and component.provides_commands:
-            data["provides_commands"] = component.provides_commands
-
-        if hasattr(component, "provides_mcps") and component.provides_mcps:
-            data["provides_mcps"] = component.provides_mcps
-
-        if hasattr(component, "trigger") and component.trigger:
-            data["trigger"] = component.trigger
-        if hasattr(component, "trigger_event") and component.trigger_event:
-            data["trigger_event"] = component.trigger_event
-
-        if hasattr(component, "language") and component.language:
-            data["language"] = component.language
-
-        if hasattr(component, "file_size"):
-            data["file_size"] = component.file_size
-
-        if hasattr(component, "is_executable"):
-            data["is_executable"] = component.is_executable
-
-        if hasattr(component, "command") and component.command:
-            data["command"] = component.command
-
-        if hasattr(component, "args") and component.args:
-            data["args"] = component.args
-
-        if hasattr(component, "env_vars") and component.env_vars:
-            data["env_vars"] = component.env_vars
-
-        if hasattr(component, "transport") and component.transport:
-            data["transport"] = component.transport
-
-        if hasattr(component, "source") and component.source:
-            data["source"] = component.source
-
-        if hasattr(component, "source_detail") and component.source_detail:
-            data["source_detail"] = component.source_detail
-
-        if hasattr(component, "git_remote") and component.git_remote:
-            data["git_remote"] = component.git_remote
-
-        if hasattr(component, "config_extra") and component.config_extra:
-            data["config_extra"] = component.config_extra
-
-        if hasattr(component, "shebang") and component.shebang:
-            data["shebang"] = component.shebang
-
-        if hasattr(component, "commands_detail") and component.commands_detail:
-            data["commands_detail"] = component.commands_detail
-
-        if hasattr(component, "mcps_detail") and component.mcps_detail:
-            data["mcps_detail"] = component.mcps_detail
+        always, get_always, conditional, get_conditional = self._field_plan(
+            component
+        )
+        data.update(zip(always, get_always(component)))
+        for (attr, mode), value in zip(conditional, get_conditional(component)):
+            if not value:
+                continue
+            if mode is _JSON:
+                # Parse JSON string to include as nested object
+                try:
+                    data["performance"] = json.loads(value)
+                except (json.JSONDecodeError, TypeError):
+                    data[attr] = value
+            else:
+                data[attr] = value
 
         if component.error_message:
             data["error"] = component.error_message
 
         return data
 
+    @classmethod
+    def _field_plan(cls, component: Any) -> _FieldPlan:
+        """Return the optional fields that apply to a component's class.
+
+        Dataclass plans are computed once per class and cached, so serialization
+        does not re-probe every optional attribute for every component. Each plan
+        carries `attrgetter`s that fetch all of its values in a single call.
+        """
+        component_cls = type(component)
+        plan = cls._field_plans.get(component_cls)
+        if plan is not None:
+            return plan
+
+        if is_dataclass(component_cls):
+            names = {f.name for f in fields(component_cls)}
+            plan = _build_field_plan(
+                entry for entry in _OPTIONAL_FIELDS if entry[0] in names
+            )
+            cls._field_plans[component_cls] = plan
+            return plan
+
+        return _build_field_plan(
+            entry for entry in _OPTIONAL_FIELDS if hasattr(component, entry[0])
+        )
+
     def _to_json(self, data: Dict[str, Any]) -> str:
         """Convert a Python object to a JSON string."""
         if self.pretty:
             return json.dumps(data, indent=2, default=str)
         return json.dumps(data, default=str)
+
+    def _write_json(self, data: Dict[str, Any], output_path: Path):
+        """Encode a Python object and write it to a JSON file.
+
+        The document is encoded fully before the file is opened: one-shot
+        `json.dumps` uses the C encoder (`json.dump` does not), and a failed
+        encode leaves no truncated file behind.
+        """
+        text = self._to_json(data)
+        with open(output_path, "w") as f:
+            f.write(text)
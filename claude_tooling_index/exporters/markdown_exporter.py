@@ -11,6 +11,7 @@ from typing import List
 from ..models import (
     BinaryMetadata,
     CommandMetadata,
+    ComponentMetadata,
     HookMetadata,
     MCPMetadata,
     PluginMetadata,
@@ -19,6 +20,11 @@ from ..models import (
 )
 
 
+def _name_sort_key(component: ComponentMetadata) -> str:
+    """Sort key ordering components case-insensitively by name."""
+    return component.name.lower()
+
+
 class MarkdownExporter:
     """Export scan results and components as Markdown documentation."""
 
@@ -45,7 +51,7 @@ class MarkdownExporter:
 
         # Header
         platforms = (
-            sorted({getattr(c, "platform", "claude") for c in result.all_components})
+            sorted({c.platform for c in result.iter_all()})
             if result.total_count
             else ["claude"]
         )
@@ -165,10 +171,10 @@ class MarkdownExporter:
             "|------|----------|---------|--------|-------|-------|-------------|"
         )
 
-        for skill in sorted(skills, key=lambda s: s.name.lower()):
+        for skill in sorted(skills, key=_name_sort_key):
             version = skill.version or "-"
             status = self._status_badge(skill.status)
-            platform = getattr(skill, "platform", "claude")
+            platform = skill.platform
             desc = (
                 (skill.description[:50] + "...")
                 if len(skill.description) > 50
@@ -191,7 +197,7 @@ class MarkdownExporter:
             lines.append("")
 
         lines.append(f"- **Version:** {skill.version or 'N/A'}")
-        lines.append(f"- **Platform:** {getattr(skill, 'platform', 'claude')}")
+        lines.append(f"- **Platform:** {skill.platform}")
         lines.append(f"- **Status:** {skill.status}")
         lines.append(f"- **Origin:** {skill.origin}")
         lines.append(f"- **Files:** {skill.file_count}")
@@ -223,9 +229,9 @@ class MarkdownExporter:
         lines.append("| Name | Platform | Version | Marketplace | Origin | Status |")
         lines.append("|------|----------|---------|-------------|--------|--------|")
 
-        for plugin in sorted(plugins, key=lambda p: p.name.lower()):
+        for plugin in sorted(plugins, key=_name_sort_key):
             status = self._status_badge(plugin.status)
-            platform = getattr(plugin, "platform", "claude")
+            platform = plugin.platform
             lines.append(
                 f"| {plugin.name} | {platform} | {plugin.version} | {plugin.marketplace} | {plugin.origin} | {status} |"
             )
@@ -238,9 +244,9 @@ class MarkdownExporter:
         lines.append("| Command | Platform | Description | Origin | Status |")
         lines.append("|---------|----------|-------------|--------|--------|")
 
-        for cmd in sorted(commands, key=lambda c: c.name.lower()):
+        for cmd in sorted(commands, key=_name_sort_key):
             status = self._status_badge(cmd.status)
-            platform = getattr(cmd, "platform", "claude")
+            platform = cmd.platform
             desc = (
                 (cmd.description[:60] + "...")
                 if len(cmd.description) > 60
@@ -258,10 +264,10 @@ class MarkdownExporter:
         lines.append("| Name | Platform | Trigger | Language | Size | Status |")
         lines.append("|------|----------|---------|----------|------|--------|")
 
-        for hook in sorted(hooks, key=lambda h: h.name.lower()):
+        for hook in sorted(hooks, key=_name_sort_key):
             status = self._status_badge(hook.status)
             size = self._format_size(hook.file_size)
-            platform = getattr(hook, "platform", "claude")
+            platform = hook.platform
             lines.append(
                 f"| {hook.name} | {platform} | {hook.trigger} | {hook.language} | {size} | {status} |"
             )
@@ -274,10 +280,10 @@ class MarkdownExporter:
         lines.append("| Name | Platform | Command | Transport | Origin | Status |")
         lines.append("|------|----------|---------|-----------|--------|--------|")
 
-        for mcp in sorted(mcps, key=lambda m: m.name.lower()):
+        for mcp in sorted(mcps, key=_name_sort_key):
             status = self._status_badge(mcp.status)
             cmd = mcp.command[:30] + "..." if len(mcp.command) > 30 else mcp.command
-            platform = getattr(mcp, "platform", "claude")
+            platform = mcp.platform
             lines.append(
                 f"| {mcp.name} | {platform} | `{cmd}` | {mcp.transport} | {mcp.origin} | {status} |"
             )
@@ -290,11 +296,11 @@ class MarkdownExporter:
         lines.append("| Name | Platform | Language | Size | Executable | Status |")
         lines.append("|------|----------|----------|------|------------|--------|")
 
-        for binary in sorted(binaries, key=lambda b: b.name.lower()):
+        for binary in sorted(binaries, key=_name_sort_key):
             status = self._status_badge(binary.status)
             size = self._format_size(binary.file_size)
             exec_status = "Yes" if binary.is_executable else "No"
-            platform = getattr(binary, "platform", "claude")
+            platform = binary.platform
             lines.append(
                 f"| {binary.name} | {platform} | {binary.language} | {size} | {exec_status} | {status} |"
             )
@@ -1,11 +1,45 @@
 """Data models for the tooling index."""
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
+def _intern(value: Any) -> Any:
+    """Intern a string so repeated low-cardinality values share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _slotted(cls: type) -> type:
+    """Rebuild a dataclass with `__slots__` (`dataclass(slots=True)` for 3.8+).
+
+    Only fields not already slotted by a base class are added, and methods using
+    zero-argument `super()` are re-pointed at the rebuilt class.
+    """
+    inherited = {name for base in cls.__mro__[1:] for name in getattr(base, "__slots__", ())}
+    field_names = tuple(f.name for f in fields(cls) if f.name not in inherited)
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+
+    for value in cls_dict.values():
+        for cell in getattr(value, "__closure__", None) or ():
+            if cell.cell_contents is cls:
+                cell.cell_contents = new_cls
+    return new_cls
+
+
+@_slotted
 @dataclass
 class ComponentMetadata:
     """Base class for all component types."""
@@ -23,7 +57,17 @@ class ComponentMetadata:
     # Optional error information
     error_message: Optional[str] = None
 
+    def __post_init__(self):
+        # origin/status/platform/type (and the enum-like subclass fields such as
+        # language, trigger and transport) take only a handful of distinct values
+        # across thousands of components; share one string object per value.
+        self.origin = _intern(self.origin)
+        self.status = _intern(self.status)
+        self.platform = _intern(self.platform)
+        self.type = _intern(self.type)
+
 
+@_slotted
 @dataclass
 class SkillMetadata(ComponentMetadata):
     """Metadata for a skill."""
@@ -67,8 +111,12 @@ class SkillMetadata(ComponentMetadata):
 
     def __post_init__(self):
         self.type = "skill"
+        self.context_behavior = _intern(self.context_behavior)
+        self.risk_level = _intern(self.risk_level)
+        super().__post_init__()
 
 
+@_slotted
 @dataclass
 class PluginMetadata(ComponentMetadata):
     """Metadata for a plugin."""
@@ -89,8 +137,11 @@ class PluginMetadata(ComponentMetadata):
 
     def __post_init__(self):
         self.type = "plugin"
+        self.marketplace = _intern(self.marketplace)
+        super().__post_init__()
 
 
+@_slotted
 @dataclass
 class CommandMetadata(ComponentMetadata):
     """Metadata for a command."""
@@ -117,8 +168,12 @@ class CommandMetadata(ComponentMetadata):
 
     def __post_init__(self):
         self.type = "command"
+        self.from_plugin = _intern(self.from_plugin)
+        self.risk_level = _intern(self.risk_level)
+        super().__post_init__()
 
 
+@_slotted
 @dataclass
 class HookMetadata(ComponentMetadata):
     """Metadata for a hook."""
@@ -134,11 +189,18 @@ class HookMetadata(ComponentMetadata):
     required_env_vars: List[str] = field(default_factory=list)
     side_effects: List[str] = field(default_factory=list)
     risk_level: str = ""  # "low" | "medium" | "high"
+    content_truncated: bool = False  # file exceeded the hook scanner's read cap
 
     def __post_init__(self):
         self.type = "hook"
+        self.trigger = _intern(self.trigger)
+        self.trigger_event = _intern(self.trigger_event)
+        self.language = _intern(self.language)
+        self.risk_level = _intern(self.risk_level)
+        super().__post_init__()
 
 
+@_slotted
 @dataclass
 class MCPMetadata(ComponentMetadata):
     """Metadata for an MCP server."""
@@ -154,8 +216,12 @@ class MCPMetadata(ComponentMetadata):
 
     def __post_init__(self):
         self.type = "mcp"
+        self.transport = _intern(self.transport)
+        self.source = _intern(self.source)
+        super().__post_init__()
 
 
+@_slotted
 @dataclass
 class BinaryMetadata(ComponentMetadata):
     """Metadata for a binary."""
@@ -166,8 +232,11 @@ class BinaryMetadata(ComponentMetadata):
 
     def __post_init__(self):
         self.type = "binary"
+        self.language = _intern(self.language)
+        super().__post_init__()
 
 
+@_slotted
 @dataclass
 class ScanResult:
     """Result of scanning all components."""
@@ -185,28 +254,36 @@ class ScanResult:
     @property
     def total_count(self) -> int:
         """Total number of components scanned."""
-        return (
-            len(self.skills)
-            + len(self.plugins)
-            + len(self.commands)
-            + len(self.hooks)
-            + len(self.mcps)
-            + len(self.binaries)
-        )
+        return sum(map(len, self._component_lists()))
 
     @property
     def all_components(self) -> List[ComponentMetadata]:
         """Get all components as a flat list."""
+        return list(chain.from_iterable(self._component_lists()))
+
+    def iter_all(self, *others: "ScanResult") -> Iterator[ComponentMetadata]:
+        """Iterate over every component of this result and `others` lazily.
+
+        Yields components in the same order as `all_components` on the merged
+        result (category by category), without building any intermediate list.
+        """
+        per_result = [result._component_lists() for result in (self,) + others]
+        return chain.from_iterable(
+            components for category in zip(*per_result) for components in category
+        )
+
+    def _component_lists(self) -> Tuple[List[Any], ...]:
         return (
-            self.skills
-            + self.plugins
-            + self.commands
-            + self.hooks
-            + self.mcps
-            + self.binaries
+            self.skills,
+            self.plugins,
+            self.commands,
+            self.hooks,
+            self.mcps,
+            self.binaries,
         )
 
 
+@_slotted
 @dataclass
 class InvocationRecord:
     """Record of a component invocation."""
@@ -223,6 +300,7 @@ class InvocationRecord:
 # =============================================================================
 
 
+@_slotted
 @dataclass
 class SkillUsage:
     """Individual skill usage statistics from `~/.claude.json`."""
@@ -232,6 +310,7 @@ class SkillUsage:
     last_used_at: Optional[datetime] = None
 
 
+@_slotted
 @dataclass
 class ProjectMetric:
     """Per-project productivity and cost metrics from `~/.claude.json`."""
@@ -249,6 +328,7 @@ class ProjectMetric:
     has_trust_accepted: bool = False
 
 
+@_slotted
 @dataclass
 class UserSettingsMetadata:
     """User settings and usage metrics from `~/.claude.json`."""
@@ -277,6 +357,7 @@ class UserSettingsMetadata:
     total_github_repos: int = 0
 
 
+@_slotted
 @dataclass
 class EventMetrics:
     """Event queue analytics from `~/.claude/data/event_queue.jsonl`."""
@@ -291,6 +372,7 @@ class EventMetrics:
     date_range_end: Optional[datetime] = None
 
 
+@_slotted
 @dataclass
 class InsightMetrics:
     """Insights analytics from `~/.claude/data/insights.db`."""
@@ -304,6 +386,7 @@ class InsightMetrics:
     recent_tradeoffs: List[str] = field(default_factory=list)
 
 
+@_slotted
 @dataclass
 class SessionMetrics:
     """Session analytics from `~/.claude/data/sessions/`."""
@@ -315,6 +398,7 @@ class SessionMetrics:
     top_projects: List[tuple] = field(default_factory=list)  # [(project, count), ...]
 
 
+@_slotted
 @dataclass
 class TaskMetrics:
     """Task/todo analytics from `~/.claude/todos/`."""
@@ -326,6 +410,7 @@ class TaskMetrics:
     completion_rate: float = 0.0
 
 
+@_slotted
 @dataclass
 class TranscriptMetrics:
     """Token economics and tool usage from transcript files."""
@@ -340,6 +425,7 @@ class TranscriptMetrics:
     top_tools: List[tuple] = field(default_factory=list)  # [(tool, count), ...]
 
 
+@_slotted
 @dataclass
 class GrowthMetrics:
     """L1-L5 progression metrics from agentic-growth framework."""
@@ -352,6 +438,7 @@ class GrowthMetrics:
     projects_with_edges: int = 0
 
 
+@_slotted
 @dataclass
 class ExtendedScanResult:
     """Extended scan result including Phase 6 metadata."""
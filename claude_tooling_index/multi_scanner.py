@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+import warnings
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional
 
-from .codex_scanner import CodexToolingScanner
+from .codex_scanner import CodexToolingScanner, _detect_codex_home_cached
 from .models import ScanResult
-from .scanner import ToolingScanner
+from .scanner import _SCAN_EXECUTOR, ToolingScanner, _detect_claude_home_cached
+
+_VALID_PLATFORMS = frozenset({"claude", "codex", "all"})
+
+
+def _concat(*lists: Optional[List[Any]]) -> List[Any]:
+    """Concatenate possibly-None lists into one new list."""
+    merged: List[Any] = []
+    for items in lists:
+        if items:
+            merged.extend(items)
+    return merged
 
 
 class MultiToolingScanner:
@@ -28,24 +39,53 @@ class MultiToolingScanner:
         errors: List[str] = []
 
         platform = (platform or "claude").lower()
-        if platform not in {"claude", "codex", "all"}:
+        if platform not in _VALID_PLATFORMS:
             raise ValueError("platform must be one of: claude, codex, all")
 
         if platform == "claude":
-            return self._scan_claude(parallel=parallel)
+            return self._scan_claude(parallel, scan_time)
         if platform == "codex":
-            return self._scan_codex(parallel=parallel)
+            return self._scan_codex(parallel, scan_time)
 
         # platform == "all"
+        scans = [
+            (label, scan)
+            for label, scan in (
+                ("claude", self._scan_claude),
+                ("codex", self._scan_codex),
+            )
+            if self._home_exists(label)
+        ]
+        if len(scans) == 1:
+            skipped = "codex" if scans[0][0] == "claude" else "claude"
+            warnings.warn(
+                f"~/.{skipped} not found; skipping {skipped} scan",
+                stacklevel=2,
+            )
+        elif not scans:
+            # Nothing installed: scan both anyway so the detection errors surface.
+            scans = [("claude", self._scan_claude), ("codex", self._scan_codex)]
+
+        results = {"claude": ScanResult(), "codex": ScanResult()}
         if parallel:
-            with ThreadPoolExecutor(max_workers=2) as executor:
-                claude_future = executor.submit(self._try_scan_claude, errors)
-                codex_future = executor.submit(self._try_scan_codex, errors)
-                claude_result = claude_future.result()
-                codex_result = codex_future.result()
+            futures = [
+                (label, _SCAN_EXECUTOR.submit(scan, True, scan_time))
+                for label, scan in scans
+            ]
+            # Failures are inspected here, so only this thread touches `errors`.
+            for label, future in futures:
+                exc = future.exception()
+                if exc is None:
+                    results[label] = future.result()
+                else:
+                    errors.append(f"[{label}] scan failed: {exc}")
         else:
-            claude_result = self._try_scan_claude(errors)
-            codex_result = self._try_scan_codex(errors)
+            for label, scan in scans:
+                try:
+                    results[label] = scan(False, scan_time)
+                except Exception as e:
+                    errors.append(f"[{label}] scan failed: {e}")
+        claude_result, codex_result = results["claude"], results["codex"]
 
         merged = self._merge_results(claude_result, codex_result)
         merged.scan_time = scan_time
@@ -54,34 +94,42 @@ class MultiToolingScanner:
         )
         return merged
 
-    def _scan_claude(self, parallel: bool) -> ScanResult:
+    def _home_exists(self, label: str) -> bool:
+        explicit = self._claude_home if label == "claude" else self._codex_home
+        if explicit is not None:
+            return explicit.exists()
+
+        # Go through the memoized home detection so the scanner constructed
+        # next reuses this lookup instead of stat'ing the directory again.
+        detect = (
+            _detect_claude_home_cached
+            if label == "claude"
+            else _detect_codex_home_cached
+        )
+        try:
+            detect(Path.home())
+        except ValueError:
+            return False
+        return True
+
+    def _scan_claude(
+        self, parallel: bool, scan_time: Optional[datetime] = None
+    ) -> ScanResult:
         scanner = ToolingScanner(claude_home=self._claude_home)
-        return scanner.scan_all(parallel=parallel)
+        return scanner.scan_all(parallel=parallel, scan_time=scan_time)
 
-    def _scan_codex(self, parallel: bool) -> ScanResult:
+    def _scan_codex(
+        self, parallel: bool, scan_time: Optional[datetime] = None
+    ) -> ScanResult:
         scanner = CodexToolingScanner(codex_home=self._codex_home)
-        return scanner.scan_all(parallel=parallel)
-
-    def _try_scan_claude(self, errors: List[str]) -> ScanResult:
-        try:
-            return self._scan_claude(parallel=True)
-        except Exception as e:
-            errors.append(f"[claude] scan failed: {e}")
-            return ScanResult()
-
-    def _try_scan_codex(self, errors: List[str]) -> ScanResult:
-        try:
-            return self._scan_codex(parallel=True)
-        except Exception as e:
-            errors.append(f"[codex] scan failed: {e}")
-            return ScanResult()
+        return scanner.scan_all(parallel=parallel, scan_time=scan_time)
 
     def _merge_results(self, a: ScanResult, b: ScanResult) -> ScanResult:
         return ScanResult(
-            skills=(a.skills or []) + (b.skills or []),
-            plugins=(a.plugins or []) + (b.plugins or []),
-            commands=(a.commands or []) + (b.commands or []),
-            hooks=(a.hooks or []) + (b.hooks or []),
-            mcps=(a.mcps or []) + (b.mcps or []),
-            binaries=(a.binaries or []) + (b.binaries or []),
+            skills=_concat(a.skills, b.skills),
+            plugins=_concat(a.plugins, b.plugins),
+            commands=_concat(a.commands, b.commands),
+            hooks=_concat(a.hooks, b.hooks),
+            mcps=_concat(a.mcps, b.mcps),
+            binaries=_concat(a.binaries, b.binaries),
         )
@@ -4,11 +4,17 @@ This module coordinates all component scanners for a single Claude home
 directory (typically `~/.claude`).
 """
 
+import asyncio
+import atexit
+import copy
 import os
-from concurrent.futures import ThreadPoolExecutor
+import stat
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 from .models import ExtendedScanResult, ScanResult
 from .scanners import (
@@ -30,12 +36,102 @@ from .scanners import (
     UserSettingsScanner,
 )
 
+__all__ = ["ToolingScanner"]
+
+# `MultiToolingScanner` blocks one worker per platform while its component scans
+# run, so keep enough room for both platforms and at least a couple of leaves.
+_MIN_SCAN_WORKERS = 4
+
+
+def _scan_worker_count() -> int:
+    """Size the shared scan pool, honoring `TOOLING_INDEX_SCAN_WORKERS`."""
+    default = min(32, (os.cpu_count() or 4) + 8)
+    raw_workers = os.environ.get("TOOLING_INDEX_SCAN_WORKERS")
+    if not raw_workers:
+        return default
+    try:
+        return max(_MIN_SCAN_WORKERS, int(raw_workers))
+    except ValueError:
+        return default
+
+
+# Shared by every scan so repeated scans reuse warm threads instead of spinning up
+# a pool per call. Component scanners are leaf tasks that never wait on other
+# futures; only the per-platform tasks of `MultiToolingScanner` block, so the pool
+# is sized well above that to rule out nested-wait deadlocks. Scanners that are
+# CPU-bound in Python (transcript aggregation) fan out to processes internally.
+_SCAN_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_scan_worker_count(),
+    thread_name_prefix="cti-scan",
+)
+atexit.register(_SCAN_EXECUTOR.shutdown)
+
+
+@lru_cache(maxsize=8)
+def _detect_claude_home_cached(home: Path) -> Path:
+    """Resolve and verify `<home>/.claude`, remembering hits per home directory.
+
+    Misses raise and are therefore never cached.
+    """
+    claude_home = home / ".claude"
+
+    if not claude_home.exists():
+        raise ValueError("~/.claude directory not found. Install Claude Code first.")
+
+    return claude_home
+
+
+def _source_stamp(path: Path, depth: int = 0) -> Tuple[str, Optional[int], int]:
+    """Stamp a metric source as `(path, newest mtime_ns, total size)`.
+
+    Directories fold in every entry up to `depth` levels down, i.e. the files
+    their scanner actually reads, so a file that is added, removed or grows in
+    place changes the stamp. Deeper subtrees are not walked.
+    """
+    try:
+        path_stat = os.stat(path)
+    except OSError:
+        return (str(path), None, 0)
+
+    newest = path_stat.st_mtime_ns
+    total_size = path_stat.st_size
+    if not stat.S_ISDIR(path_stat.st_mode):
+        return (str(path), newest, total_size)
+
+    pending = [(os.fspath(path), depth)]
+    while pending:
+        directory, remaining = pending.pop()
+        if remaining <= 0:
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        entry_stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    newest = max(newest, entry_stat.st_mtime_ns)
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append((entry.path, remaining - 1))
+                    else:
+                        total_size += entry_stat.st_size
+        except OSError:
+            continue
+
+    return (str(path), newest, total_size)
+
 
 class ToolingScanner:
     """Scan a Claude home directory and extract component metadata."""
 
+    #: Number of extended-metric snapshots kept by `scan_extended`.
+    metrics_cache_capacity = 8
+
     def __init__(self, claude_home: Optional[Path] = None):
         self.claude_home = claude_home or self._detect_claude_home()
+        self._metrics_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = (
+            OrderedDict()
+        )
 
         # Initialize core component scanners
         self.skills_scanner = SkillScanner(self.claude_home / "skills")
@@ -62,12 +158,15 @@ class ToolingScanner:
         self.transcript_scanner = TranscriptScanner(self.claude_home / "projects")
         self.growth_scanner = GrowthScanner(self.claude_home / "agentic-growth")
 
-    def scan_all(self, parallel: bool = True) -> ScanResult:
+    def scan_all(
+        self, parallel: bool = True, scan_time: Optional[datetime] = None
+    ) -> ScanResult:
         """Scan all core components.
 
         Args:
             parallel: If True, run scanners in parallel (faster).
                 If False, run sequentially (easier debugging).
+            scan_time: Timestamp to record on the result. Defaults to now.
 
         Returns:
             The scan result with all scanned components and any captured errors.
@@ -79,45 +178,68 @@ class ToolingScanner:
         else:
             result = self._scan_sequential(errors)
 
-        result.scan_time = datetime.now()
+        result.scan_time = scan_time or datetime.now()
         result.errors = errors
 
         return result
 
-    def _scan_parallel(self, errors: list) -> ScanResult:
-        """Scan all components in parallel using `ThreadPoolExecutor`."""
-        with ThreadPoolExecutor(max_workers=6) as executor:
-            # Submit all scanner tasks
-            futures = {
-                "skills": executor.submit(
-                    self._safe_scan, self.skills_scanner.scan, "skills", errors
-                ),
-                "plugins": executor.submit(
-                    self._safe_scan, self.plugins_scanner.scan, "plugins", errors
-                ),
-                "commands": executor.submit(
-                    self._safe_scan, self.commands_scanner.scan, "commands", errors
-                ),
-                "hooks": executor.submit(
-                    self._safe_scan, self.hooks_scanner.scan, "hooks", errors
-                ),
-                "mcps": executor.submit(
-                    self._safe_scan, self.mcps_scanner.scan, "mcps", errors
-                ),
-                "binaries": executor.submit(
-                    self._safe_scan, self.binaries_scanner.scan, "binaries", errors
-                ),
-            }
+    async def scan_all_async(self, scan_time: Optional[datetime] = None) -> ScanResult:
+        """Scan all core components without blocking the running event loop.
+
+        The scans are submitted to the shared scan executor just as `scan_all`
+        submits them; this coroutine only awaits their completion.
+
+        Args:
+            scan_time: Timestamp to record on the result. Defaults to now.
+
+        Returns:
+            The scan result with all scanned components and any captured errors.
+        """
+        errors: list = []
+        futures = self._submit_core(errors)
+        await asyncio.gather(*map(asyncio.wrap_future, futures.values()))
 
-            # Collect results
-            return ScanResult(
-                skills=futures["skills"].result(),
-                plugins=futures["plugins"].result(),
-                commands=futures["commands"].result(),
-                hooks=futures["hooks"].result(),
-                mcps=futures["mcps"].result(),
-                binaries=futures["binaries"].result(),
-            )
+        result = self._collect_core(futures)
+        result.scan_time = scan_time or datetime.now()
+        result.errors = errors
+
+        return result
+
+    def _scan_parallel(self, errors: list) -> ScanResult:
+        """Scan all components in parallel on the shared scan executor."""
+        return self._collect_core(self._submit_core(errors))
+
+    def _submit_core(self, errors: list) -> Dict[str, Future]:
+        """Submit every core component scan to the shared scan executor."""
+        submit = _SCAN_EXECUTOR.submit
+        return {
+            "skills": submit(
+                self._safe_scan, self.skills_scanner.scan, "skills", errors
+            ),
+            "plugins": submit(
+                self._safe_scan, self.plugins_scanner.scan, "plugins", errors
+            ),
+            "commands": submit(
+                self._safe_scan, self.commands_scanner.scan, "commands", errors
+            ),
+            "hooks": submit(self._safe_scan, self.hooks_scanner.scan, "hooks", errors),
+            "mcps": submit(self._safe_scan, self.mcps_scanner.scan, "mcps", errors),
+            "binaries": submit(
+                self._safe_scan, self.binaries_scanner.scan, "binaries", errors
+            ),
+        }
+
+    @staticmethod
+    def _collect_core(futures: Dict[str, Future]) -> ScanResult:
+        """Build a `ScanResult` from the futures returned by `_submit_core`."""
+        return ScanResult(
+            skills=futures["skills"].result(),
+            plugins=futures["plugins"].result(),
+            commands=futures["commands"].result(),
+            hooks=futures["hooks"].result(),
+            mcps=futures["mcps"].result(),
+            binaries=futures["binaries"].result(),
+        )
 
     def _scan_sequential(self, errors: list) -> ScanResult:
         """Scan all components sequentially (for debugging)."""
@@ -143,89 +265,132 @@ class ToolingScanner:
         """Scan all core components plus Phase 6 extended metadata.
 
         Args:
-            parallel: If True, run scanners in parallel (faster).
+            parallel: If True, run scanners in parallel (faster). Core and
+                extended metric scanners are submitted together as one batch.
+
+        Extended metrics are cached per scanner and reused while none of the
+        files they are read from change; the core scan always runs.
 
         Returns:
             The extended scan result with core components and Phase 6 metrics.
         """
-        # Get core scan result
-        core_result = self.scan_all(parallel=parallel)
-
-        # Scan extended metadata (these are fast, run sequentially)
-        user_settings = None
-        event_metrics = None
-        insight_metrics = None
-        session_metrics = None
-        task_metrics = None
-        transcript_metrics = None
-        growth_metrics = None
+        cache_key = self._metrics_cache_key()
+        cached_metrics = self._metrics_cache.get(cache_key)
+        if cached_metrics is not None:
+            self._metrics_cache.move_to_end(cache_key)
+            core_result = self.scan_all(parallel=parallel)
+            return ExtendedScanResult(core=core_result, **copy.deepcopy(cached_metrics))
+
+        # ExtendedScanResult field -> (label used in error messages, scan function).
+        # Ordered slowest first (transcripts, session JSONL, SQLite insights) so
+        # they get workers ahead of the quick file reads when the pool is busy.
+        extended_scans = {
+            # T2: Transcript and growth analytics
+            "transcript_metrics": ("transcripts", self._scan_transcripts),
+            # T1: Session and task analytics
+            "session_metrics": ("sessions", self.sessions_scanner.scan),
+            "insight_metrics": ("insights", self.insights_scanner.scan),
+            "event_metrics": ("event queue", self.event_queue_scanner.scan),
+            "growth_metrics": ("growth", self.growth_scanner.scan),
+            "task_metrics": ("todos", self.todos_scanner.scan),
+            "user_settings": ("user settings", self.user_settings_scanner.scan),
+        }
+        metrics = {}
+        errors = []
 
-        try:
-            user_settings = self.user_settings_scanner.scan()
-        except Exception as e:
-            core_result.errors.append(f"Error scanning user settings: {e}")
+        if parallel:
+            # Core and metric scanners go to the pool as one batch, so neither
+            # phase waits on the other; wall time is that of the slowest scanner.
+            futures = {
+                key: _SCAN_EXECUTOR.submit(scan_func)
+                for key, (_, scan_func) in extended_scans.items()
+            }
+            core_errors: list = []
+            core_futures = self._submit_core(core_errors)
 
-        try:
-            event_metrics = self.event_queue_scanner.scan()
-        except Exception as e:
-            core_result.errors.append(f"Error scanning event queue: {e}")
+            core_result = self._collect_core(core_futures)
+            core_result.scan_time = datetime.now()
+            core_result.errors = core_errors
 
-        try:
-            insight_metrics = self.insights_scanner.scan()
-        except Exception as e:
-            core_result.errors.append(f"Error scanning insights: {e}")
+            for key, future in futures.items():
+                try:
+                    metrics[key] = future.result()
+                except Exception as e:
+                    errors.append(f"Error scanning {extended_scans[key][0]}: {e}")
+        else:
+            core_result = self.scan_all(parallel=False)
 
-        # T1: Session and task analytics
-        try:
-            session_metrics = self.sessions_scanner.scan()
-        except Exception as e:
-            core_result.errors.append(f"Error scanning sessions: {e}")
+            for key, (label, scan_func) in extended_scans.items():
+                try:
+                    metrics[key] = scan_func()
+                except Exception as e:
+                    errors.append(f"Error scanning {label}: {e}")
 
-        try:
-            task_metrics = self.todos_scanner.scan()
-        except Exception as e:
-            core_result.errors.append(f"Error scanning todos: {e}")
+        if errors:
+            core_result.errors.extend(errors)
+        else:
+            self._metrics_cache[cache_key] = copy.deepcopy(metrics)
+            while len(self._metrics_cache) > self.metrics_cache_capacity:
+                self._metrics_cache.popitem(last=False)
 
-        # T2: Transcript and growth analytics
-        try:
-            # Default: scan all transcript files for accurate token analytics.
-            # If you have a very large number of transcripts and want faster (sampled)
-            # scans, set `TOOLING_INDEX_TRANSCRIPT_SAMPLE_LIMIT` (e.g. 500).
-            raw_sample_limit = os.environ.get("TOOLING_INDEX_TRANSCRIPT_SAMPLE_LIMIT")
-            sample_limit = 0
-            if raw_sample_limit:
-                try:
-                    sample_limit = max(0, int(raw_sample_limit))
-                except ValueError:
-                    sample_limit = 0
+        return ExtendedScanResult(core=core_result, **metrics)
 
-            transcript_metrics = self.transcript_scanner.scan(sample_limit=sample_limit)
-        except Exception as e:
-            core_result.errors.append(f"Error scanning transcripts: {e}")
+    def invalidate_metrics_cache(self) -> None:
+        """Drop cached extended metrics so the next `scan_extended` rescans."""
+        self._metrics_cache.clear()
 
-        try:
-            growth_metrics = self.growth_scanner.scan()
-        except Exception as e:
-            core_result.errors.append(f"Error scanning growth: {e}")
-
-        return ExtendedScanResult(
-            core=core_result,
-            user_settings=user_settings,
-            event_metrics=event_metrics,
-            insight_metrics=insight_metrics,
-            session_metrics=session_metrics,
-            task_metrics=task_metrics,
-            transcript_metrics=transcript_metrics,
-            growth_metrics=growth_metrics,
+    def close(self) -> None:
+        """Release resources held by the scanners (the insights search connection)."""
+        self.insights_scanner.close()
+
+    def _metrics_cache_key(self) -> Tuple[Any, ...]:
+        """Stamp every file read by the extended metric scanners.
+
+        Directories are walked only as deep as their scanner reads files, e.g.
+        `projects/<project>/*.jsonl` but not the session subtrees beside them.
+        """
+        insights_db = self.insights_scanner.insights_db_path
+        sources = (
+            (self.user_settings_scanner.claude_json_path, 0),
+            (self.event_queue_scanner.event_queue_path, 0),
+            (insights_db, 0),
+            (insights_db.with_name(insights_db.name + "-wal"), 0),
+            (self.sessions_scanner.sessions_dir, 1),
+            (self.todos_scanner.todos_dir, 1),
+            (self.transcript_scanner.projects_dir, 2),
+            # agentic-growth/{edges,patterns}/<category>/*.md
+            (self.growth_scanner.growth_dir, 3),
+        )
+        return (self._transcript_sample_limit(),) + tuple(
+            _source_stamp(path, depth) for path, depth in sources
         )
 
+    def _scan_transcripts(self):
+        """Scan transcripts, honoring `TOOLING_INDEX_TRANSCRIPT_SAMPLE_LIMIT`."""
+        return self.transcript_scanner.scan(
+            sample_limit=self._transcript_sample_limit()
+        )
+
+    @staticmethod
+    def _transcript_sample_limit() -> int:
+        # Default: scan all transcript files for accurate token analytics.
+        # If you have a very large number of transcripts and want faster (sampled)
+        # scans, set `TOOLING_INDEX_TRANSCRIPT_SAMPLE_LIMIT` (e.g. 500).
+        raw_sample_limit = os.environ.get("TOOLING_INDEX_TRANSCRIPT_SAMPLE_LIMIT")
+        sample_limit = 0
+        if raw_sample_limit:
+            try:
+                sample_limit = max(0, int(raw_sample_limit))
+            except ValueError:
+                sample_limit = 0
+
+        return sample_limit
+
     def _detect_claude_home(self) -> Path:
         """Auto-detect the Claude home directory (`~/.claude`)."""
-        claude_home = Path.home() / ".claude"
-
-        if not claude_home.exists():
-            raise ValueError(
-                "~/.claude directory not found. Install Claude Code first."
-            )
+        return _detect_claude_home_cached(Path.home())
 
-        return claude_home
+    @staticmethod
+    def invalidate_home_cache() -> None:
+        """Forget previously detected Claude home directories."""
+        _detect_claude_home_cached.cache_clear()
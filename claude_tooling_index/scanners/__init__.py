@@ -1,41 +1,77 @@
-"""Scanner modules for different component types."""
+"""Scanner modules for different component types.
 
-from .binaries import BinaryScanner
-from .commands import CommandScanner
-from .event_queue import EventQueueScanner
-from .growth import GrowthScanner
-from .hooks import HookScanner
-from .insights import InsightsScanner
-from .mcps import MCPScanner
-from .plugins import PluginScanner
+Scanner classes are imported lazily on first attribute access, so importing a
+single scanner module (e.g. the Codex orchestrator's `codex_mcps`) does not pull
+in every other scanner and its dependencies.
+"""
 
-# Phase 6 T1: Session and task analytics
-from .sessions import SessionAnalyticsScanner
-from .skills import SkillScanner
-from .todos import TodoScanner
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-# Phase 6 T2: Transcript and growth analytics
-from .transcripts import TranscriptScanner
+if TYPE_CHECKING:  # pragma: no cover
+    from .binaries import BinaryScanner
+    from .commands import CommandScanner
+    from .event_queue import EventQueueScanner
+    from .growth import GrowthScanner
+    from .hooks import HookScanner
+    from .insights import InsightsScanner
+    from .mcps import MCPScanner
+    from .plugins import PluginScanner
+    from .sessions import SessionAnalyticsScanner
+    from .skills import SkillScanner
+    from .todos import TodoScanner
+    from .transcripts import TranscriptScanner
+    from .user_settings import UserSettingsScanner
 
-# Phase 6: Extended metadata scanners
-from .user_settings import UserSettingsScanner
+# Exported scanner class -> defining submodule
+_SCANNER_MODULES = {
+    # Core component scanners
+    "SkillScanner": "skills",
+    "PluginScanner": "plugins",
+    "CommandScanner": "commands",
+    "HookScanner": "hooks",
+    "MCPScanner": "mcps",
+    "BinaryScanner": "binaries",
+    # Phase 6 extended scanners (T0)
+    "UserSettingsScanner": "user_settings",
+    "EventQueueScanner": "event_queue",
+    "InsightsScanner": "insights",
+    # Phase 6 extended scanners (T1)
+    "SessionAnalyticsScanner": "sessions",
+    "TodoScanner": "todos",
+    # Phase 6 extended scanners (T2)
+    "TranscriptScanner": "transcripts",
+    "GrowthScanner": "growth",
+}
 
 __all__ = [
-    # Core component scanners
     "SkillScanner",
     "PluginScanner",
     "CommandScanner",
     "HookScanner",
     "MCPScanner",
     "BinaryScanner",
-    # Phase 6 extended scanners (T0)
     "UserSettingsScanner",
     "EventQueueScanner",
     "InsightsScanner",
-    # Phase 6 extended scanners (T1)
     "SessionAnalyticsScanner",
     "TodoScanner",
-    # Phase 6 extended scanners (T2)
     "TranscriptScanner",
     "GrowthScanner",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the scanner class `name` from its submodule on first use."""
+    module_name = _SCANNER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,14 @@
+"""JSON decoding shared by the scanners.
+
+Uses `orjson` when it is installed (`pip install claude-tooling-index[fast]`)
+and the standard library otherwise. Both accept `str` or UTF-8 `bytes`, and
+`orjson.JSONDecodeError` subclasses `json.JSONDecodeError`, so callers keep
+catching the stdlib exception.
+"""
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+__all__ = ["loads"]
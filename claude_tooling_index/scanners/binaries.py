@@ -1,12 +1,51 @@
 """Binary scanner - extracts metadata from the bin/ directory."""
 
 import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from ..models import BinaryMetadata
 
+_EXECUTE_BITS = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+
+# Enough to hold any realistic shebang line along with the 4-byte magic.
+_SNIFF_BYTES = 256
+_COMPILED_MAGIC = frozenset(
+    {
+        b"\x7fELF",
+        b"\xfe\xed\xfa\xce",
+        b"\xfe\xed\xfa\xcf",
+        b"\xcf\xfa\xed\xfe",
+        b"\xce\xfa\xed\xfe",
+    }
+)
+
+_EXT_LANGUAGES = {
+    ".py": "python",
+    ".sh": "bash",
+    ".bash": "bash",
+    ".js": "javascript",
+    ".rb": "ruby",
+    ".pl": "perl",
+}
+
+# Checked in order against the raw shebang line; the first hit wins, so
+# python outranks a stray "sh" and b"sh" also covers bash, zsh, etc.
+_SHEBANG_LANGUAGES = (
+    (b"python", "python"),
+    (b"sh", "bash"),
+    (b"node", "javascript"),
+    (b"ruby", "ruby"),
+    (b"perl", "perl"),
+)
+
+# Small bin dirs are cheaper to sniff serially than to spin up a pool for.
+_PARALLEL_MIN_FILES = 16
+_MAX_WORKERS = 8
+
 
 class BinaryScanner:
     """Scan `~/.claude/bin/` for binary files."""
@@ -16,67 +55,69 @@ class BinaryScanner:
 
     def scan(self) -> List[BinaryMetadata]:
         """Scan all binaries in the bin directory."""
-        binaries = []
-
-        if not self.bin_dir.exists():
-            return binaries
-
-        for location in [self.bin_dir, self.bin_dir / ".disabled"]:
-            if not location.exists():
+        # Gather (entry, is_disabled) pairs from both locations first so a single
+        # pass (and a single pool) covers bin/ and bin/.disabled together.
+        entries: List[Tuple[os.DirEntry, bool]] = []
+        for location, is_disabled in (
+            (self.bin_dir, False),
+            (self.bin_dir / ".disabled", True),
+        ):
+            try:
+                with os.scandir(location) as it:
+                    # Skip hidden files; DirEntry answers is_file() from readdir
+                    # data without an extra stat for regular files.
+                    entries.extend(
+                        (entry, is_disabled)
+                        for entry in it
+                        if not entry.name.startswith(".") and entry.is_file()
+                    )
+            except FileNotFoundError:
                 continue
 
-            is_disabled = location.name == ".disabled"
-
-            for binary_file in location.iterdir():
-                if not binary_file.is_file():
-                    continue
-
-                # Skip hidden files
-                if binary_file.name.startswith("."):
-                    continue
-
-                try:
-                    binary = self._scan_binary(binary_file)
-                    if binary:
-                        if is_disabled:
-                            binary.status = "disabled"
-                        binaries.append(binary)
-                except Exception as e:
-                    # Track error but continue
-                    error_binary = BinaryMetadata(
-                        name=binary_file.name,
-                        origin="unknown",
-                        status="error",
-                        last_modified=datetime.now(),
-                        install_path=binary_file,
-                        error_message=str(e),
-                    )
-                    binaries.append(error_binary)
+        if len(entries) >= _PARALLEL_MIN_FILES:
+            # Language sniffing opens and reads every file; overlap the reads.
+            with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+                return list(executor.map(self._scan_entry, *zip(*entries)))
 
-        return binaries
+        return [self._scan_entry(entry, is_disabled) for entry, is_disabled in entries]
 
-    def _scan_binary(self, binary_file: Path) -> BinaryMetadata:
+    def _scan_entry(self, entry: os.DirEntry, is_disabled: bool) -> BinaryMetadata:
+        """Scan one bin entry, turning failures into an error record."""
+        try:
+            binary = self._scan_binary(entry)
+            if is_disabled:
+                binary.status = "disabled"
+            return binary
+        except Exception as e:
+            # Track error but continue
+            return BinaryMetadata(
+                name=entry.name,
+                origin="unknown",
+                status="error",
+                last_modified=datetime.now(),
+                install_path=Path(entry.path),
+                error_message=str(e),
+            )
+
+    def _scan_binary(self, entry: os.DirEntry) -> BinaryMetadata:
         """Scan a single binary file."""
-        name = binary_file.name
+        binary_file = Path(entry.path)
 
         # Detect language
         language = self._detect_language(binary_file)
 
-        # Get file size
-        file_size = binary_file.stat().st_size
-
-        # Check if executable
-        is_executable = os.access(binary_file, os.X_OK)
-
-        # Get last modified time
-        last_modified = datetime.fromtimestamp(binary_file.stat().st_mtime)
+        # One (cached) stat serves size, mtime and the executable bits
+        st = entry.stat()
+        file_size = st.st_size
+        is_executable = bool(st.st_mode & _EXECUTE_BITS)
+        last_modified = datetime.fromtimestamp(st.st_mtime)
 
         # Binaries in ~/.claude/bin/ are typically in-house
         origin = "in-house"
         status = "active" if is_executable else "error"
 
         return BinaryMetadata(
-            name=name,
+            name=entry.name,
             origin=origin,
             status=status,
             last_modified=last_modified,
@@ -89,53 +130,28 @@ class BinaryScanner:
     def _detect_language(self, file_path: Path) -> str:
         """Detect programming language from extension or shebang."""
         # Check extension first
-        ext = file_path.suffix
-        if ext == ".py":
-            return "python"
-        elif ext == ".sh" or ext == ".bash":
-            return "bash"
-        elif ext == ".js":
-            return "javascript"
-        elif ext == ".rb":
-            return "ruby"
-        elif ext == ".pl":
-            return "perl"
-
-        # Check shebang for extensionless files
+        language = _EXT_LANGUAGES.get(file_path.suffix)
+        if language:
+            return language
+
+        # Check magic numbers and shebang for extensionless files. A single
+        # unbuffered read covers both, so sniffing costs one read() syscall.
         try:
-            with open(file_path, "rb") as f:
-                first_bytes = f.read(4)
-
-                # Check for ELF magic number (compiled binary)
-                if first_bytes == b"\x7fELF":
-                    return "compiled"
-
-                # Check for Mach-O magic number (macOS binary)
-                if first_bytes in [
-                    b"\xfe\xed\xfa\xce",
-                    b"\xfe\xed\xfa\xcf",
-                    b"\xcf\xfa\xed\xfe",
-                    b"\xce\xfa\xed\xfe",
-                ]:
-                    return "compiled"
-
-                # Try to read as text for shebang
-                f.seek(0)
-                first_line = f.readline().decode("utf-8", errors="ignore")
-
-                if first_line.startswith("#!"):
-                    if "python" in first_line:
-                        return "python"
-                    elif "bash" in first_line or "sh" in first_line:
-                        return "bash"
-                    elif "node" in first_line:
-                        return "javascript"
-                    elif "ruby" in first_line:
-                        return "ruby"
-                    elif "perl" in first_line:
-                        return "perl"
-
-        except (OSError, UnicodeDecodeError):
-            pass
+            with open(file_path, "rb", buffering=0) as f:
+                head = f.read(_SNIFF_BYTES)
+        except OSError:
+            return "unknown"
+
+        # Check for ELF magic number (compiled binary)
+        # or Mach-O magic number (macOS binary)
+        if head[:4] in _COMPILED_MAGIC:
+            return "compiled"
+
+        # Try to read as text for shebang
+        if head.startswith(b"#!"):
+            first_line = head.split(b"\n", 1)[0]
+            for needle, language in _SHEBANG_LANGUAGES:
+                if needle in first_line:
+                    return language
 
         return "unknown"
@@ -2,13 +2,34 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import copy
+import os
+import re
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..models import MCPMetadata
 
+try:
+    import tomllib  # py311+
+except ModuleNotFoundError:  # pragma: no cover
+    import tomli as tomllib  # type: ignore
+
+try:  # Optional Rust-backed parser (`pip install claude-tooling-index[fast]`)
+    import rtoml
+except ImportError:
+    rtoml = None  # type: ignore
+
+
+# Server keys mapped onto MCPMetadata fields; everything else lands in config_extra.
+_KNOWN_SERVER_KEYS = frozenset({"command", "args", "env"})
+
+# Long runs of alphanumerics (\w also admits "_") and base64 punctuation look
+# like secrets; matched in C instead of a per-character Python loop.
+_TOKEN_RE = re.compile(r"[\w+/=-]{32,}")
+
 
 def _redact_config_extra(value: object, *, key: str = "") -> object:
     key_lower = str(key or "").lower()
@@ -37,7 +58,7 @@ def _redact_config_extra(value: object, *, key: str = "") -> object:
             return value
         # High-entropy token heuristic
         compact = value.strip()
-        if len(compact) >= 32 and all(ch.isalnum() or ch in "+/=_-" for ch in compact):
+        if len(compact) >= 32 and _TOKEN_RE.fullmatch(compact):
             return "<redacted>"
         return value
     if isinstance(value, list):
@@ -48,15 +69,19 @@ def _redact_config_extra(value: object, *, key: str = "") -> object:
 
 
 def _load_toml(path: Path) -> Dict[str, Any]:
-    try:
-        import tomllib  # py311+
-    except ModuleNotFoundError:  # pragma: no cover
-        import tomli as tomllib  # type: ignore
+    if rtoml is not None:  # pragma: no cover
+        return rtoml.load(path)
 
+    # tomllib parses from a decoded str, so one buffered read is already the
+    # cheapest path; an mmap would still need a full copy to decode.
     with open(path, "rb") as f:
         return tomllib.load(f)
 
 
+# (path, platform, origin, redact_env, mtime_ns, size, home) of a built MCP list.
+_CacheStamp = Tuple[str, str, str, bool, int, int, str]
+
+
 def _pretty_path(path: Path) -> str:
     """Render a path relative to the current user's home for display."""
     try:
@@ -101,6 +126,10 @@ class CodexMCPScanner:
     platform: str = "codex"
     origin: str = "in-house"
     redact_env: bool = True
+    # The last built (already redacted) MCP list and the stamp it was built for.
+    _cache: Optional[Tuple[_CacheStamp, List[MCPMetadata]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def scan(self) -> List[MCPMetadata]:
         """Scan Codex MCP definitions from a `config.toml` file.
@@ -108,10 +137,32 @@ class CodexMCPScanner:
         Returns:
             A list of MCP metadata objects.
         """
-        mcps: List[MCPMetadata] = []
+        try:
+            st = self.config_toml_path.stat()
+        except OSError:
+            return []
+
+        # Parsing and redaction are skipped entirely while config.toml and the
+        # scanner's settings are unchanged; callers always get fresh copies.
+        stamp = (
+            str(self.config_toml_path),
+            self.platform,
+            self.origin,
+            self.redact_env,
+            st.st_mtime_ns,
+            st.st_size,
+            str(Path.home()),
+        )
+        if self._cache is not None and self._cache[0] == stamp:
+            return copy.deepcopy(self._cache[1])
 
-        if not self.config_toml_path.exists():
-            return mcps
+        mcps = self._build(st)
+        self._cache = (stamp, copy.deepcopy(mcps))
+        return mcps
+
+    def _build(self, st: os.stat_result) -> List[MCPMetadata]:
+        """Parse config.toml and build redacted MCP metadata."""
+        mcps: List[MCPMetadata] = []
 
         data = _load_toml(self.config_toml_path)
         enabled_servers = data.get("mcp_servers") or {}
@@ -121,13 +172,18 @@ class CodexMCPScanner:
         ):
             return mcps
 
-        last_modified = datetime.fromtimestamp(self.config_toml_path.stat().st_mtime)
+        # Everything that is identical for all servers in the file is computed
+        # once rather than per server.
+        last_modified = datetime.fromtimestamp(st.st_mtime)
         install_path = self.config_toml_path
+        source = str(install_path.name)
+        pretty_path = _pretty_path(install_path)
+        git_remote = _find_git_remote(install_path) or None
 
-        for status, mcp_servers in [
-            ("active", enabled_servers),
-            ("disabled", disabled_servers),
-        ]:
+        for status, table, mcp_servers in (
+            ("active", "mcp_servers", enabled_servers),
+            ("disabled", "mcp_servers_disabled", disabled_servers),
+        ):
             for name, cfg in mcp_servers.items():
                 if not isinstance(cfg, dict):
                     continue
@@ -135,11 +191,10 @@ class CodexMCPScanner:
                 command = cfg.get("command") or ""
                 args = cfg.get("args") or []
                 env = cfg.get("env") or {}
-                known_keys = {"command", "args", "env"}
                 config_extra = {
                     str(k): _redact_config_extra(v, key=str(k))
                     for k, v in cfg.items()
-                    if str(k) not in known_keys
+                    if str(k) not in _KNOWN_SERVER_KEYS
                 }
 
                 if not isinstance(args, list):
@@ -166,12 +221,9 @@ class CodexMCPScanner:
                         args=args,
                         env_vars=env_vars,
                         transport="stdio",
-                        source=str(self.config_toml_path.name),
-                        source_detail=(
-                            f"{_pretty_path(self.config_toml_path)}:"
-                            f"[{'mcp_servers' if status == 'active' else 'mcp_servers_disabled'}.{name}]"
-                        ),
-                        git_remote=_find_git_remote(install_path) or None,
+                        source=source,
+                        source_detail=f"{pretty_path}:[{table}.{name}]",
+                        git_remote=git_remote,
                         config_extra=config_extra,
                     )
                 )
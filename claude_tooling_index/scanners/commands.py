@@ -1,14 +1,187 @@
 """Command scanner - extracts metadata from command `.md` files."""
 
-import json
+import copy
+import multiprocessing
+import os
 import re
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
+from yaml.nodes import ScalarNode
+from yaml.reader import Reader
+from yaml.resolver import Resolver
 
 from ..models import CommandMetadata
+from . import _json
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+# Below this many command files, spawning worker processes costs more than it saves.
+_PARALLEL_MIN_FILES = 512
+_MAX_WORKERS = 8
+
+# Patterns applied line by line; compiled once rather than per line.
+_HEADING_RE = re.compile(r"^(#{2,3})\s+(.+?)\s*$")
+_BULLET_RE = re.compile(r"^\s*[-*]\s+(.+)$")
+_ARGUMENTS_RE = re.compile(r"(?i)^\s*arguments?\s*:\s*(.+)$")
+_POSITIONAL_REF_RE = re.compile(r"@\$\d+\b")
+_EXPORT_RE = re.compile(r"^\s*export\s+([A-Z0-9_]+)\s*=")
+# The install commands are mutually exclusive by prefix, so one alternation
+# gives the same hits as trying each pattern in turn.
+_INSTALL_COMMAND_RE = re.compile(
+    r"^\s*(pip3?\s+install\s+.+"
+    r"|brew\s+install\s+.+"
+    r"|npm\s+(?:i|install)\s+.+"
+    r"|pnpm\s+add\s+.+"
+    r"|yarn\s+add\s+.+)$"
+)
+# Every install command names one of these tools ("npm" also covers pnpm).
+_INSTALL_TOOLS = ("pip", "brew", "npm", "yarn")
+
+# Normalized section heading -> the io/safety field it fills.
+_IO_SECTION_BUCKETS = {
+    "inputs": "inputs",
+    "input": "inputs",
+    "parameters": "inputs",
+    "outputs": "outputs",
+    "output": "outputs",
+    "returns": "outputs",
+    "safety": "safety",
+    "security": "safety",
+    "privacy": "safety",
+    "redaction": "safety",
+}
+_GOTCHA_HEADING_MARKERS = ("pitfall", "known issue", "limitation", "gotcha")
+
+# Patterns applied to a whole document.
+_ALIAS_RE = re.compile(r"/[A-Za-z0-9_-]+")
+_AT_REF_RE = re.compile(r"@([A-Za-z0-9_./$-]+)")
+_FILE_EXT_RE = re.compile(r"\.(md|txt|json|toml|ya?ml|py|sh)\b")
+_SKILL_REF_RE = re.compile(r"\$([A-Za-z][A-Za-z0-9_-]+)")
+_HEADING_NOISE_RE = re.compile(r"[^a-z0-9 ]+")
+_MCP_TOOL_RE = re.compile(r"\bmcp__([a-z0-9_-]+)__([a-z0-9_-]+)\b", re.I)
+_COMPOSIO_RE = re.compile(r"run_composio_tool\(\s*['\"]([A-Z0-9_]+)['\"]")
+_ENV_BRACE_RE = re.compile(r"\$\{([A-Z0-9_]+)\}")
+# Database and destructive-operation keywords, found in one scan of the document.
+_KEYWORD_RE = re.compile(
+    r"\b(?:(?P<database>sql|postgres|sqlite|database)"
+    r"|(?P<destructive>delete|drop|truncate|reset|destroy))\b",
+    re.I,
+)
+
+_JSON_SCALARS = (str, int, float, bool)
+# Frontmatter keys with a dedicated CommandMetadata field.
+_STANDARD_FRONTMATTER_KEYS = frozenset({"description"})
+
+# Capability tags implied by a detected toolkit or composio tool-slug prefix.
+_TOOLKIT_TAGS = {
+    "gmail": "email",
+    "google-calendar": "calendar",
+    "googlecalendar": "calendar",
+    "slack": "slack",
+    "github": "github",
+    "neon": "database",
+}
+_COMPOSIO_PREFIX_TAGS = {"gmail": "email", "slack": "slack", "github": "github"}
+# Side effects implied by a detected toolkit, in reporting order.
+_TOOLKIT_SIDE_EFFECTS = (
+    ("gmail", "email"),
+    ("slack", "slack"),
+    ("github", "github"),
+    ("neon", "database"),
+)
+
+# `key: plain value` frontmatter lines that can be read without a YAML parser.
+_SIMPLE_FRONTMATTER_RE = re.compile(r"([A-Za-z_][\w-]*):[ ]+(\S.*)")
+# Characters that give a leading position special meaning in YAML.
+_YAML_INDICATORS = frozenset("-?:,[]{}#&*!|>'\"%@`")
+_YAML_STR_TAG = "tag:yaml.org,2002:str"
+_YAML_RESOLVER = Resolver()
+
+
+def _resolves_to_str(scalar: str) -> bool:
+    """Return whether YAML would load the plain scalar `scalar` as a string."""
+    return _YAML_RESOLVER.resolve(ScalarNode, scalar, (True, False)) == _YAML_STR_TAG
+
+
+def _scan_keywords(content: str) -> Tuple[bool, bool]:
+    """Return whether `content` mentions a database and a destructive operation."""
+    database = destructive = False
+    for m in _KEYWORD_RE.finditer(content):
+        if m.lastgroup == "database":
+            database = True
+        else:
+            destructive = True
+        if database and destructive:
+            break
+    return database, destructive
+
+
+def _parse_simple_frontmatter(block: str) -> Optional[Dict[str, str]]:
+    """Parse frontmatter made only of `key: plain string` lines.
+
+    Returns None whenever YAML could read the block differently (other scalar
+    types, quoting, flow/block collections, comments, continuations, ...), in
+    which case the caller falls back to the YAML loader.
+    """
+    if "\r" in block or "\t" in block or Reader.NON_PRINTABLE.search(block):
+        return None
+
+    data: Dict[str, str] = {}
+    for line in block.split("\n"):
+        if not line.strip():
+            continue
+        m = _SIMPLE_FRONTMATTER_RE.fullmatch(line)
+        if not m:
+            return None
+        key, value = m.group(1), m.group(2).rstrip(" ")
+        if (
+            value[0] in _YAML_INDICATORS
+            or value.endswith(":")
+            or ": " in value
+            or " #" in value
+            or not _resolves_to_str(key)
+            or not _resolves_to_str(value)
+        ):
+            return None
+        data[key] = value
+    return data
+
+
+def _frontmatter_block(content: str) -> Optional[str]:
+    r"""Return the text between the leading `---` fence lines, if any.
+
+    Plain string scanning equivalent to matching `^---\s*\n(.*?)\n---\s*\n`
+    (DOTALL): only the frontmatter prefix is examined, not the whole file.
+    """
+    if not content.startswith("---"):
+        return None
+
+    opener_end = content.find("\n", 3)
+    if opener_end == -1 or content[3:opener_end].strip():
+        return None
+
+    body_start = opener_end + 1
+    search_from = body_start
+    while True:
+        fence = content.find("\n---", search_from)
+        if fence == -1:
+            return None
+        fence_end = content.find("\n", fence + 4)
+        if fence_end == -1:
+            return None
+        if not content[fence + 4 : fence_end].strip():
+            return content[body_start:fence]
+        search_from = fence + 1
 
 
 class CommandScanner:
@@ -16,6 +189,9 @@ class CommandScanner:
 
     def __init__(self, commands_dir: Path):
         self.commands_dir = commands_dir
+        # Scanned commands keyed by file path and stamped with (mtime_ns, size);
+        # files unchanged since the previous scan get a copy of its record.
+        self._cache: Dict[str, Tuple[Tuple[int, int], CommandMetadata]] = {}
 
     def scan(self) -> List[CommandMetadata]:
         """Scan all commands in the commands directory."""
@@ -26,58 +202,131 @@ class CommandScanner:
 
         commands.extend(self._scan_plugin_commands())
 
+        files: List[Tuple[Path, bool]] = []
         for location in [self.commands_dir, self.commands_dir / ".disabled"]:
             if not location.exists():
                 continue
 
             is_disabled = location.name == ".disabled"
+            files.extend((command_file, is_disabled) for command_file in location.glob("*.md"))
 
-            for command_file in location.glob("*.md"):
-                try:
-                    command = self._scan_command(command_file)
-                    if command:
-                        if is_disabled:
-                            command.status = "disabled"
-                        commands.append(command)
-                except Exception as e:
-                    # Track error but continue
-                    error_command = CommandMetadata(
-                        name=command_file.stem,
-                        origin="unknown",
-                        status="error",
-                        last_modified=datetime.now(),
-                        install_path=command_file,
-                        error_message=str(e),
-                    )
-                    commands.append(error_command)
-
+        commands.extend(self._scan_files(files))
         return commands
 
+    def _scan_files(self, files: List[Tuple[Path, bool]]) -> List[CommandMetadata]:
+        """Scan command files in order, reusing results for unchanged files.
+
+        Only files seen in this scan stay cached, and callers always get their
+        own copies, so mutating a result never leaks into a later scan.
+        """
+        cache: Dict[str, Tuple[Tuple[int, int], CommandMetadata]] = {}
+        results: List[Optional[CommandMetadata]] = []
+        stamps: List[Optional[Tuple[int, int]]] = []
+        stale: List[int] = []
+        for i, (path, _) in enumerate(files):
+            key = str(path)
+            try:
+                st = os.stat(path)
+                stamp: Optional[Tuple[int, int]] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                stamp = None
+            cached = self._cache.get(key)
+            if stamp is not None and cached is not None and cached[0] == stamp:
+                cache[key] = cached
+                results.append(copy.deepcopy(cached[1]))
+            else:
+                results.append(None)
+                stale.append(i)
+            stamps.append(stamp)
+
+        if stale:
+            scanned = self._scan_uncached([files[i] for i in stale])
+            for i, command in zip(stale, scanned):
+                results[i] = command
+                # Error records carry the scan time, so always rebuild them.
+                stamp = stamps[i]
+                if stamp is not None and command.status != "error":
+                    cache[str(files[i][0])] = (stamp, copy.deepcopy(command))
+        self._cache = cache
+        return results
+
+    def _scan_uncached(self, files: List[Tuple[Path, bool]]) -> List[CommandMetadata]:
+        """Scan command files in order, across processes when there are many."""
+        workers = min(os.cpu_count() or 1, _MAX_WORKERS)
+        if len(files) < _PARALLEL_MIN_FILES or workers < 2:
+            return [self._scan_file(path, is_disabled) for path, is_disabled in files]
+
+        # Parsing is CPU-bound Python, so threads would serialize on the GIL.
+        # A GIL-releasing regex engine would not change that: most of the time
+        # goes to YAML, line splitting and list building around the matches.
+        # Contiguous batches keep the results in file order.
+        size = -(-len(files) // workers)
+        batches = [files[i : i + size] for i in range(0, len(files), size)]
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                return list(chain.from_iterable(executor.map(_scan_command_batch, batches)))
+        except (OSError, BrokenProcessPool):
+            # Process pools can be unavailable (sandboxes, frozen apps).
+            return [self._scan_file(path, is_disabled) for path, is_disabled in files]
+
+    def _scan_file(self, command_file: Path, is_disabled: bool) -> CommandMetadata:
+        """Scan one command file, turning failures into an error record."""
+        try:
+            command = self._scan_command(command_file)
+            if is_disabled:
+                command.status = "disabled"
+            return command
+        except Exception as e:
+            # Track error but continue
+            return CommandMetadata(
+                name=command_file.stem,
+                origin="unknown",
+                status="error",
+                last_modified=datetime.now(),
+                install_path=command_file,
+                error_message=str(e),
+            )
+
     def _scan_command(self, command_file: Path) -> CommandMetadata:
         """Scan a single command file."""
-        content = command_file.read_text()
+        # The body feeds every extractor below, so the whole file is needed;
+        # take the mtime from the open descriptor rather than a second stat.
+        with command_file.open("rb") as fh:
+            raw = fh.read()
+            mtime = os.fstat(fh.fileno()).st_mtime
+        # Decode in one call instead of through a text-mode wrapper, translating
+        # newlines as text mode would so the line-based extractors see "\n".
+        content = raw.decode("utf-8")
+        if b"\r" in raw:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
         frontmatter = self._extract_frontmatter(content)
 
         name = command_file.stem  # filename without .md
         description = frontmatter.get("description", "")
         frontmatter_extra = self._extract_frontmatter_extra(frontmatter)
-        invocation = self._extract_invocation_hints(content, default_name=name)
+        # Split once; the line-oriented helpers below all share this list.
+        lines = content.splitlines()
+        invocation = self._extract_invocation_hints(lines, default_name=name)
         references = self._extract_references(content)
-        detected_tools, detected_toolkits = self._extract_tool_usage(content)
-        io_safety = self._extract_inputs_outputs_safety(content)
-        required_env_vars = self._extract_required_env_vars(content)
-        prerequisites = self._extract_prerequisites(content)
-        gotchas = self._extract_gotchas(content)
-        examples = self._extract_examples(content)
+        # One walk over the lines yields the sections and code blocks that the
+        # extractors below would otherwise each re-derive from the content.
+        sections, code_blocks, block_spans = self._parse_markdown(lines)
+        detected_tools, detected_toolkits = self._extract_tool_usage(
+            content, block_spans=block_spans
+        )
+        section_meta = self._extract_section_metadata(sections, code_blocks)
+        required_env_vars = self._extract_required_env_vars(content, lines)
+        mentions_database, mentions_destructive = _scan_keywords(content)
         capability_tags = self._derive_capability_tags(
-            content, toolkits=detected_toolkits, detected_tools=detected_tools
+            mentions_database, toolkits=detected_toolkits, detected_tools=detected_tools
         )
         side_effects, risk_level = self._classify_side_effects_and_risk(
-            content, detected_tools=detected_tools, toolkits=detected_toolkits
+            mentions_destructive, detected_tools=detected_tools, toolkits=detected_toolkits
         )
 
-        # Get last modified time
-        last_modified = datetime.fromtimestamp(command_file.stat().st_mtime)
+        last_modified = datetime.fromtimestamp(mtime)
 
         # Commands in ~/.claude/commands/ are typically in-house
         origin = "in-house"
@@ -98,28 +347,31 @@ class CommandScanner:
             references=references,
             detected_tools=detected_tools,
             detected_toolkits=detected_toolkits,
-            inputs=io_safety.get("inputs") or [],
-            outputs=io_safety.get("outputs") or [],
-            safety_notes=io_safety.get("safety_notes") or "",
+            inputs=section_meta["inputs"],
+            outputs=section_meta["outputs"],
+            safety_notes=section_meta["safety_notes"],
             capability_tags=capability_tags,
             required_env_vars=required_env_vars,
-            prerequisites=prerequisites,
-            gotchas=gotchas,
-            examples=examples,
+            prerequisites=section_meta["prerequisites"],
+            gotchas=section_meta["gotchas"],
+            examples=section_meta["examples"],
             side_effects=side_effects,
             risk_level=risk_level,
         )
 
     def _extract_frontmatter(self, content: str) -> Dict:
         """Extract YAML frontmatter from a command `.md` file."""
-        pattern = r"^---\s*\n(.*?)\n---\s*\n"
-        match = re.match(pattern, content, re.DOTALL)
+        block = _frontmatter_block(content)
 
-        if not match:
+        if block is None:
             return {}
 
+        simple = _parse_simple_frontmatter(block)
+        if simple is not None:
+            return simple
+
         try:
-            return yaml.safe_load(match.group(1)) or {}
+            return yaml.load(block, Loader=_SafeLoader) or {}
         except yaml.YAMLError:
             return {}
 
@@ -128,14 +380,19 @@ class CommandScanner:
         if not isinstance(frontmatter, dict):
             return {}
 
-        standard = {"description"}
-        extra = {k: v for k, v in frontmatter.items() if k not in standard}
+        extra = {k: v for k, v in frontmatter.items() if k not in _STANDARD_FRONTMATTER_KEYS}
         return self._json_safe(extra)
 
     def _json_safe(self, value: Any) -> Any:
         """Convert a value to JSON-serializable primitives."""
-        if value is None or isinstance(value, (str, int, float, bool)):
+        if value is None or isinstance(value, _JSON_SCALARS):
             return value
+        # Frontmatter is almost always a flat mapping of scalars; copy it in
+        # one comprehension instead of recursing into every value.
+        if isinstance(value, dict) and all(
+            v is None or isinstance(v, _JSON_SCALARS) for v in value.values()
+        ):
+            return {str(k): v for k, v in value.items()}
         if isinstance(value, list):
             return [self._json_safe(v) for v in value]
         if isinstance(value, dict):
@@ -157,7 +414,9 @@ class CommandScanner:
 
         for plugin_json in plugin_json_paths:
             try:
-                data = json.loads(plugin_json.read_text())
+                with plugin_json.open("rb") as fh:
+                    data = _json.loads(fh.read())
+                    mtime = os.fstat(fh.fileno()).st_mtime
             except Exception:
                 continue
 
@@ -174,7 +433,7 @@ class CommandScanner:
             if not details:
                 continue
 
-            last_modified = datetime.fromtimestamp(plugin_json.stat().st_mtime)
+            last_modified = datetime.fromtimestamp(mtime)
             for cmd_name, desc in details.items():
                 # Avoid DB identity collisions with file-based commands.
                 display_name = f"plugin:{plugin_name}:{cmd_name}"
@@ -212,86 +471,103 @@ class CommandScanner:
                     details[str(item["name"])] = str(desc).strip() if desc else ""
         return details
 
-    def _extract_invocation_hints(self, content: str, *, default_name: str) -> Dict[str, Any]:
+    def _extract_invocation_hints(
+        self, lines: List[str], *, default_name: str
+    ) -> Dict[str, Any]:
         result: Dict[str, Any] = {"aliases": [], "arguments": "", "instruction": ""}
-        head = "\n".join(content.splitlines()[:80])
+        head_lines = lines[:80]
+        head = "\n".join(head_lines)
 
-        aliases = re.findall(r"/[A-Za-z0-9_-]+", head)
+        aliases = _ALIAS_RE.findall(head)
         if not aliases:
             aliases = [f"/{default_name}"]
         result["aliases"] = list(dict.fromkeys(aliases))
 
-        for line in head.splitlines():
+        for line in head_lines:
             normalized = line.replace("**", "")
-            m = re.search(r"(?i)^\s*arguments?\s*:\s*(.+)$", normalized)
+            m = _ARGUMENTS_RE.search(normalized)
             if m:
                 result["arguments"] = m.group(1).strip()
                 break
 
-        for line in content.splitlines():
-            if re.search(r"@\$\d+\b", line):
+        for line in lines:
+            if "@$" in line and _POSITIONAL_REF_RE.search(line):
                 result["instruction"] = line.strip()
                 break
         return result
 
     def _extract_references(self, content: str) -> Dict[str, List[str]]:
-        file_refs: List[str] = []
-        skill_refs: List[str] = []
-
-        for m in re.finditer(r"@([A-Za-z0-9_./$-]+)", content):
-            token = m.group(1)
-            if token.startswith("modelcontextprotocol/"):
-                continue
-            if token.startswith("$"):
-                file_refs.append(f"@{token}")
-                continue
-            if re.search(r"\.(md|txt|json|toml|ya?ml|py|sh)\b", token) or "/" in token:
-                file_refs.append(f"@{token}")
-
-        for m in re.finditer(r"\$([A-Za-z][A-Za-z0-9_-]+)", content):
-            skill_refs.append(m.group(1))
-
-        def dedupe(items: List[str]) -> List[str]:
-            seen = set()
-            out: List[str] = []
-            for it in items:
-                if it not in seen:
-                    seen.add(it)
-                    out.append(it)
-            return out
-
         refs: Dict[str, List[str]] = {}
-        file_refs = dedupe(file_refs)
-        skill_refs = dedupe(skill_refs)
+        # Every pattern here needs a literal marker; most files have neither.
+        has_at, has_dollar = "@" in content, "$" in content
+        if not has_at and not has_dollar:
+            return refs
+
+        # Dicts double as insertion-ordered sets, deduping as matches stream in.
+        file_refs: Dict[str, None] = {}
+        if has_at:
+            for m in _AT_REF_RE.finditer(content):
+                token = m.group(1)
+                if token.startswith("modelcontextprotocol/"):
+                    continue
+                if token.startswith("$") or "/" in token or _FILE_EXT_RE.search(token):
+                    file_refs[f"@{token}"] = None
+
+        skill_refs = (
+            dict.fromkeys(m.group(1) for m in _SKILL_REF_RE.finditer(content))
+            if has_dollar
+            else {}
+        )
+
         if file_refs:
-            refs["files"] = file_refs
+            refs["files"] = list(file_refs)
         if skill_refs:
-            refs["skills"] = skill_refs
+            refs["skills"] = list(skill_refs)
         return refs
 
-    def _extract_markdown_sections(self, content: str) -> List[Tuple[str, str]]:
-        lines = content.splitlines()
+    def _parse_markdown(
+        self, lines: List[str]
+    ) -> Tuple[List[Tuple[str, str]], List[str], List[Tuple[int, int]]]:
+        """Split content lines into `##`/`###` sections and fenced code blocks.
+
+        Both are collected in a single pass. As before, headings are recognized
+        anywhere (fences do not hide them) and fences are tracked independently.
+        Each closed block's `(start, end)` character span in the content is
+        returned alongside it; `lines` must come from newline-normalized content.
+        """
         sections: List[Tuple[str, str]] = []
         current_heading: Optional[str] = None
         current_body: List[str] = []
-
-        def flush() -> None:
-            nonlocal current_heading, current_body
-            if current_heading is not None:
-                sections.append((current_heading, "\n".join(current_body).strip()))
-            current_heading = None
-            current_body = []
+        blocks: List[str] = []
+        spans: List[Tuple[int, int]] = []
+        current_block: List[str] = []
+        in_block = False
+        block_start = offset = 0
 
         for line in lines:
-            m = re.match(r"^(#{2,3})\s+(.+?)\s*$", line)
+            m = _HEADING_RE.match(line)
             if m:
-                flush()
+                if current_heading is not None:
+                    sections.append((current_heading, "\n".join(current_body).strip()))
                 current_heading = m.group(2)
-                continue
-            if current_heading is not None:
+                current_body = []
+            elif current_heading is not None:
                 current_body.append(line)
-        flush()
-        return sections
+
+            if line.strip().startswith("```"):
+                if in_block:
+                    blocks.append("\n".join(current_block))
+                    spans.append((block_start, max(block_start, offset - 1)))
+                    current_block = []
+                in_block = not in_block
+                block_start = offset + len(line) + 1
+            elif in_block:
+                current_block.append(line)
+            offset += len(line) + 1
+
+        if current_heading is not None:
+            sections.append((current_heading, "\n".join(current_body).strip()))
+        return sections, blocks, spans
 
     def _extract_code_blocks(self, content: str) -> List[str]:
         blocks: List[str] = []
@@ -313,7 +589,7 @@ class CommandScanner:
     def _extract_bullets(self, body: str) -> List[str]:
         items: List[str] = []
         for line in body.splitlines():
-            m = re.match(r"^\s*[-*]\s+(.+)$", line)
+            m = _BULLET_RE.match(line)
             if m:
                 items.append(m.group(1).strip())
         return items
@@ -322,165 +598,173 @@ class CommandScanner:
         lines = [ln.rstrip() for ln in body.splitlines() if ln.strip()]
         return "\n".join(lines[:max_lines]).strip()
 
-    def _extract_inputs_outputs_safety(self, content: str) -> Dict[str, Any]:
-        result: Dict[str, Any] = {"inputs": [], "outputs": [], "safety_notes": ""}
-        sections = self._extract_markdown_sections(content)
-
-        def norm(h: str) -> str:
-            return re.sub(r"[^a-z0-9 ]+", "", h.strip().lower())
+    def _extract_section_metadata(
+        self, sections: List[Tuple[str, str]], code_blocks: List[str]
+    ) -> Dict[str, Any]:
+        """Route every section to the metadata its heading names, in one pass.
+
+        A section can feed several buckets (e.g. "Setup examples"); its bullets
+        are parsed at most once.
+        """
+        inputs: List[str] = []
+        outputs: List[str] = []
+        safety_notes = ""
+        prerequisites: List[str] = []
+        gotchas: List[str] = []
+        examples: List[str] = []
 
         for heading, body in sections:
-            key = norm(heading)
-            if not result["inputs"] and key in {"inputs", "input", "parameters"}:
-                result["inputs"] = self._extract_bullets(body)[:25]
-            if not result["outputs"] and key in {"outputs", "output", "returns"}:
-                result["outputs"] = self._extract_bullets(body)[:25]
-            if not result["safety_notes"] and key in {"safety", "security", "privacy", "redaction"}:
-                result["safety_notes"] = self._trim_block(body, max_lines=20)
-        return result
+            lower = heading.lower()
+            bullets: Optional[List[str]] = None
 
-    def _extract_tool_usage(self, content: str) -> Tuple[Dict[str, List[str]], List[str]]:
-        mcp_tools: List[str] = []
-        composio_tools: List[str] = []
-        toolkits: List[str] = []
-        blocks = self._extract_code_blocks(content)
-        haystacks = blocks + [content]
+            bucket = _IO_SECTION_BUCKETS.get(_HEADING_NOISE_RE.sub("", lower.strip()))
+            if bucket == "inputs" and not inputs:
+                bullets = self._extract_bullets(body)
+                inputs = bullets[:25]
+            elif bucket == "outputs" and not outputs:
+                bullets = self._extract_bullets(body)
+                outputs = bullets[:25]
+            elif bucket == "safety" and not safety_notes:
+                safety_notes = self._trim_block(body, max_lines=20)
+
+            if "install" in lower or "setup" in lower:
+                if bullets is None:
+                    bullets = self._extract_bullets(body)
+                prerequisites.extend(bullets)
+                prerequisites.extend(self._extract_install_commands(body))
+
+            if any(marker in lower for marker in _GOTCHA_HEADING_MARKERS):
+                if bullets is None:
+                    bullets = self._extract_bullets(body)
+                gotchas.extend(bullets or [self._trim_block(body, max_lines=12)])
+
+            if "example" in lower:
+                for block in self._extract_code_blocks(body):
+                    t = block.strip()
+                    if t:
+                        examples.append(t[:800])
 
-        for text in haystacks:
-            for m in re.finditer(r"\bmcp__([a-z0-9_-]+)__([a-z0-9_-]+)\b", text, re.I):
-                full = f"mcp__{m.group(1)}__{m.group(2)}"
-                mcp_tools.append(full)
-                toolkits.append(m.group(1).lower())
+        for block in code_blocks:
+            prerequisites.extend(self._extract_install_commands(block))
+        if not examples:
+            for block in code_blocks[:2]:
+                t = block.strip()
+                if t:
+                    examples.append(t[:800])
 
-            for m in re.finditer(r"run_composio_tool\(\s*['\"]([A-Z0-9_]+)['\"]", text):
+        return {
+            "inputs": inputs,
+            "outputs": outputs,
+            "safety_notes": safety_notes,
+            "prerequisites": list(dict.fromkeys([i for i in prerequisites if i]))[:25],
+            "gotchas": list(dict.fromkeys([i for i in gotchas if i]))[:25],
+            "examples": list(dict.fromkeys(examples))[:5],
+        }
+
+    def _extract_tool_usage(
+        self, content: str, *, block_spans: List[Tuple[int, int]]
+    ) -> Tuple[Dict[str, List[str]], List[str]]:
+        # Cheap substring probes skip the regex scans for the many files that
+        # reference no tools. `_MCP_TOOL_RE` is case-insensitive, so probe for
+        # the "__" separator rather than the "mcp" prefix.
+        mcp_hits = list(_MCP_TOOL_RE.finditer(content)) if "__" in content else []
+        composio_hits = (
+            list(_COMPOSIO_RE.finditer(content)) if "run_composio_tool(" in content else []
+        )
+        if not mcp_hits and not composio_hits:
+            return {}, []
+
+        # One scan of the content finds every hit. Hits inside fenced code
+        # blocks are replayed first, block by block, so they keep precedence
+        # in the output order as when each block was scanned separately.
+        starts = [start for start, _ in block_spans]
+        in_blocks: Dict[int, Tuple[list, list]] = {}
+        for hits, slot in ((mcp_hits, 0), (composio_hits, 1)):
+            for m in hits:
+                i = bisect_right(starts, m.start()) - 1
+                if i >= 0 and m.end() <= block_spans[i][1]:
+                    in_blocks.setdefault(i, ([], []))[slot].append(m)
+        ordered = [in_blocks[i] for i in sorted(in_blocks)]
+        ordered.append((mcp_hits, composio_hits))
+
+        # Dicts double as insertion-ordered sets, deduping as matches stream in.
+        mcp_tools: Dict[str, None] = {}
+        composio_tools: Dict[str, None] = {}
+        toolkits: Dict[str, None] = {}
+        for block_mcp, block_composio in ordered:
+            for m in block_mcp:
+                mcp_tools[f"mcp__{m.group(1)}__{m.group(2)}"] = None
+                toolkits[m.group(1).lower()] = None
+
+            for m in block_composio:
                 slug = m.group(1)
-                composio_tools.append(slug)
-                toolkits.append(slug.split("_", 1)[0].lower())
-
-        def dedupe(items: List[str]) -> List[str]:
-            seen = set()
-            out: List[str] = []
-            for it in items:
-                if it not in seen:
-                    seen.add(it)
-                    out.append(it)
-            return out
+                composio_tools[slug] = None
+                toolkits[slug.split("_", 1)[0].lower()] = None
 
         tools: Dict[str, List[str]] = {}
-        mcp_tools = dedupe(mcp_tools)
-        composio_tools = dedupe(composio_tools)
-        toolkits = dedupe([t for t in toolkits if t])
         if mcp_tools:
-            tools["mcp_tools"] = mcp_tools
+            tools["mcp_tools"] = list(mcp_tools)
         if composio_tools:
-            tools["composio_tools"] = composio_tools
-        return tools, toolkits
+            tools["composio_tools"] = list(composio_tools)
+        return tools, [t for t in toolkits if t]
 
-    def _extract_required_env_vars(self, content: str) -> List[str]:
+    def _extract_required_env_vars(self, content: str, lines: List[str]) -> List[str]:
         names: List[str] = []
-        for m in re.finditer(r"\$\{([A-Z0-9_]+)\}", content):
-            names.append(m.group(1))
-        for line in content.splitlines():
-            m = re.match(r"^\s*export\s+([A-Z0-9_]+)\s*=", line)
-            if m:
+        if "${" in content:
+            for m in _ENV_BRACE_RE.finditer(content):
                 names.append(m.group(1))
+        if "export" in content:
+            for line in lines:
+                m = _EXPORT_RE.match(line)
+                if m:
+                    names.append(m.group(1))
         return list(dict.fromkeys(names))[:50]
 
-    def _extract_prerequisites(self, content: str) -> List[str]:
-        sections = self._extract_markdown_sections(content)
-        lines: List[str] = []
-        for heading, body in sections:
-            if "install" in heading.lower() or "setup" in heading.lower():
-                lines.extend(self._extract_bullets(body))
-                lines.extend(self._extract_install_commands(body))
-        for block in self._extract_code_blocks(content):
-            lines.extend(self._extract_install_commands(block))
-        return list(dict.fromkeys([item for item in lines if item]))[:25]
-
     def _extract_install_commands(self, text: str) -> List[str]:
         cmds: List[str] = []
-        patterns = [
-            r"^\s*(pip3?\s+install\s+.+)$",
-            r"^\s*(brew\s+install\s+.+)$",
-            r"^\s*(npm\s+(?:i|install)\s+.+)$",
-            r"^\s*(pnpm\s+add\s+.+)$",
-            r"^\s*(yarn\s+add\s+.+)$",
-        ]
+        if not any(tool in text for tool in _INSTALL_TOOLS):
+            return cmds
         for line in text.splitlines():
-            for pat in patterns:
-                m = re.match(pat, line.strip())
-                if m:
-                    cmds.append(m.group(1).strip())
+            m = _INSTALL_COMMAND_RE.match(line.strip())
+            if m:
+                cmds.append(m.group(1).strip())
         return cmds
 
-    def _extract_gotchas(self, content: str) -> List[str]:
-        sections = self._extract_markdown_sections(content)
-        items: List[str] = []
-        for heading, body in sections:
-            if any(k in heading.lower() for k in ["pitfall", "known issue", "limitation", "gotcha"]):
-                bullets = self._extract_bullets(body)
-                items.extend(bullets or [self._trim_block(body, max_lines=12)])
-        return list(dict.fromkeys([i for i in items if i]))[:25]
-
-    def _extract_examples(self, content: str) -> List[str]:
-        sections = self._extract_markdown_sections(content)
-        examples: List[str] = []
-        for heading, body in sections:
-            if "example" in heading.lower():
-                for block in self._extract_code_blocks(body):
-                    t = block.strip()
-                    if t:
-                        examples.append(t[:800])
-        if not examples:
-            for block in self._extract_code_blocks(content)[:2]:
-                t = block.strip()
-                if t:
-                    examples.append(t[:800])
-        return list(dict.fromkeys(examples))[:5]
-
     def _derive_capability_tags(
-        self, content: str, *, toolkits: List[str], detected_tools: Dict[str, List[str]]
+        self, mentions_database: bool, *, toolkits: List[str], detected_tools: Dict[str, List[str]]
     ) -> List[str]:
         tags: List[str] = []
-        toolkit_to_tag = {
-            "gmail": "email",
-            "google-calendar": "calendar",
-            "googlecalendar": "calendar",
-            "slack": "slack",
-            "github": "github",
-            "neon": "database",
-        }
         for tk in toolkits:
-            tag = toolkit_to_tag.get(str(tk).lower())
+            tag = _TOOLKIT_TAGS.get(str(tk).lower())
             if tag:
                 tags.append(tag)
         for slug in detected_tools.get("composio_tools") or []:
-            prefix = slug.split("_", 1)[0].lower()
-            if prefix == "gmail":
-                tags.append("email")
-            if prefix == "slack":
-                tags.append("slack")
-            if prefix == "github":
-                tags.append("github")
-        if re.search(r"\b(sql|postgres|sqlite|database)\b", content, re.I):
+            tag = _COMPOSIO_PREFIX_TAGS.get(slug.split("_", 1)[0].lower())
+            if tag:
+                tags.append(tag)
+        if mentions_database:
             tags.append("database")
         return list(dict.fromkeys(tags))
 
     def _classify_side_effects_and_risk(
-        self, content: str, *, detected_tools: Dict[str, List[str]], toolkits: List[str]
+        self,
+        mentions_destructive: bool,
+        *,
+        detected_tools: Dict[str, List[str]],
+        toolkits: List[str],
     ) -> Tuple[List[str], str]:
-        side_effects: List[str] = []
-        if "gmail" in toolkits:
-            side_effects.append("email")
-        if "slack" in toolkits:
-            side_effects.append("slack")
-        if "github" in toolkits:
-            side_effects.append("github")
-        if "neon" in toolkits:
-            side_effects.append("database")
-        lower = content.lower()
-        if re.search(r"\b(delete|drop|truncate|reset|destroy)\b", lower):
-            return list(dict.fromkeys(side_effects)), "high"
+        # Each toolkit maps to a distinct effect, so the list needs no dedupe.
+        side_effects = [
+            effect for toolkit, effect in _TOOLKIT_SIDE_EFFECTS if toolkit in toolkits
+        ]
+        if mentions_destructive:
+            return side_effects, "high"
         if side_effects:
-            return list(dict.fromkeys(side_effects)), "medium"
+            return side_effects, "medium"
         return [], "low"
+
+
+def _scan_command_batch(batch: List[Tuple[Path, bool]]) -> List[CommandMetadata]:
+    """Scan a batch of command files (picklable for worker processes)."""
+    scanner = CommandScanner(Path())
+    return [scanner._scan_file(path, is_disabled) for path, is_disabled in batch]
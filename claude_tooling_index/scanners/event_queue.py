@@ -1,12 +1,31 @@
 """Event queue scanner - extracts analytics from `event_queue.jsonl`."""
 
-import json
+import multiprocessing
+import os
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ..models import EventMetrics
+from . import _json
+
+# Millisecond timestamps strictly inside this window (1970 to 3000) always
+# convert with `datetime.fromtimestamp`, so they need no per-event check.
+_SAFE_TS_MIN_MS = 0
+_SAFE_TS_MAX_MS = 32_503_680_000_000
+
+# Below this log size, worker start-up costs more than it saves.
+_PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+_MAX_WORKERS = 8
+
+# (total_events, event_types, permission_modes, tools, session_ids, first_ts, last_ts)
+_EventTally = Tuple[
+    int, Dict[str, int], Dict[str, int], Dict[str, int], Set[Any], Any, Any
+]
 
 
 class EventQueueScanner:
@@ -18,125 +37,218 @@ class EventQueueScanner:
         )
 
     def scan(self) -> Optional[EventMetrics]:
-        """Scan event queue and extract analytics."""
+        """Scan event queue and extract analytics.
+
+        Large logs are split at line boundaries and tallied across worker
+        processes.
+        """
         if not self.event_queue_path.exists():
             return None
 
-        result = EventMetrics()
-        tool_counter = Counter()
-        event_type_counter = Counter()
-        permission_counter = Counter()
-        session_ids = set()
-        timestamps = []
-
         try:
-            with open(self.event_queue_path, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    try:
-                        event = json.loads(line)
-                        self._process_event(
-                            event,
-                            tool_counter,
-                            event_type_counter,
-                            permission_counter,
-                            session_ids,
-                            timestamps,
-                        )
-                        result.total_events += 1
-                    except json.JSONDecodeError:
-                        continue
-
+            tallies = self._tally()
         except IOError:
             return None
 
+        # Merging the per-range tallies in file order keeps every dict in
+        # first-seen order, exactly as a single pass would produce it.
+        (
+            total_events,
+            event_type_counts,
+            permission_counts,
+            tool_counts,
+            session_ids,
+            first_ts,
+            last_ts,
+        ) = tallies[0]
+        for total, event_types, permissions, tools, sessions, lo, hi in tallies[1:]:
+            total_events += total
+            _add_counts(event_type_counts, event_types)
+            _add_counts(permission_counts, permissions)
+            _add_counts(tool_counts, tools)
+            session_ids |= sessions
+            if lo is not None and (first_ts is None or lo < first_ts):
+                first_ts = lo
+            if hi is not None and (last_ts is None or hi > last_ts):
+                last_ts = hi
+
         # Populate result
-        result.tool_frequency = dict(tool_counter)
-        result.top_tools = tool_counter.most_common(15)
-        result.event_types = dict(event_type_counter)
+        result = EventMetrics()
+        result.total_events = total_events
+        result.tool_frequency = tool_counts
+        result.top_tools = Counter(tool_counts).most_common(15)
+        result.event_types = event_type_counts
         result.session_count = len(session_ids)
 
         # Calculate permission distribution
-        total_permissions = sum(permission_counter.values())
+        total_permissions = sum(permission_counts.values())
         if total_permissions > 0:
             result.permission_distribution = {
                 mode: count / total_permissions
-                for mode, count in permission_counter.items()
+                for mode, count in permission_counts.items()
             }
 
         # Date range
-        if timestamps:
-            result.date_range_start = min(timestamps)
-            result.date_range_end = max(timestamps)
+        if first_ts is not None:
+            result.date_range_start = datetime.fromtimestamp(first_ts / 1000)
+            result.date_range_end = datetime.fromtimestamp(last_ts / 1000)
 
         return result
 
-    def _process_event(
-        self,
-        event: dict,
-        tool_counter: Counter,
-        event_type_counter: Counter,
-        permission_counter: Counter,
-        session_ids: set,
-        timestamps: list,
-    ) -> None:
-        """Process a single event record."""
-        # Extract event type
-        event_type = event.get("hook_event_type", "unknown")
-        event_type_counter[event_type] += 1
-
-        # Extract session ID
-        session_id = event.get("session_id")
-        if session_id:
-            session_ids.add(session_id)
-
-        # Extract timestamp
-        ts = event.get("timestamp")
-        if ts:
+    def _tally(self) -> List[_EventTally]:
+        """Tally the log in line-aligned byte ranges, in parallel when worth it."""
+        path = str(self.event_queue_path)
+        workers = min(os.cpu_count() or 1, _MAX_WORKERS)
+        size = os.path.getsize(path)
+        if size < _PARALLEL_MIN_BYTES or workers < 2:
+            return [_tally_event_range(path, 0, None)]
+
+        starts = _line_starts(path, size, workers)
+        # The last range reads to EOF so events appended mid-scan still count.
+        ends: List[Optional[int]] = [*starts[1:], None]
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                return list(
+                    executor.map(_tally_event_range, repeat(path), starts, ends)
+                )
+        except (OSError, BrokenProcessPool):
+            # Process pools can be unavailable (sandboxes, frozen apps).
+            return [_tally_event_range(path, 0, None)]
+
+
+def _line_starts(path: str, size: int, parts: int) -> List[int]:
+    """Return up to `parts` increasing offsets that each begin a line."""
+    starts = [0]
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            f.seek(max(size * i // parts, starts[-1]))
+            f.readline()  # finish the line the seek landed in
+            pos = f.tell()
+            if pos >= size:
+                break
+            if pos > starts[-1]:
+                starts.append(pos)
+    return starts
+
+
+def _add_counts(into: Dict[str, int], counts: Dict[str, int]) -> None:
+    for key, count in counts.items():
+        into[key] = into.get(key, 0) + count
+
+
+def _tally_event_range(path: str, start: int, end: Optional[int]) -> _EventTally:
+    """Tally the events on lines starting in `[start, end)` (picklable for workers).
+
+    `end=None` reads to the end of the file.
+    """
+    # Plain dicts counted through a bound `get`: `Counter.__getitem__` is
+    # resolved through the subclass on every event and is ~2.5x slower here.
+    tool_counts: Dict[str, int] = {}
+    event_type_counts: Dict[str, int] = {}
+    permission_counts: Dict[str, int] = {}
+    session_ids: Set[Any] = set()
+    # Only the extremes are reported, so track the first/last raw timestamps
+    # instead of materializing a datetime per event.
+    first_ts = last_ts = None
+
+    # Per-event work is inlined with locally bound callables: this loop runs
+    # once per line of a potentially very large log.
+    loads = _json.loads
+    add_session = session_ids.add
+    tool_count = tool_counts.get
+    event_type_count = event_type_counts.get
+    permission_count = permission_counts.get
+    fromtimestamp = datetime.fromtimestamp
+    tool_events = ("PreToolUse", "PostToolUse")
+    total_events = 0
+    pos = start
+
+    # Lines stay bytes: the JSON decoder reads UTF-8 directly and skips
+    # surrounding whitespace, so no per-line decode or strip() copy.
+    with open(path, "rb") as f:
+        f.seek(start)
+        for line in f:
+            if end is not None:
+                if pos >= end:
+                    break
+                pos += len(line)
+
+            if line.isspace():
+                continue
+
             try:
-                # Timestamps are in milliseconds
-                dt = datetime.fromtimestamp(ts / 1000)
-                timestamps.append(dt)
-            except (ValueError, TypeError, OSError):
-                pass
-
-        # Extract payload details
-        payload = event.get("payload", {})
-
-        # Permission mode
-        permission_mode = payload.get("permission_mode", "unknown")
-        permission_counter[permission_mode] += 1
-
-        # Extract tool name for PreToolUse/PostToolUse events
-        if event_type in ("PreToolUse", "PostToolUse"):
-            tool_name = self._extract_tool_name(payload)
-            if tool_name:
-                tool_counter[tool_name] += 1
-
-    def _extract_tool_name(self, payload: dict) -> Optional[str]:
-        """Extract tool name from event payload."""
-        # Try different possible locations for tool name
-        tool_name = payload.get("tool_name")
-        if tool_name:
-            return tool_name
-
-        # Check in nested tool_input
-        tool_input = payload.get("tool_input", {})
-        if isinstance(tool_input, dict):
-            # Some events have name in tool_input
-            name = tool_input.get("name")
-            if name:
-                return name
-
-        # Check hook_event_name for clues
-        hook_name = payload.get("hook_event_name", "")
-        if ":" in hook_name:
-            # Format might be "PreToolUse:ToolName"
-            parts = hook_name.split(":")
-            if len(parts) >= 2:
-                return parts[1]
-
-        return None
+                event = loads(line)
+            except ValueError:  # malformed JSON or invalid UTF-8
+                continue
+
+            event_type = event.get("hook_event_type", "unknown")
+            event_type_counts[event_type] = event_type_count(event_type, 0) + 1
+
+            session_id = event.get("session_id")
+            if session_id:
+                add_session(session_id)
+
+            ts = event.get("timestamp")
+            if ts:
+                try:
+                    # Timestamps are in milliseconds. Values outside the
+                    # always-representable window are validated by
+                    # converting them; the rest are only compared.
+                    if not _SAFE_TS_MIN_MS < ts < _SAFE_TS_MAX_MS:
+                        fromtimestamp(ts / 1000)
+                    if first_ts is None or ts < first_ts:
+                        first_ts = ts
+                    if last_ts is None or ts > last_ts:
+                        last_ts = ts
+                except (ValueError, TypeError, OSError):
+                    pass
+
+            payload = event.get("payload", {})
+            mode = payload.get("permission_mode", "unknown")
+            permission_counts[mode] = permission_count(mode, 0) + 1
+
+            # Tool name for PreToolUse/PostToolUse events
+            if event_type in tool_events:
+                tool_name = _extract_tool_name(payload)
+                if tool_name:
+                    tool_counts[tool_name] = tool_count(tool_name, 0) + 1
+
+            total_events += 1
+
+    return (
+        total_events,
+        event_type_counts,
+        permission_counts,
+        tool_counts,
+        session_ids,
+        first_ts,
+        last_ts,
+    )
+
+
+def _extract_tool_name(payload: dict) -> Optional[str]:
+    """Extract tool name from event payload."""
+    # Try different possible locations for tool name
+    tool_name = payload.get("tool_name")
+    if tool_name:
+        return tool_name
+
+    # Check in nested tool_input
+    tool_input = payload.get("tool_input", {})
+    if isinstance(tool_input, dict):
+        # Some events have name in tool_input
+        name = tool_input.get("name")
+        if name:
+            return name
+
+    # Check hook_event_name for clues
+    hook_name = payload.get("hook_event_name", "")
+    if ":" in hook_name:
+        # Format might be "PreToolUse:ToolName"
+        parts = hook_name.split(":")
+        if len(parts) >= 2:
+            return parts[1]
+
+    return None
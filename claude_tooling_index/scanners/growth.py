@@ -1,11 +1,13 @@
 """Growth scanner - extracts L1-L5 progression metrics from agentic-growth."""
 
 import json
+import os
 import re
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from ..models import GrowthMetrics
+from . import _json
 
 
 class GrowthScanner:
@@ -24,14 +26,16 @@ class GrowthScanner:
         # Count edges by category
         edges_dir = self.growth_dir / "edges"
         if edges_dir.exists():
-            result.total_edges = self._count_edges(edges_dir)
-            result.edges_by_category = self._categorize_edges(edges_dir)
+            result.total_edges, result.edges_by_category = self._count_by_category(
+                edges_dir, "EDGE-"
+            )
 
         # Count patterns
         patterns_dir = self.growth_dir / "patterns"
         if patterns_dir.exists():
-            result.total_patterns = self._count_patterns(patterns_dir)
-            result.patterns_by_category = self._categorize_patterns(patterns_dir)
+            result.total_patterns, result.patterns_by_category = (
+                self._count_by_category(patterns_dir, "PATTERN-")
+            )
 
         # Parse progression level
         progression_file = self.growth_dir / "progression.md"
@@ -45,53 +49,34 @@ class GrowthScanner:
 
         return result
 
-    def _count_edges(self, edges_dir: Path) -> int:
-        """Count total edge files (`EDGE-XXX.md`)."""
-        count = 0
-        try:
-            for subdir in edges_dir.iterdir():
-                if subdir.is_dir():
-                    count += len(list(subdir.glob("EDGE-*.md")))
-        except OSError:
-            pass
-        return count
-
-    def _categorize_edges(self, edges_dir: Path) -> dict:
-        """Count edges by category subdirectory."""
-        categories = {}
-        try:
-            for subdir in edges_dir.iterdir():
-                if subdir.is_dir() and subdir.name not in ("index.md",):
-                    edge_count = len(list(subdir.glob("EDGE-*.md")))
-                    if edge_count > 0:
-                        categories[subdir.name] = edge_count
-        except OSError:
-            pass
-        return categories
-
-    def _count_patterns(self, patterns_dir: Path) -> int:
-        """Count total pattern files."""
-        count = 0
-        try:
-            for subdir in patterns_dir.iterdir():
-                if subdir.is_dir():
-                    count += len(list(subdir.glob("PATTERN-*.md")))
-        except OSError:
-            pass
-        return count
+    def _count_by_category(self, root: Path, prefix: str) -> Tuple[int, Dict[str, int]]:
+        """Count `<prefix>*.md` files per category subdirectory in one pass.
 
-    def _categorize_patterns(self, patterns_dir: Path) -> dict:
-        """Count patterns by category."""
-        categories = {}
+        Returns the overall total and the non-zero per-category counts.
+        """
+        total = 0
+        categories: Dict[str, int] = {}
         try:
-            for subdir in patterns_dir.iterdir():
-                if subdir.is_dir() and subdir.name not in ("index.md",):
-                    pattern_count = len(list(subdir.glob("PATTERN-*.md")))
-                    if pattern_count > 0:
-                        categories[subdir.name] = pattern_count
+            with os.scandir(root) as subdirs:
+                for subdir in subdirs:
+                    if not subdir.is_dir():
+                        continue
+                    try:
+                        with os.scandir(subdir.path) as entries:
+                            count = sum(
+                                1
+                                for entry in entries
+                                if entry.name.startswith(prefix)
+                                and entry.name.endswith(".md")
+                            )
+                    except OSError:
+                        continue
+                    total += count
+                    if count > 0 and subdir.name != "index.md":
+                        categories[subdir.name] = count
         except OSError:
             pass
-        return categories
+        return total, categories
 
     def _parse_progression_level(self, progression_file: Path) -> str:
         """Extract current L1-L5 level from progression.md."""
@@ -123,7 +108,7 @@ class GrowthScanner:
     def _count_project_edges(self, project_edges_file: Path) -> int:
         """Count projects with documented edges."""
         try:
-            data = json.loads(project_edges_file.read_text())
+            data = _json.loads(project_edges_file.read_bytes())
             # Exclude _comment and _categories keys
             return len([k for k in data.keys() if not k.startswith("_")])
         except (IOError, json.JSONDecodeError):
@@ -1,12 +1,43 @@
 """Hook scanner - extracts metadata from hook files."""
 
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from ..models import HookMetadata
 
+# Tool, env-var and risk signatures sit near the top of a hook; only this much
+# of each file is read and analyzed.
+_MAX_HOOK_BYTES = 256 * 1024
+
+_MCP_TOOL_RE = re.compile(r"\bmcp__([a-z0-9_-]+)__([a-z0-9_-]+)\b", re.I)
+_COMPOSIO_RE = re.compile(r"run_composio_tool\(\s*['\"]([A-Z0-9_]+)['\"]")
+_CORE_TOOLS = ("read_file", "write_file", "apply_patch", "exec_command", "list_dir")
+_CORE_TOOLS_RE = re.compile(r"\b(%s)\b" % "|".join(_CORE_TOOLS))
+_ENV_BRACE_RE = re.compile(r"\$\{([A-Z0-9_]+)\}")
+# Applied per line: a multi-line form would let `\s` match across line breaks.
+_EXPORT_RE = re.compile(r"^\s*export\s+([A-Z0-9_]+)\s*=")
+_DESTRUCTIVE_WORDS = ("drop", "delete", "truncate", "reset", "destroy")
+_DESTRUCTIVE_RE = re.compile(r"\b(%s)\b" % "|".join(_DESTRUCTIVE_WORDS))
+
+_EXT_LANGUAGES = {
+    ".py": "python",
+    ".sh": "bash",
+    ".bash": "bash",
+    ".js": "javascript",
+}
+# Extensions whose language is sniffed from the shebang instead.
+_SHEBANG_SNIFF_EXTS = ("", ".out")
+# The kernel reads at most this much of a shebang line, so it is enough to sniff.
+_SHEBANG_MAX_BYTES = 256
+
+# A handful of hooks is cheaper to read serially than to spin up a pool for.
+_PARALLEL_MIN_FILES = 8
+_MAX_WORKERS = 8
+
 
 class HookScanner:
     """Scan `~/.claude/hooks/` for hook file metadata."""
@@ -16,76 +47,125 @@ class HookScanner:
 
     def scan(self) -> List[HookMetadata]:
         """Scan all hooks in the hooks directory."""
-        hooks = []
-
-        if not self.hooks_dir.exists():
-            return hooks
-
-        for location in [self.hooks_dir, self.hooks_dir / ".disabled"]:
-            if not location.exists():
+        # Gather (entry, is_disabled) pairs from both locations first so a single
+        # pass (and a single pool) covers hooks/ and hooks/.disabled together.
+        entries: List[Tuple[os.DirEntry, bool]] = []
+        for location, is_disabled in (
+            (self.hooks_dir, False),
+            (self.hooks_dir / ".disabled", True),
+        ):
+            # DirEntry caches the type and stat results, so the checks below
+            # and the hook's size/mtime/mode cost no extra syscalls. A missing
+            # directory is detected by scandir itself rather than a prior stat.
+            try:
+                with os.scandir(location) as it:
+                    entries.extend(
+                        (entry, is_disabled)
+                        for entry in it
+                        # Skip hidden files
+                        if not entry.name.startswith(".") and entry.is_file()
+                    )
+            except FileNotFoundError:
                 continue
 
-            is_disabled = location.name == ".disabled"
-
-            for hook_file in location.iterdir():
-                if not hook_file.is_file():
-                    continue
-
-                # Skip hidden files
-                if hook_file.name.startswith("."):
-                    continue
-
-                try:
-                    hook = self._scan_hook(hook_file)
-                    if hook:
-                        if is_disabled:
-                            hook.status = "disabled"
-                        hooks.append(hook)
-                except Exception as e:
-                    # Track error but continue
-                    error_hook = HookMetadata(
-                        name=hook_file.name,
-                        origin="unknown",
-                        status="error",
-                        last_modified=datetime.now(),
-                        install_path=hook_file,
-                        error_message=str(e),
-                    )
-                    hooks.append(error_hook)
+        if len(entries) >= _PARALLEL_MIN_FILES:
+            # Each hook costs an open and a read; overlap them on slow
+            # (e.g. network) home directories.
+            with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+                return list(executor.map(self._scan_entry, *zip(*entries)))
 
-        return hooks
+        return [self._scan_entry(entry, is_disabled) for entry, is_disabled in entries]
 
-    def _scan_hook(self, hook_file: Path) -> HookMetadata:
-        """Scan a single hook file."""
+    def _scan_entry(self, entry: os.DirEntry, is_disabled: bool) -> HookMetadata:
+        """Scan one hook entry, turning failures into an error record."""
+        hook_file = Path(entry.path)
+        try:
+            hook = self._scan_hook(hook_file, entry.stat())
+            if is_disabled:
+                hook.status = "disabled"
+            return hook
+        except Exception as e:
+            # Track error but continue
+            return HookMetadata(
+                name=hook_file.name,
+                origin="unknown",
+                status="error",
+                last_modified=datetime.now(),
+                install_path=hook_file,
+                error_message=str(e),
+            )
+
+    def _scan_hook(self, hook_file: Path, st: os.stat_result) -> HookMetadata:
+        """Scan a single hook file, given its (symlink-following) stat result."""
         name = hook_file.name
+        ext = hook_file.suffix
+
+        # One bounded read serves the shebang, language sniffing and content
+        # analysis. Files sniffed by shebang read a short head first, so
+        # compiled hooks stop there instead of pulling in machine code.
+        content_truncated = False
+        try:
+            with open(hook_file, "rb") as f:
+                head = b""
+                compiled = False
+                if ext in _SHEBANG_SNIFF_EXTS:
+                    head = f.readline(_SHEBANG_MAX_BYTES)
+                    head_line = head.split(b"\n", 1)[0]
+                    compiled = (
+                        self._detect_language(
+                            ext, head_line.decode("utf-8", errors="ignore")
+                        )
+                        == "cpp"
+                    )
+                if compiled:
+                    raw = head
+                else:
+                    raw = head + f.read(_MAX_HOOK_BYTES - len(head))
+                    if len(raw) == _MAX_HOOK_BYTES:
+                        content_truncated = bool(f.read(1))
+        except OSError:
+            raw = None
+        first_line = None
+        if raw is not None:
+            first_line = raw.split(b"\n", 1)[0].decode("utf-8", errors="ignore")
 
         # Detect language from extension or shebang
-        language = self._detect_language(hook_file)
+        language = self._detect_language(ext, first_line)
 
         # Extract trigger from filename (e.g., "post_tool_use" from "post_tool_use.py")
         trigger = hook_file.stem
         trigger_event = self._detect_trigger_event(trigger)
 
         # Get file size
-        file_size = hook_file.stat().st_size
+        file_size = st.st_size
 
         # Get last modified time
-        last_modified = datetime.fromtimestamp(hook_file.stat().st_mtime)
-
-        shebang = self._read_shebang(hook_file)
-        is_executable = (hook_file.stat().st_mode & 0o111) != 0
-
-        content = ""
-        try:
-            content = hook_file.read_text(errors="ignore")
-        except Exception:
-            content = ""
-
-        detected_tools, detected_toolkits = self._extract_tool_usage(content)
-        required_env_vars = self._extract_required_env_vars(content)
-        side_effects, risk_level = self._classify_side_effects_and_risk(
-            content, detected_tools=detected_tools, toolkits=detected_toolkits
-        )
+        last_modified = datetime.fromtimestamp(st.st_mtime)
+
+        shebang = ""
+        if first_line is not None and first_line.strip().startswith("#!"):
+            shebang = first_line.strip()
+        is_executable = (st.st_mode & 0o111) != 0
+
+        if language == "cpp":
+            # Compiled hooks carry no analyzable source; matching the patterns
+            # against machine code only yields spurious hits from symbol names.
+            detected_tools: Dict[str, List[str]] = {}
+            detected_toolkits: List[str] = []
+            required_env_vars: List[str] = []
+            side_effects: List[str] = []
+            risk_level = "low"
+        else:
+            content = raw.decode("utf-8", errors="ignore") if raw is not None else ""
+
+            lower = content.lower()
+            detected_tools, detected_toolkits = self._extract_tool_usage(
+                content, lower=lower
+            )
+            required_env_vars = self._extract_required_env_vars(content)
+            side_effects, risk_level = self._classify_side_effects_and_risk(
+                lower, detected_tools=detected_tools, toolkits=detected_toolkits
+            )
 
         # Detect origin
         origin = "in-house"
@@ -111,47 +191,32 @@ class HookScanner:
             required_env_vars=required_env_vars,
             side_effects=side_effects,
             risk_level=risk_level,
+            content_truncated=content_truncated,
         )
 
-    def _detect_language(self, file_path: Path) -> str:
-        """Detect programming language from extension or shebang."""
+    def _detect_language(self, ext: str, first_line: Optional[str]) -> str:
+        """Detect programming language from extension or shebang.
+
+        `first_line` is the decoded first line, or None if the file was unreadable.
+        """
         # Check extension first
-        ext = file_path.suffix
-        if ext == ".py":
-            return "python"
-        elif ext == ".sh" or ext == ".bash":
-            return "bash"
-        elif ext == ".js":
-            return "javascript"
-        elif ext == "" or ext == ".out":
+        language = _EXT_LANGUAGES.get(ext)
+        if language is not None:
+            return language
+        if ext in _SHEBANG_SNIFF_EXTS and first_line is not None:
             # Check shebang for extensionless files
-            try:
-                with open(file_path, "rb") as f:
-                    first_line = f.readline().decode("utf-8", errors="ignore")
-                    if first_line.startswith("#!"):
-                        if "python" in first_line:
-                            return "python"
-                        elif "bash" in first_line or "sh" in first_line:
-                            return "bash"
-                        elif "node" in first_line:
-                            return "javascript"
-                    # If no shebang, might be a compiled binary
-                    return "cpp"  # Assume C++ for tooling-index hook
-            except (OSError, UnicodeDecodeError):
-                pass
+            if first_line.startswith("#!"):
+                if "python" in first_line:
+                    return "python"
+                elif "bash" in first_line or "sh" in first_line:
+                    return "bash"
+                elif "node" in first_line:
+                    return "javascript"
+            # If no shebang, might be a compiled binary
+            return "cpp"  # Assume C++ for tooling-index hook
 
         return "unknown"
 
-    def _read_shebang(self, file_path: Path) -> str:
-        try:
-            with open(file_path, "rb") as f:
-                first_line = f.readline().decode("utf-8", errors="ignore").strip()
-            if first_line.startswith("#!"):
-                return first_line
-        except Exception:
-            return ""
-        return ""
-
     def _detect_trigger_event(self, stem: str) -> str:
         known = ["post_tool_use", "pre_tool_use", "session_start", "session_end"]
         for k in known:
@@ -159,62 +224,61 @@ class HookScanner:
                 return k
         return ""
 
-    def _extract_tool_usage(self, content: str) -> Tuple[Dict[str, List[str]], List[str]]:
-        mcp_tools: List[str] = []
-        composio_tools: List[str] = []
-        core_tools: List[str] = []
-        toolkits: List[str] = []
-
-        for m in re.finditer(r"\bmcp__([a-z0-9_-]+)__([a-z0-9_-]+)\b", content, re.I):
-            full = f"mcp__{m.group(1)}__{m.group(2)}"
-            mcp_tools.append(full)
-            toolkits.append(m.group(1).lower())
-
-        for m in re.finditer(r"run_composio_tool\(\s*['\"]([A-Z0-9_]+)['\"]", content):
-            slug = m.group(1)
-            composio_tools.append(slug)
-            toolkits.append(slug.split("_", 1)[0].lower())
-
-        for m in re.finditer(
-            r"\b(read_file|write_file|apply_patch|exec_command|list_dir)\b", content
-        ):
-            core_tools.append(m.group(1))
-
-        def dedupe(items: List[str]) -> List[str]:
-            seen = set()
-            out: List[str] = []
-            for it in items:
-                if it not in seen:
-                    seen.add(it)
-                    out.append(it)
-            return out
+    def _extract_tool_usage(
+        self, content: str, *, lower: str
+    ) -> Tuple[Dict[str, List[str]], List[str]]:
+        """Find MCP, composio and core tool references.
+
+        Each regex only runs once a substring probe shows it can match. The
+        probes are C-speed scans, while a pattern's leading word boundary keeps
+        the regex engine from using its own literal-prefix search.
+        """
+        # Dicts double as insertion-ordered sets, deduping as matches stream in.
+        mcp_tools: Dict[str, None] = {}
+        composio_tools: Dict[str, None] = {}
+        core_tools: Dict[str, None] = {}
+        toolkits: Dict[str, None] = {}
+
+        if "mcp__" in lower:  # `_MCP_TOOL_RE` is case-insensitive
+            for m in _MCP_TOOL_RE.finditer(content):
+                mcp_tools[f"mcp__{m.group(1)}__{m.group(2)}"] = None
+                toolkits[m.group(1).lower()] = None
+
+        if "run_composio_tool(" in content:
+            for m in _COMPOSIO_RE.finditer(content):
+                slug = m.group(1)
+                composio_tools[slug] = None
+                toolkits[slug.split("_", 1)[0].lower()] = None
+
+        if any(tool in content for tool in _CORE_TOOLS):
+            for m in _CORE_TOOLS_RE.finditer(content):
+                core_tools[m.group(1)] = None
 
         tools: Dict[str, List[str]] = {}
-        mcp_tools = dedupe(mcp_tools)
-        composio_tools = dedupe(composio_tools)
-        core_tools = dedupe(core_tools)
-        toolkits = dedupe([t for t in toolkits if t])
         if core_tools:
-            tools["core_tools"] = core_tools
+            tools["core_tools"] = list(core_tools)
         if mcp_tools:
-            tools["mcp_tools"] = mcp_tools
+            tools["mcp_tools"] = list(mcp_tools)
         if composio_tools:
-            tools["composio_tools"] = composio_tools
-        return tools, toolkits
+            tools["composio_tools"] = list(composio_tools)
+        return tools, [t for t in toolkits if t]
 
     def _extract_required_env_vars(self, content: str) -> List[str]:
         names: List[str] = []
-        for m in re.finditer(r"\$\{([A-Z0-9_]+)\}", content):
-            names.append(m.group(1))
-        for line in content.splitlines():
-            m = re.match(r"^\s*export\s+([A-Z0-9_]+)\s*=", line)
-            if m:
+        if "${" in content:
+            for m in _ENV_BRACE_RE.finditer(content):
                 names.append(m.group(1))
+        if "export" in content:
+            for line in content.splitlines():
+                m = _EXPORT_RE.match(line)
+                if m:
+                    names.append(m.group(1))
         return list(dict.fromkeys(names))[:50]
 
     def _classify_side_effects_and_risk(
-        self, content: str, *, detected_tools: Dict[str, List[str]], toolkits: List[str]
+        self, lower: str, *, detected_tools: Dict[str, List[str]], toolkits: List[str]
     ) -> Tuple[List[str], str]:
+        """Classify side effects and risk; `lower` is the lowercased content."""
         side_effects: List[str] = []
         if "gmail" in toolkits:
             side_effects.append("email")
@@ -227,8 +291,9 @@ class HookScanner:
         if detected_tools.get("core_tools"):
             side_effects.append("filesystem")
 
-        lower = content.lower()
-        destructive = bool(re.search(r"\b(drop|delete|truncate|reset|destroy)\b", lower))
+        destructive = any(word in lower for word in _DESTRUCTIVE_WORDS) and bool(
+            _DESTRUCTIVE_RE.search(lower)
+        )
         if destructive:
             return list(dict.fromkeys(side_effects)), "high"
         if side_effects:
@@ -1,11 +1,56 @@
 """Insights scanner - extracts analytics from `~/.claude/data/insights.db`."""
 
+import os
 import sqlite3
+from contextlib import closing
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from ..models import InsightMetrics
 
+_RECENT_BY_CATEGORY_SQL = " UNION ALL ".join(
+    f"""
+    SELECT * FROM (
+        SELECT category, substr(insight_text, 1, 200)
+        FROM insights
+        WHERE category = '{category}'
+        ORDER BY timestamp DESC
+        LIMIT 10
+    )"""
+    for category in ("warning", "pattern", "tradeoff")
+)
+
+# Rank and limit inside the FTS index first, so only the matching rows are
+# looked up in `insights`.
+_FTS_SEARCH_SQL = """
+    SELECT i.category, i.project_path, i.insight_text, i.timestamp
+    FROM (
+        SELECT rowid, rank
+        FROM insights_fts
+        WHERE insights_fts MATCH ?
+        ORDER BY rank
+        LIMIT ?
+    ) AS fts
+    JOIN insights i ON i.rowid = fts.rowid
+    ORDER BY fts.rank
+"""
+
+_LIKE_SEARCH_SQL = """
+    SELECT category, project_path, insight_text, timestamp
+    FROM insights
+    WHERE insight_text LIKE ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
+
+def _fts_match_expression(query: str) -> str:
+    """Quote each term of `query` so FTS5 syntax characters match literally.
+
+    The quoted terms are still combined with FTS5's implicit AND, as before.
+    """
+    return " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+
 
 class InsightsScanner:
     """Scan insights.db for categorized insights and patterns."""
@@ -14,6 +59,10 @@ class InsightsScanner:
         self.insights_db_path = insights_db_path or (
             Path.home() / ".claude" / "data" / "insights.db"
         )
+        # Read-only connection reused across search_insights() calls, and the
+        # (st_ino, st_mtime_ns) of the database file it was opened on.
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_stamp: Optional[Tuple[int, int]] = None
 
     def scan(self) -> Optional[InsightMetrics]:
         """Scan insights database and extract analytics."""
@@ -23,97 +72,71 @@ class InsightsScanner:
         result = InsightMetrics()
 
         try:
-            conn = sqlite3.connect(str(self.insights_db_path))
-            cursor = conn.cursor()
-
-            # Check if tables exist
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='insights'"
-            )
-            if not cursor.fetchone():
-                conn.close()
-                return None
-
-            # Get total insights count
-            cursor.execute("SELECT COUNT(*) FROM insights")
-            result.total_insights = cursor.fetchone()[0]
-
-            # Get insights by category
-            cursor.execute(
-                """
-                SELECT category, COUNT(*) as count
-                FROM insights
-                GROUP BY category
-                ORDER BY count DESC
-            """
-            )
-            for row in cursor.fetchall():
-                result.by_category[row[0]] = row[1]
-
-            # Get insights by project (top 20)
-            cursor.execute(
-                """
-                SELECT project_path, COUNT(*) as count
-                FROM insights
-                GROUP BY project_path
-                ORDER BY count DESC
-                LIMIT 20
-            """
-            )
-            for row in cursor.fetchall():
-                # Extract project name from path
-                project_path = row[0] or "unknown"
-                project_name = Path(project_path).name if project_path else "unknown"
-                result.by_project[project_name] = row[1]
-
-            # Get processed sessions count
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='processed_sessions'"
-            )
-            if cursor.fetchone():
-                cursor.execute("SELECT COUNT(*) FROM processed_sessions")
-                result.processed_sessions = cursor.fetchone()[0]
-
-            # Get recent warnings (last 10)
-            cursor.execute(
-                """
-                SELECT insight_text
-                FROM insights
-                WHERE category = 'warning'
-                ORDER BY timestamp DESC
-                LIMIT 10
-            """
-            )
-            result.recent_warnings = [
-                row[0][:200]
-                for row in cursor.fetchall()  # Truncate long text
-            ]
+            with closing(sqlite3.connect(str(self.insights_db_path))) as conn:
+                # Read-only, with temp b-trees (GROUP BY / ORDER BY) in memory.
+                conn.execute("PRAGMA query_only = 1")
+                conn.execute("PRAGMA temp_store = MEMORY")
+                conn.execute("PRAGMA cache_size = -8000")
+
+                # Check which tables exist
+                tables = {
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT name FROM sqlite_master WHERE type='table' "
+                        "AND name IN ('insights', 'processed_sessions')"
+                    )
+                }
+                if "insights" not in tables:
+                    return None
+
+                # Get total insights count
+                result.total_insights = conn.execute(
+                    "SELECT COUNT(*) FROM insights"
+                ).fetchone()[0]
+
+                # Get insights by category
+                result.by_category.update(
+                    conn.execute(
+                        """
+                        SELECT category, COUNT(*) as count
+                        FROM insights
+                        GROUP BY category
+                        ORDER BY count DESC
+                    """
+                    )
+                )
 
-            # Get recent patterns (last 10)
-            cursor.execute(
-                """
-                SELECT insight_text
-                FROM insights
-                WHERE category = 'pattern'
-                ORDER BY timestamp DESC
-                LIMIT 10
-            """
-            )
-            result.recent_patterns = [row[0][:200] for row in cursor.fetchall()]
-
-            # Get recent tradeoffs (last 10)
-            cursor.execute(
+                # Get insights by project (top 20)
+                for project_path, count in conn.execute(
+                    """
+                    SELECT project_path, COUNT(*) as count
+                    FROM insights
+                    GROUP BY project_path
+                    ORDER BY count DESC
+                    LIMIT 20
                 """
-                SELECT insight_text
-                FROM insights
-                WHERE category = 'tradeoff'
-                ORDER BY timestamp DESC
-                LIMIT 10
-            """
-            )
-            result.recent_tradeoffs = [row[0][:200] for row in cursor.fetchall()]
-
-            conn.close()
+                ):
+                    # Extract project name from path
+                    project_name = (
+                        Path(project_path).name if project_path else "unknown"
+                    )
+                    result.by_project[project_name] = count
+
+                # Get processed sessions count
+                if "processed_sessions" in tables:
+                    result.processed_sessions = conn.execute(
+                        "SELECT COUNT(*) FROM processed_sessions"
+                    ).fetchone()[0]
+
+                # Get recent warnings, patterns and tradeoffs (last 10 of each)
+                # in one statement; UNION ALL keeps each arm's row order. Long
+                # text is truncated to 200 characters by the query itself.
+                recent = {"warning": [], "pattern": [], "tradeoff": []}
+                for category, text in conn.execute(_RECENT_BY_CATEGORY_SQL):
+                    recent[category].append(text)
+                result.recent_warnings = recent["warning"]
+                result.recent_patterns = recent["pattern"]
+                result.recent_tradeoffs = recent["tradeoff"]
 
         except sqlite3.Error:
             return None
@@ -127,52 +150,64 @@ class InsightsScanner:
 
         results = []
         try:
-            conn = sqlite3.connect(str(self.insights_db_path))
-            cursor = conn.cursor()
+            conn = self._get_conn()
 
             # Check if FTS table exists
-            cursor.execute(
+            has_fts = conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' AND name='insights_fts'"
-            )
-            if cursor.fetchone():
+            ).fetchone()
+            if has_fts:
                 # Use FTS5 search
-                cursor.execute(
-                    """
-                    SELECT i.category, i.project_path, i.insight_text, i.timestamp
-                    FROM insights i
-                    JOIN insights_fts fts ON i.rowid = fts.rowid
-                    WHERE insights_fts MATCH ?
-                    ORDER BY rank
-                    LIMIT ?
-                """,
-                    (query, limit),
+                rows = conn.execute(
+                    _FTS_SEARCH_SQL, (_fts_match_expression(query), limit)
                 )
             else:
                 # Fallback to LIKE search
-                cursor.execute(
-                    """
-                    SELECT category, project_path, insight_text, timestamp
-                    FROM insights
-                    WHERE insight_text LIKE ?
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                """,
-                    (f"%{query}%", limit),
-                )
+                rows = conn.execute(_LIKE_SEARCH_SQL, (f"%{query}%", limit))
 
             results = [
                 {
-                    "category": row[0],
-                    "project": Path(row[1]).name if row[1] else "unknown",
-                    "text": row[2],
-                    "timestamp": row[3],
+                    "category": category,
+                    "project": Path(project_path).name if project_path else "unknown",
+                    "text": text,
+                    "timestamp": timestamp,
                 }
-                for row in cursor.fetchall()
+                for category, project_path, text, timestamp in rows
             ]
 
-            conn.close()
-
-        except sqlite3.Error:
-            pass
+        except (OSError, sqlite3.Error):
+            # Reconnect on the next search in case the handle went bad.
+            self.close()
 
         return results
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Return the read-only search connection, opening it on first use.
+
+        The connection is reopened when the database file is replaced or
+        modified, since an open handle keeps reading the old inode.
+        """
+        st = os.stat(self.insights_db_path)
+        stamp = (st.st_ino, st.st_mtime_ns)
+        if self._conn is not None and self._conn_stamp != stamp:
+            self.close()
+        if self._conn is None:
+            uri = self.insights_db_path.absolute().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            try:
+                conn.execute("PRAGMA mmap_size = 268435456")
+                conn.execute("PRAGMA cache_size = -16000")
+                conn.execute("PRAGMA temp_store = MEMORY")
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._conn = conn
+            self._conn_stamp = stamp
+        return self._conn
+
+    def close(self) -> None:
+        """Close the cached search connection, if one is open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self._conn_stamp = None
@@ -1,18 +1,30 @@
 """MCP scanner - extracts metadata from all MCP sources."""
 
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from ..models import MCPMetadata
+from . import _json
 
 _SENSITIVE_KEY_RE = re.compile(
     r"(?i)(token|secret|password|api[_-]?key|bearer|authorization|auth|cookie)"
 )
 _HEX_TOKEN_RE = re.compile(r"(?i)^[0-9a-f]{32,}$")
 _B64_TOKEN_RE = re.compile(r"^[A-Za-z0-9+/=_-]{32,}$")
+_GIT_REMOTE_HEADER_RE = re.compile(r'^\s*\[remote\s+"([^"]+)"\]\s*$')
+_GIT_URL_RE = re.compile(r"^\s*url\s*=\s*(.+)\s*$")
+
+_PLUGIN_ROOT_VAR = "${CLAUDE_PLUGIN_ROOT}"
+
+# A few plugin config files are cheaper to read serially than to spin up a
+# pool for.
+_PARALLEL_MIN_FILES = 8
+_MAX_WORKERS = 8
 
 
 def _redact_env_vars(env: dict) -> dict:
@@ -95,11 +107,11 @@ def _find_git_remote(path: Path) -> Optional[str]:
                 current_remote = None
                 remotes = {}
                 for line in text.splitlines():
-                    m = re.match(r'^\s*\[remote\s+"([^"]+)"\]\s*$', line)
+                    m = _GIT_REMOTE_HEADER_RE.match(line)
                     if m:
                         current_remote = m.group(1)
                         continue
-                    m2 = re.match(r"^\s*url\s*=\s*(.+)\s*$", line)
+                    m2 = _GIT_URL_RE.match(line)
                     if m2 and current_remote:
                         remotes[current_remote] = m2.group(1).strip()
                         continue
@@ -119,6 +131,52 @@ def _find_git_remote(path: Path) -> Optional[str]:
     return None
 
 
+def _resolve_plugin_vars(config: dict, plugin_root: str) -> dict:
+    """Resolve `${CLAUDE_PLUGIN_ROOT}` variables in config.
+
+    Containers without the variable are returned as-is rather than copied.
+    """
+    resolved = None
+    for key, value in config.items():
+        new_value = value
+        if isinstance(value, str):
+            if _PLUGIN_ROOT_VAR in value:
+                new_value = value.replace(_PLUGIN_ROOT_VAR, plugin_root)
+        elif isinstance(value, list):
+            if any(isinstance(v, str) and _PLUGIN_ROOT_VAR in v for v in value):
+                new_value = [
+                    v.replace(_PLUGIN_ROOT_VAR, plugin_root)
+                    if isinstance(v, str)
+                    else v
+                    for v in value
+                ]
+        elif isinstance(value, dict):
+            new_value = _resolve_plugin_vars(value, plugin_root)
+
+        if new_value is not value:
+            if resolved is None:
+                resolved = dict(config)
+            resolved[key] = new_value
+    return config if resolved is None else resolved
+
+
+def _read_json_file(path: Path) -> Optional[Any]:
+    """Read and parse a JSON file; None if it is unreadable or invalid."""
+    try:
+        return _json.loads(path.read_bytes())
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def _subdirs(path: str) -> List[str]:
+    """List the subdirectories of `path` (following symlinks); [] if unreadable."""
+    try:
+        with os.scandir(path) as entries:
+            return [entry.path for entry in entries if entry.is_dir()]
+    except OSError:
+        return []
+
+
 class MCPScanner:
     """Scan MCP server configurations from all sources.
 
@@ -134,12 +192,24 @@ class MCPScanner:
         self.claude_home = Path.home() / ".claude"
         self.plugins_cache = self.claude_home / "plugins" / "cache"
         self.redact_env = True
+        # Parsed ~/.claude.json, shared by the user and project sub-scans and
+        # reused by later scans while its (mtime_ns, size) stamp is unchanged.
+        self._claude_json: Optional[dict] = None
+        self._claude_json_stamp: Optional[Tuple[int, int]] = None
+        self._claude_json_loaded = False
+        # Config file mtimes; every server in a file shares the file's mtime.
+        self._mtimes: Dict[Path, Optional[datetime]] = {}
 
     def scan(self) -> List[MCPMetadata]:
         """Scan MCP servers from all config locations."""
         mcps = []
         seen_names = set()
 
+        # Re-check ~/.claude.json and re-stat config files on every scan; they
+        # may have changed since.
+        self._claude_json_loaded = False
+        self._mtimes = {}
+
         # 1. Scan user-level MCPs from ~/.claude.json
         mcps.extend(self._scan_user_mcps(seen_names))
 
@@ -161,46 +231,114 @@ class MCPScanner:
         """Detect built-in MCPs like `claude-in-chrome`."""
         mcps = []
 
-        # Check for Claude-in-Chrome extension
+        # Check for Claude-in-Chrome extension (the set lookup is cheaper than
+        # the stat, so it goes first)
         chrome_host = self.claude_home / "chrome" / "chrome-native-host"
-        if chrome_host.exists():
-            name = "claude-in-chrome"
-            if name not in seen_names:
-                seen_names.add(name)
-                mcps.append(
-                    MCPMetadata(
-                        name=name,
-                        origin="official",
-                        status="active",
-                        last_modified=datetime.fromtimestamp(
-                            chrome_host.stat().st_mtime
-                        ),
-                        install_path=chrome_host,
-                        command="chrome-extension",
-                        args=[],
-                        env_vars={},
-                        transport="native-messaging",
-                        source="builtin",
-                        source_detail=f"detected:{_pretty_path(chrome_host)}",
-                        git_remote=None,
-                    )
+        name = "claude-in-chrome"
+        if name not in seen_names and chrome_host.exists():
+            seen_names.add(name)
+            mcps.append(
+                MCPMetadata(
+                    name=name,
+                    origin="official",
+                    status="active",
+                    last_modified=datetime.fromtimestamp(chrome_host.stat().st_mtime),
+                    install_path=chrome_host,
+                    command="chrome-extension",
+                    args=[],
+                    env_vars={},
+                    transport="native-messaging",
+                    source="builtin",
+                    source_detail=f"detected:{_pretty_path(chrome_host)}",
+                    git_remote=None,
                 )
+            )
 
         return mcps
 
+    def _load_claude_json(self) -> Optional[dict]:
+        """Return parsed `~/.claude.json`; None if missing or unreadable.
+
+        The file is checked once per scan and only re-parsed when it changed.
+        """
+        if self._claude_json_loaded:
+            return self._claude_json
+        self._claude_json_loaded = True
+
+        try:
+            with open(self.claude_json_path, "rb") as f:
+                st = os.fstat(f.fileno())
+                stamp = (st.st_mtime_ns, st.st_size)
+                if stamp == self._claude_json_stamp:
+                    return self._claude_json
+                data = _json.loads(f.read())
+        except (json.JSONDecodeError, OSError):
+            # Includes FileNotFoundError, so no separate exists() check.
+            data, stamp = None, None
+
+        self._claude_json, self._claude_json_stamp = data, stamp
+        return data
+
     def _scan_user_mcps(self, seen_names: set) -> List[MCPMetadata]:
         """Scan user-level MCPs from `~/.claude.json` -> `mcpServers`."""
         mcps = []
 
-        if not self.claude_json_path.exists():
+        data = self._load_claude_json()
+        if data is None:
             return mcps
 
-        try:
-            with open(self.claude_json_path, "r") as f:
-                data = json.load(f)
+        active_servers = data.get("mcpServers", {}) or {}
+        disabled_servers = data.get("mcpServersDisabled", {}) or {}
+        pretty_path = _pretty_path(self.claude_json_path)
 
-            active_servers = data.get("mcpServers", {}) or {}
-            disabled_servers = data.get("mcpServersDisabled", {}) or {}
+        for status, mcp_servers in [
+            ("active", active_servers),
+            ("disabled", disabled_servers),
+        ]:
+            if not isinstance(mcp_servers, dict):
+                continue
+            detail_prefix = (
+                f"{pretty_path}:"
+                f"{'mcpServers' if status == 'active' else 'mcpServersDisabled'}."
+            )
+            for name, config in mcp_servers.items():
+                if name in seen_names:
+                    continue
+                seen_names.add(name)
+
+                mcp = self._parse_mcp_config(
+                    name,
+                    config,
+                    self.claude_json_path,
+                    "user",
+                    status=status,
+                    source_detail=f"{detail_prefix}{name}",
+                )
+                if mcp:
+                    mcps.append(mcp)
+
+        return mcps
+
+    def _scan_project_mcps(self, seen_names: set) -> List[MCPMetadata]:
+        """Scan project-specific MCPs from `projects.<path>.mcpServers`."""
+        mcps = []
+
+        data = self._load_claude_json()
+        if data is None:
+            return mcps
+
+        projects = data.get("projects", {})
+
+        # Look for MCPs specific to ~/.claude directory
+        project_key = str(self.claude_home)
+        if project_key in projects:
+            project_config = projects[project_key]
+            active_servers = project_config.get("mcpServers", {}) or {}
+            disabled_servers = project_config.get("mcpServersDisabled", {}) or {}
+            project_detail = (
+                f"{_pretty_path(self.claude_json_path)}:"
+                f'projects["{_pretty_path(Path(project_key))}"].'
+            )
 
             for status, mcp_servers in [
                 ("active", active_servers),
@@ -208,6 +346,10 @@ class MCPScanner:
             ]:
                 if not isinstance(mcp_servers, dict):
                     continue
+                detail_prefix = (
+                    f"{project_detail}"
+                    f"{'mcpServers' if status == 'active' else 'mcpServersDisabled'}."
+                )
                 for name, config in mcp_servers.items():
                     if name in seen_names:
                         continue
@@ -217,157 +359,113 @@ class MCPScanner:
                         name,
                         config,
                         self.claude_json_path,
-                        "user",
+                        "local",
                         status=status,
-                        source_detail=(
-                            f"{_pretty_path(self.claude_json_path)}:"
-                            f"{'mcpServers' if status == 'active' else 'mcpServersDisabled'}."
-                            f"{name}"
-                        ),
+                        source_detail=f"{detail_prefix}{name}",
                     )
                     if mcp:
                         mcps.append(mcp)
 
-        except (json.JSONDecodeError, OSError):
-            pass
-
-        return mcps
-
-    def _scan_project_mcps(self, seen_names: set) -> List[MCPMetadata]:
-        """Scan project-specific MCPs from `projects.<path>.mcpServers`."""
-        mcps = []
-
-        if not self.claude_json_path.exists():
-            return mcps
-
-        try:
-            with open(self.claude_json_path, "r") as f:
-                data = json.load(f)
-
-            projects = data.get("projects", {})
-
-            # Look for MCPs specific to ~/.claude directory
-            project_key = str(self.claude_home)
-            if project_key in projects:
-                project_config = projects[project_key]
-                active_servers = project_config.get("mcpServers", {}) or {}
-                disabled_servers = project_config.get("mcpServersDisabled", {}) or {}
-
-                for status, mcp_servers in [
-                    ("active", active_servers),
-                    ("disabled", disabled_servers),
-                ]:
-                    if not isinstance(mcp_servers, dict):
-                        continue
-                    for name, config in mcp_servers.items():
-                        if name in seen_names:
-                            continue
-                        seen_names.add(name)
-
-                        mcp = self._parse_mcp_config(
-                            name,
-                            config,
-                            self.claude_json_path,
-                            "local",
-                            status=status,
-                            source_detail=(
-                                f"{_pretty_path(self.claude_json_path)}:"
-                                f'projects["{_pretty_path(Path(project_key))}"].'
-                                f"{'mcpServers' if status == 'active' else 'mcpServersDisabled'}."
-                                f"{name}"
-                            ),
-                        )
-                        if mcp:
-                            mcps.append(mcp)
-
-        except (json.JSONDecodeError, OSError):
-            pass
-
         return mcps
 
     def _scan_plugin_mcps(self, seen_names: set) -> List[MCPMetadata]:
         """Scan plugin-provided MCPs from plugin.json and .mcp.json files."""
         mcps = []
 
-        if not self.plugins_cache.exists():
-            return mcps
-
-        # Scan .mcp.json files (primary location for plugin MCPs)
-        for mcp_json in self.plugins_cache.glob("*/*/.mcp.json"):
-            mcps.extend(self._parse_mcp_json_file(mcp_json, seen_names))
-
-        for mcp_json in self.plugins_cache.glob("*/*/*/.mcp.json"):
-            mcps.extend(self._parse_mcp_json_file(mcp_json, seen_names))
-
-        # Also scan plugin.json for mcpServers (alternate location)
-        for plugin_json in self.plugins_cache.glob("*/*/.claude-plugin/plugin.json"):
-            try:
-                with open(plugin_json, "r") as f:
-                    plugin_data = json.load(f)
+        # A missing plugin cache simply yields no config files.
+        configs = list(self._iter_plugin_config_files())
+        paths = [path for path, _ in configs]
+        if len(paths) >= _PARALLEL_MIN_FILES:
+            # The reads and parses are independent; overlap them. seen_names is
+            # only touched below, on this thread, in the original order.
+            with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+                documents = list(executor.map(_read_json_file, paths))
+        else:
+            documents = [_read_json_file(path) for path in paths]
 
-                plugin_name = plugin_data.get("name", plugin_json.parent.parent.name)
-                mcp_servers = plugin_data.get("mcpServers", {})
+        for (path, kind), data in zip(configs, documents):
+            if data is None:
+                continue
+            if kind == "mcp":
+                mcps.extend(self._parse_mcp_json_file(path, data, seen_names))
+            else:
+                mcps.extend(self._parse_plugin_json_file(path, data, seen_names))
 
-                for mcp_name, config in mcp_servers.items():
-                    # Plugin MCPs use format "plugin:<plugin>:<mcp>"
-                    full_name = f"plugin:{plugin_name}:{mcp_name}"
+        return mcps
 
-                    if full_name in seen_names:
+    def _iter_plugin_config_files(self) -> Iterator[Tuple[Path, str]]:
+        """Find plugin MCP config files in one walk of the plugin cache.
+
+        Yields `(path, kind)` with kind "mcp" for `.mcp.json` and "plugin" for
+        `.claude-plugin/plugin.json`, at `<marketplace>/<plugin>/` and
+        `<marketplace>/<plugin>/<version>/` depth. All `.mcp.json` files come
+        before all plugin.json files, shallow before versioned, since the first
+        definition of a server name wins.
+        """
+        buckets: Tuple[List[Path], ...] = ([], [], [], [])
+
+        def collect(dir_path: str, depth: int) -> List[str]:
+            # Record config files in `dir_path`; return its subdirectories.
+            subdirs = []
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.name == ".mcp.json":
+                        buckets[depth].append(Path(entry.path))
+                    elif entry.is_dir():
+                        if entry.name == ".claude-plugin":
+                            plugin_json = os.path.join(entry.path, "plugin.json")
+                            if os.path.exists(plugin_json):
+                                buckets[2 + depth].append(Path(plugin_json))
+                        subdirs.append(entry.path)
+            return subdirs
+
+        for marketplace in _subdirs(str(self.plugins_cache)):
+            for plugin in _subdirs(marketplace):
+                try:
+                    versions = collect(plugin, 0)
+                except OSError:
+                    continue
+                for version in versions:
+                    try:
+                        collect(version, 1)
+                    except OSError:
                         continue
-                    seen_names.add(full_name)
 
-                    # Resolve ${CLAUDE_PLUGIN_ROOT} in args
-                    plugin_root = plugin_json.parent.parent
-                    config = self._resolve_plugin_vars(config, plugin_root)
+        for i, kind in enumerate(("mcp", "mcp", "plugin", "plugin")):
+            for path in buckets[i]:
+                yield path, kind
 
-                    mcp = self._parse_mcp_config(
-                        full_name,
-                        config,
-                        plugin_json,
-                        "plugin",
-                        source_detail=(
-                            f"{_pretty_path(plugin_json)}:mcpServers.{mcp_name}"
-                        ),
-                    )
-                    if mcp:
-                        mcps.append(mcp)
-
-            except (json.JSONDecodeError, OSError):
-                continue
-
-        # Also scan versioned plugin directories
-        for plugin_json in self.plugins_cache.glob("*/*/*/.claude-plugin/plugin.json"):
-            try:
-                with open(plugin_json, "r") as f:
-                    plugin_data = json.load(f)
-
-                plugin_name = plugin_data.get("name", plugin_json.parent.parent.name)
-                mcp_servers = plugin_data.get("mcpServers", {})
+    def _parse_plugin_json_file(
+        self, plugin_json: Path, plugin_data: dict, seen_names: set
+    ) -> List[MCPMetadata]:
+        """Build MCPs from the parsed `mcpServers` of a plugin's plugin.json."""
+        mcps = []
 
-                for mcp_name, config in mcp_servers.items():
-                    full_name = f"plugin:{plugin_name}:{mcp_name}"
+        plugin_name = plugin_data.get("name", plugin_json.parent.parent.name)
+        mcp_servers = plugin_data.get("mcpServers", {})
+        plugin_root = str(plugin_json.parent.parent)
+        pretty_path = _pretty_path(plugin_json)
 
-                    if full_name in seen_names:
-                        continue
-                    seen_names.add(full_name)
+        for mcp_name, config in mcp_servers.items():
+            # Plugin MCPs use format "plugin:<plugin>:<mcp>"
+            full_name = f"plugin:{plugin_name}:{mcp_name}"
 
-                    plugin_root = plugin_json.parent.parent
-                    config = self._resolve_plugin_vars(config, plugin_root)
+            if full_name in seen_names:
+                continue
+            seen_names.add(full_name)
 
-                    mcp = self._parse_mcp_config(
-                        full_name,
-                        config,
-                        plugin_json,
-                        "plugin",
-                        source_detail=(
-                            f"{_pretty_path(plugin_json)}:mcpServers.{mcp_name}"
-                        ),
-                    )
-                    if mcp:
-                        mcps.append(mcp)
+            # Resolve ${CLAUDE_PLUGIN_ROOT} in args
+            config = _resolve_plugin_vars(config, plugin_root)
 
-            except (json.JSONDecodeError, OSError):
-                continue
+            mcp = self._parse_mcp_config(
+                full_name,
+                config,
+                plugin_json,
+                "plugin",
+                source_detail=f"{pretty_path}:mcpServers.{mcp_name}",
+            )
+            if mcp:
+                mcps.append(mcp)
 
         return mcps
 
@@ -375,15 +473,12 @@ class MCPScanner:
         """Scan legacy `~/.claude/mcp.json`."""
         mcps = []
 
-        if not self.mcp_json_path.exists():
-            return mcps
-
         try:
-            with open(self.mcp_json_path, "r") as f:
-                data = json.load(f)
+            data = _json.loads(self.mcp_json_path.read_bytes())
 
             active_servers = data.get("mcpServers", {}) or {}
             disabled_servers = data.get("mcpServersDisabled", {}) or {}
+            pretty_path = _pretty_path(self.mcp_json_path)
 
             for status, mcp_servers in [
                 ("active", active_servers),
@@ -391,6 +486,10 @@ class MCPScanner:
             ]:
                 if not isinstance(mcp_servers, dict):
                     continue
+                detail_prefix = (
+                    f"{pretty_path}:"
+                    f"{'mcpServers' if status == 'active' else 'mcpServersDisabled'}."
+                )
                 for name, config in mcp_servers.items():
                     if name in seen_names:
                         continue
@@ -402,11 +501,7 @@ class MCPScanner:
                         self.mcp_json_path,
                         "legacy",
                         status=status,
-                        source_detail=(
-                            f"{_pretty_path(self.mcp_json_path)}:"
-                            f"{'mcpServers' if status == 'active' else 'mcpServersDisabled'}."
-                            f"{name}"
-                        ),
+                        source_detail=f"{detail_prefix}{name}",
                     )
                     if mcp:
                         mcps.append(mcp)
@@ -417,64 +512,39 @@ class MCPScanner:
         return mcps
 
     def _parse_mcp_json_file(
-        self, mcp_json: Path, seen_names: set
+        self, mcp_json: Path, mcp_data: dict, seen_names: set
     ) -> List[MCPMetadata]:
-        """Parse a `.mcp.json` file for MCP definitions."""
+        """Build MCPs from the parsed contents of a `.mcp.json` file."""
         mcps = []
 
-        try:
-            with open(mcp_json, "r") as f:
-                mcp_data = json.load(f)
-
-            # Get plugin name from directory structure
-            # Path: cache/<marketplace>/<plugin>/<version>/.mcp.json
-            plugin_name = mcp_json.parent.parent.name
+        # Get plugin name from directory structure
+        # Path: cache/<marketplace>/<plugin>/<version>/.mcp.json
+        plugin_name = mcp_json.parent.parent.name
+        plugin_root = str(mcp_json.parent)
+        pretty_path = _pretty_path(mcp_json)
 
-            for mcp_name, config in mcp_data.items():
-                full_name = f"plugin:{plugin_name}:{mcp_name}"
+        for mcp_name, config in mcp_data.items():
+            full_name = f"plugin:{plugin_name}:{mcp_name}"
 
-                if full_name in seen_names:
-                    continue
-                seen_names.add(full_name)
+            if full_name in seen_names:
+                continue
+            seen_names.add(full_name)
 
-                # Resolve ${CLAUDE_PLUGIN_ROOT}
-                plugin_root = mcp_json.parent
-                config = self._resolve_plugin_vars(config, plugin_root)
+            # Resolve ${CLAUDE_PLUGIN_ROOT}
+            config = _resolve_plugin_vars(config, plugin_root)
 
-                mcp = self._parse_mcp_config(
-                    full_name,
-                    config,
-                    mcp_json,
-                    "plugin",
-                    source_detail=f"{_pretty_path(mcp_json)}:{mcp_name}",
-                )
-                if mcp:
-                    mcps.append(mcp)
-
-        except (json.JSONDecodeError, OSError):
-            pass
+            mcp = self._parse_mcp_config(
+                full_name,
+                config,
+                mcp_json,
+                "plugin",
+                source_detail=f"{pretty_path}:{mcp_name}",
+            )
+            if mcp:
+                mcps.append(mcp)
 
         return mcps
 
-    def _resolve_plugin_vars(self, config: dict, plugin_root: Path) -> dict:
-        """Resolve `${CLAUDE_PLUGIN_ROOT}` variables in config."""
-        resolved = {}
-        for key, value in config.items():
-            if isinstance(value, str):
-                resolved[key] = value.replace("${CLAUDE_PLUGIN_ROOT}", str(plugin_root))
-            elif isinstance(value, list):
-                resolved[key] = [
-                    v.replace("${CLAUDE_PLUGIN_ROOT}", str(plugin_root))
-                    if isinstance(v, str)
-                    else v
-                    for v in value
-                ]
-            elif isinstance(value, dict):
-                resolved[key] = self._resolve_plugin_vars(value, plugin_root)
-            else:
-                resolved[key] = value
-        return resolved
-
     def _parse_mcp_config(
         self,
         name: str,
@@ -488,6 +558,9 @@ class MCPScanner:
         """Parse a single MCP server configuration."""
         command = config.get("command", config.get("url", ""))
         args = config.get("args", [])
+        if isinstance(args, list):
+            # The parsed ~/.claude.json outlives this scan; don't share its lists.
+            args = list(args)
         env_vars = config.get("env", {})
         transport = config.get("transport", config.get("type", "stdio"))
         config_extra = {}
@@ -511,16 +584,17 @@ class MCPScanner:
 
         env_vars_safe = {}
         if isinstance(env_vars, dict):
-            env_vars_safe = _redact_env_vars(env_vars) if self.redact_env else env_vars
+            env_vars_safe = (
+                _redact_env_vars(env_vars) if self.redact_env else dict(env_vars)
+            )
 
-        try:
-            last_modified = datetime.fromtimestamp(config_path.stat().st_mtime)
-        except OSError:
-            last_modified = datetime.now()
+        last_modified = self._config_mtime(config_path) or datetime.now()
 
         # Install path
         if command and not command.startswith("http"):
-            install_path = Path(command).expanduser()
+            install_path = Path(command)
+            if command.startswith("~"):
+                install_path = install_path.expanduser()
         else:
             install_path = config_path
 
@@ -542,6 +616,21 @@ class MCPScanner:
             config_extra=config_extra,
         )
 
+    def _config_mtime(self, config_path: Path) -> Optional[datetime]:
+        """Return the mtime of `config_path`, stat'ing each file once per scan."""
+        try:
+            return self._mtimes[config_path]
+        except KeyError:
+            pass
+        try:
+            mtime: Optional[datetime] = datetime.fromtimestamp(
+                config_path.stat().st_mtime
+            )
+        except OSError:
+            mtime = None
+        self._mtimes[config_path] = mtime
+        return mtime
+
     def _detect_origin(self, name: str, command: str, source: str) -> str:
         """Detect MCP origin from name, command, and source."""
         name_lower = name.lower()
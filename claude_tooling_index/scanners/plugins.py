@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from ..models import PluginMetadata
+from . import _json
 
 
 class PluginScanner:
@@ -26,8 +27,7 @@ class PluginScanner:
         cache_index = self._scan_plugin_cache()
 
         try:
-            with open(self.installed_plugins_file, "r") as f:
-                data = json.load(f)
+            data = _json.loads(self.installed_plugins_file.read_bytes())
 
             # Handle both v1 and v2 format
             version = data.get("version", 1)
@@ -186,7 +186,7 @@ class PluginScanner:
 
         for plugin_json in plugin_json_paths:
             try:
-                data = json.loads(plugin_json.read_text())
+                data = _json.loads(plugin_json.read_bytes())
             except Exception:
                 continue
 
@@ -248,7 +248,7 @@ class PluginScanner:
         )
         for mcp_json in mcp_json_paths:
             try:
-                data = json.loads(mcp_json.read_text())
+                data = _json.loads(mcp_json.read_bytes())
             except Exception:
                 continue
             if not isinstance(data, dict):
@@ -917,26 +917,26 @@ class SkillScanner:
 
     def _extract_tool_usage(self, content: str) -> Tuple[Dict[str, List[str]], List[str]]:
         """Detect common tool usage patterns from code blocks and inline text."""
-        mcp_tools: List[str] = []
-        composio_tools: List[str] = []
-        toolkits: List[str] = []
+        # Dicts double as insertion-ordered sets, deduping as matches stream in.
+        mcp_tools: Dict[str, None] = {}
+        composio_tools: Dict[str, None] = {}
+        toolkits: Dict[str, None] = {}
 
         blocks = self._extract_code_blocks(content)
         haystacks = blocks + [content]
 
         for text in haystacks:
             for m in re.finditer(r"\bmcp__([a-z0-9_-]+)__([a-z0-9_-]+)\b", text, re.I):
-                full = f"mcp__{m.group(1)}__{m.group(2)}"
-                mcp_tools.append(full)
-                toolkits.append(m.group(1).lower())
+                mcp_tools[f"mcp__{m.group(1)}__{m.group(2)}"] = None
+                toolkits[m.group(1).lower()] = None
 
             # run_composio_tool("GMAIL_SEND_EMAIL", {...})
             for m in re.finditer(
                 r"run_composio_tool\(\s*['\"]([A-Z0-9_]+)['\"]", text
             ):
                 slug = m.group(1)
-                composio_tools.append(slug)
-                toolkits.append(slug.split("_", 1)[0].lower())
+                composio_tools[slug] = None
+                toolkits[slug.split("_", 1)[0].lower()] = None
 
             # run_composio_tool(tool_slug="GMAIL_SEND_EMAIL", ...)
             for m in re.finditer(
@@ -944,29 +944,16 @@ class SkillScanner:
                 text,
             ):
                 slug = m.group(1)
-                composio_tools.append(slug)
-                toolkits.append(slug.split("_", 1)[0].lower())
-
-        def dedupe(items: List[str]) -> List[str]:
-            seen = set()
-            out: List[str] = []
-            for it in items:
-                if it not in seen:
-                    seen.add(it)
-                    out.append(it)
-            return out
+                composio_tools[slug] = None
+                toolkits[slug.split("_", 1)[0].lower()] = None
 
         tools: Dict[str, List[str]] = {}
-        mcp_tools = dedupe(mcp_tools)
-        composio_tools = dedupe(composio_tools)
-        toolkits = dedupe([t for t in toolkits if t])
-
         if mcp_tools:
-            tools["mcp_tools"] = mcp_tools
+            tools["mcp_tools"] = list(mcp_tools)
         if composio_tools:
-            tools["composio_tools"] = composio_tools
+            tools["composio_tools"] = list(composio_tools)
 
-        return tools, toolkits
+        return tools, [t for t in toolkits if t]
 
     def _extract_markdown_sections(self, content: str) -> List[Tuple[str, str]]:
         """Extract (heading, body) pairs for ##/### headings."""
@@ -1,13 +1,24 @@
 """Transcript scanner - extracts token economics and tool usage from JSONL files."""
 
 import json
+import multiprocessing
 import os
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from ..models import TranscriptMetrics
 
+_ASSISTANT_MARKER = b'"assistant"'
+
+# Below this many transcripts, worker start-up costs more than it saves.
+_PARALLEL_MIN_FILES = 256
+_MAX_WORKERS = 8
+
+_BatchTotals = Tuple[Counter, Counter, int, int, int, int]
+
 
 class TranscriptScanner:
     """Scan project JSONL transcript files for analytics."""
@@ -18,108 +29,139 @@ class TranscriptScanner:
     def scan(self, sample_limit: int = 500) -> Optional[TranscriptMetrics]:
         """Scan transcript files and extract metrics.
 
+        Large transcript sets are parsed across worker processes.
+
         Args:
             sample_limit: Max files to scan (for performance). 0 = all files.
         """
         if not self.projects_dir.exists():
             return None
 
-        result = TranscriptMetrics()
-        tool_counter = Counter()
-        model_counter = Counter()
-        total_input_tokens = 0
-        total_output_tokens = 0
-        total_cache_read = 0
-        total_cache_create = 0
-        file_count = 0
-
         try:
-            # Iterate project directories
-            for entry in os.scandir(self.projects_dir):
-                if not entry.is_dir():
-                    continue
-
-                project_dir = Path(entry.path)
-
-                for jsonl_file in project_dir.glob("*.jsonl"):
-                    if sample_limit > 0 and file_count >= sample_limit:
-                        break
-
-                    file_count += 1
-                    result.total_transcripts += 1
-
-                    # Process file
-                    file_tokens = self._process_file(
-                        jsonl_file, tool_counter, model_counter
-                    )
-                    total_input_tokens += file_tokens["input"]
-                    total_output_tokens += file_tokens["output"]
-                    total_cache_read += file_tokens["cache_read"]
-                    total_cache_create += file_tokens["cache_create"]
-
-                if sample_limit > 0 and file_count >= sample_limit:
-                    break
-
+            paths = self._find_transcripts(sample_limit)
         except OSError:
             return None
 
-        # Populate results
-        result.tool_usage = dict(tool_counter)
-        result.model_usage = dict(model_counter)
-        result.top_tools = tool_counter.most_common(20)
-        result.total_input_tokens = total_input_tokens
-        result.total_output_tokens = total_output_tokens
-        result.total_cache_read_tokens = total_cache_read
-        result.total_cache_creation_tokens = total_cache_create
-
-        return result
-
-    def _process_file(
-        self, jsonl_file: Path, tool_counter: Counter, model_counter: Counter
-    ) -> dict:
-        """Process a single JSONL file and return token counts."""
-        tokens = {"input": 0, "output": 0, "cache_read": 0, "cache_create": 0}
+        tool_counter: Counter = Counter()
+        model_counter: Counter = Counter()
+        totals = [0, 0, 0, 0]
+        for tools, models, *tokens in self._aggregate(paths):
+            tool_counter.update(tools)
+            model_counter.update(models)
+            for i, value in enumerate(tokens):
+                totals[i] += value
 
+        # Populate results
+        return TranscriptMetrics(
+            total_transcripts=len(paths),
+            total_input_tokens=totals[0],
+            total_output_tokens=totals[1],
+            total_cache_read_tokens=totals[2],
+            total_cache_creation_tokens=totals[3],
+            tool_usage=dict(tool_counter),
+            model_usage=dict(model_counter),
+            top_tools=tool_counter.most_common(20),
+        )
+
+    def _find_transcripts(self, sample_limit: int) -> List[str]:
+        """List `<project>/*.jsonl` files, stopping at `sample_limit` when set."""
+        paths: List[str] = []
+
+        # Iterate project directories
+        for entry in os.scandir(self.projects_dir):
+            if not entry.is_dir():
+                continue
+
+            for jsonl_file in Path(entry.path).glob("*.jsonl"):
+                if sample_limit > 0 and len(paths) >= sample_limit:
+                    return paths
+                paths.append(str(jsonl_file))
+
+        return paths
+
+    def _aggregate(self, paths: List[str]) -> List[_BatchTotals]:
+        """Reduce transcript files to per-batch totals, in parallel when worth it."""
+        workers = min(os.cpu_count() or 1, _MAX_WORKERS)
+        if len(paths) < _PARALLEL_MIN_FILES or workers < 2:
+            return [_reduce_transcript_batch(paths)]
+
+        # Contiguous batches, merged in order, see tools and models in the same
+        # order as a serial pass; most_common() breaks count ties by that order.
+        size = -(-len(paths) // workers)
+        batches = [paths[i : i + size] for i in range(0, len(paths), size)]
         try:
-            with open(jsonl_file, "r") as f:
-                for line in f:
-                    try:
-                        data = json.loads(line)
-                        self._process_line(data, tool_counter, model_counter, tokens)
-                    except json.JSONDecodeError:
-                        continue
-        except IOError:
-            pass
-
-        return tokens
-
-    def _process_line(
-        self, data: dict, tool_counter: Counter, model_counter: Counter, tokens: dict
-    ):
-        """Process a single JSONL line."""
-        msg_type = data.get("type")
-
-        if msg_type == "assistant" and "message" in data:
-            msg = data["message"]
-
-            # Track model usage
-            model = msg.get("model")
-            if model:
-                model_counter[model] += 1
-
-            # Extract token usage
-            if "usage" in msg:
-                usage = msg["usage"]
-                tokens["input"] += usage.get("input_tokens", 0)
-                tokens["output"] += usage.get("output_tokens", 0)
-                tokens["cache_read"] += usage.get("cache_read_input_tokens", 0)
-                tokens["cache_create"] += usage.get("cache_creation_input_tokens", 0)
-
-            # Track tool usage
-            content = msg.get("content", [])
-            if isinstance(content, list):
-                for item in content:
-                    if isinstance(item, dict) and item.get("type") == "tool_use":
-                        tool_name = item.get("name")
-                        if tool_name:
-                            tool_counter[tool_name] += 1
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                return list(executor.map(_reduce_transcript_batch, batches))
+        except (OSError, BrokenProcessPool):
+            # Process pools can be unavailable (sandboxes, frozen apps).
+            return [_reduce_transcript_batch(paths)]
+
+
+def _reduce_transcript_batch(paths: List[str]) -> _BatchTotals:
+    """Aggregate a batch of transcript files (picklable for worker processes)."""
+    tool_counter: Counter = Counter()
+    model_counter: Counter = Counter()
+    totals = [0, 0, 0, 0]
+    for path in paths:
+        tokens = _scan_transcript_file(path, tool_counter, model_counter)
+        for i, value in enumerate(tokens):
+            totals[i] += value
+    return (tool_counter, model_counter, totals[0], totals[1], totals[2], totals[3])
+
+
+def _scan_transcript_file(
+    jsonl_file: str, tool_counter: Counter, model_counter: Counter
+) -> Tuple[int, int, int, int]:
+    """Process a single JSONL file and return its token counts.
+
+    Returns:
+        `(input, output, cache_read, cache_create)` token totals.
+    """
+    input_tokens = output_tokens = cache_read = cache_create = 0
+
+    try:
+        with open(jsonl_file, "rb") as f:
+            for line in f:
+                # Only assistant messages carry model, usage and tool data.
+                # Skip user/tool-result lines (often the bulk of the file)
+                # without parsing them.
+                if _ASSISTANT_MARKER not in line:
+                    continue
+                try:
+                    data = json.loads(line)
+                except ValueError:  # JSONDecodeError or bad UTF-8
+                    continue
+                if not isinstance(data, dict) or data.get("type") != "assistant":
+                    continue
+
+                msg = data.get("message")
+                if not isinstance(msg, dict):
+                    continue
+
+                # Track model usage
+                model = msg.get("model")
+                if model:
+                    model_counter[model] += 1
+
+                # Extract token usage
+                usage = msg.get("usage")
+                if usage:
+                    input_tokens += usage.get("input_tokens", 0)
+                    output_tokens += usage.get("output_tokens", 0)
+                    cache_read += usage.get("cache_read_input_tokens", 0)
+                    cache_create += usage.get("cache_creation_input_tokens", 0)
+
+                # Track tool usage
+                content = msg.get("content")
+                if isinstance(content, list):
+                    for item in content:
+                        if isinstance(item, dict) and item.get("type") == "tool_use":
+                            tool_name = item.get("name")
+                            if tool_name:
+                                tool_counter[tool_name] += 1
+    except IOError:
+        pass
+
+    return input_tokens, output_tokens, cache_read, cache_create
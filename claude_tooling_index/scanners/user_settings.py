@@ -1,7 +1,9 @@
 """User settings scanner - extracts metadata from `~/.claude.json`."""
 
+import heapq
 import json
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
@@ -56,6 +58,7 @@ class UserSettingsScanner:
 
         # Parse skill usage
         skill_usage_raw = data.get("skillUsage", {})
+        skill_usage = result.skill_usage
         for skill_name, usage_data in skill_usage_raw.items():
             if isinstance(usage_data, dict):
                 usage_count = usage_data.get("usageCount", 0)
@@ -67,19 +70,16 @@ class UserSettingsScanner:
                     except (ValueError, TypeError, OSError):
                         pass
 
-                result.skill_usage[skill_name] = SkillUsage(
+                skill_usage[skill_name] = SkillUsage(
                     name=skill_name,
                     usage_count=usage_count,
                     last_used_at=last_used,
                 )
 
-        # Sort top skills by usage count
-        sorted_skills = sorted(
-            result.skill_usage.values(),
-            key=lambda s: s.usage_count,
-            reverse=True,
+        # Top skills by usage count (same order as a stable descending sort)
+        result.top_skills = heapq.nlargest(
+            10, result.skill_usage.values(), key=attrgetter("usage_count")
         )
-        result.top_skills = sorted_skills[:10]
 
         # Parse tip adoption
         tips_history = data.get("tipsHistory", {})
@@ -97,24 +97,25 @@ class UserSettingsScanner:
 
         # Parse project metrics
         projects_raw = data.get("projects", {})
+        project_metrics = result.project_metrics
         for project_path, project_data in projects_raw.items():
             if not isinstance(project_data, dict):
                 continue
 
-            metric = ProjectMetric(
+            get = project_data.get
+            project_metrics[project_path] = ProjectMetric(
                 path=project_path,
-                last_session_cost=project_data.get("lastCost"),
-                last_session_duration_ms=project_data.get("lastDuration", 0),
-                lines_added=project_data.get("lastLinesAdded", 0),
-                lines_removed=project_data.get("lastLinesRemoved", 0),
-                input_tokens=project_data.get("lastTotalInputTokens", 0),
-                output_tokens=project_data.get("lastTotalOutputTokens", 0),
-                cache_read_tokens=project_data.get("lastTotalCacheReadInputTokens", 0),
-                api_latency_ms=project_data.get("lastAPIDuration", 0),
-                onboarding_seen_count=project_data.get("projectOnboardingSeenCount", 0),
-                has_trust_accepted=project_data.get("hasTrustDialogAccepted", False),
+                last_session_cost=get("lastCost"),
+                last_session_duration_ms=get("lastDuration", 0),
+                lines_added=get("lastLinesAdded", 0),
+                lines_removed=get("lastLinesRemoved", 0),
+                input_tokens=get("lastTotalInputTokens", 0),
+                output_tokens=get("lastTotalOutputTokens", 0),
+                cache_read_tokens=get("lastTotalCacheReadInputTokens", 0),
+                api_latency_ms=get("lastAPIDuration", 0),
+                onboarding_seen_count=get("projectOnboardingSeenCount", 0),
+                has_trust_accepted=get("hasTrustDialogAccepted", False),
             )
-            result.project_metrics[project_path] = metric
 
         result.total_projects = len(result.project_metrics)
 
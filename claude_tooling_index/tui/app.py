@@ -265,6 +265,8 @@ class ToolingIndexTUI(App):
         self.extended_result = None  # ExtendedScanResult with Phase 6 metrics
         self.current_type_filter = None
         self.analytics_tracker = AnalyticsTracker()
+        # Reused across refreshes so unchanged extended metrics come from its cache.
+        self._claude_scanner = None
 
     def compose(self) -> ComposeResult:
         """Create the UI layout."""
@@ -309,7 +311,10 @@ class ToolingIndexTUI(App):
         """Load components from scanner including Phase 6 extended metrics."""
         try:
             if self.platform == "claude":
-                scanner = ToolingScanner(claude_home=self.claude_home)
+                scanner = getattr(self, "_claude_scanner", None)
+                if scanner is None:
+                    scanner = ToolingScanner(claude_home=self.claude_home)
+                    self._claude_scanner = scanner
                 self.extended_result = scanner.scan_extended()
                 self.scan_result = self.extended_result.core
 
@@ -369,12 +374,15 @@ class ToolingIndexTUI(App):
 
     def on_unmount(self) -> None:
         """Close DB connections on shutdown (best-effort)."""
-        tracker = getattr(self, "analytics_tracker", None)
-        if tracker:
-            try:
-                tracker.close()
-            except Exception:
-                return None
+        for owner in (
+            getattr(self, "_claude_scanner", None),
+            getattr(self, "analytics_tracker", None),
+        ):
+            if owner:
+                try:
+                    owner.close()
+                except Exception:
+                    continue
 
     def _sync_filter_button_state(self, component_list: ComponentList) -> None:
         platform_filter = component_list.platform_filter or "all"
@@ -3,7 +3,6 @@ from __future__ import annotations
 import builtins
 import json
 import os
-import shutil
 import sqlite3
 from pathlib import Path
 
@@ -254,8 +253,8 @@ def test_cli_scan_platform_all_verbose_by_platform_and_errors(
     assert "By platform" in result.output
     assert "Component Details" in result.output
 
-    # Trigger scan errors list: remove ~/.codex so codex scan fails under platform=all.
-    shutil.rmtree(mock_codex_home)
+    # Trigger scan errors list: a broken config.toml makes the codex MCP scan fail.
+    (mock_codex_home / "config.toml").write_text("[mcp_servers\n")
     result = runner.invoke(
         cli,
         [
@@ -264,6 +263,8 @@ def test_cli_scan_platform_all_verbose_by_platform_and_errors(
             "all",
             "--claude-home",
             str(mock_claude_home),
+            "--codex-home",
+            str(mock_codex_home),
             "--sequential",
             "--no-db",
         ],
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+from claude_tooling_index.scanners import codex_mcps
 from claude_tooling_index.scanners.codex_mcps import CodexMCPScanner, _redact_env_vars
 
 
@@ -187,3 +188,44 @@ meta = { retries = 2 }
         assert demo.config_extra["id"] == "<redacted>"
         assert demo.config_extra["flags"] == ["--a", "--b"]
         assert demo.config_extra["meta"]["retries"] == 2
+
+    def test_scan_reuses_parsed_toml_until_file_changes(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        config_path = tmp_path / "config.toml"
+        config_path.write_text('[mcp_servers.a]\ncommand = "a"\ncwd = "/tmp"\n')
+
+        parses = []
+        redactions = []
+        original_load = codex_mcps._load_toml
+        original_redact = codex_mcps._redact_config_extra
+
+        def counting_load(path: Path):
+            parses.append(path)
+            return original_load(path)
+
+        def counting_redact(value, *, key=""):
+            redactions.append(key)
+            return original_redact(value, key=key)
+
+        monkeypatch.setattr(codex_mcps, "_load_toml", counting_load)
+        monkeypatch.setattr(codex_mcps, "_redact_config_extra", counting_redact)
+
+        scanner = CodexMCPScanner(config_toml_path=config_path)
+        first = scanner.scan()
+        assert [m.name for m in first] == ["a"]
+        first[0].config_extra["cwd"] = "mutated"
+        second = scanner.scan()
+        assert [m.name for m in second] == ["a"]
+        assert second[0] is not first[0]
+        assert second[0].config_extra["cwd"] == "/tmp"
+        assert len(parses) == 1
+        assert redactions == ["cwd"]
+
+        unredacted = CodexMCPScanner(config_toml_path=config_path, redact_env=False)
+        assert [m.name for m in unredacted.scan()] == ["a"]
+        assert len(parses) == 2
+
+        config_path.write_text('[mcp_servers.bb]\ncommand = "bb"\n')
+        assert [m.name for m in scanner.scan()] == ["bb"]
+        assert len(parses) == 3
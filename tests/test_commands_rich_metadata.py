@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import os
 from datetime import datetime
 from pathlib import Path
 
-from claude_tooling_index.scanners.commands import CommandScanner
+import pytest
+import yaml
+
+from claude_tooling_index.scanners.commands import (
+    CommandScanner,
+    _parse_simple_frontmatter,
+    _scan_keywords,
+)
 
 
 def test_command_scanner_extracts_rich_metadata(tmp_path: Path, monkeypatch) -> None:
@@ -105,3 +113,207 @@ def test_command_metadata_is_serializable_defaults(tmp_path: Path) -> None:
     cmd = CommandScanner(commands_dir).scan()[0]
     assert cmd.last_modified <= datetime.now()
 
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ("---\ndescription: d\n---\nbody\n", {"description": "d"}),
+        ("---  \r\ndescription: d\r\n---\r\nbody", {"description": "d"}),
+        ("---\na: 1\nb: |\n  ---\n---\n", {"a": 1, "b": "---"}),
+        ("---\ndescription: d\n---", {}),
+        ("# no frontmatter\n---\na: 1\n---\n", {}),
+    ],
+)
+def test_command_scanner_frontmatter_fences(content: str, expected: dict) -> None:
+    assert CommandScanner(Path("/nonexistent"))._extract_frontmatter(content) == expected
+
+
+def test_command_scanner_install_commands_alternation() -> None:
+    text = "\n".join(
+        [
+            "  pip3 install requests  ",
+            "brew install jq",
+            "npm i -g tool",
+            "npm install left-pad",
+            "pnpm add zod",
+            "yarn add react",
+            "pipx install nope",
+            "npm run build",
+        ]
+    )
+    assert CommandScanner(Path("/nonexistent"))._extract_install_commands(text) == [
+        "pip3 install requests",
+        "brew install jq",
+        "npm i -g tool",
+        "npm install left-pad",
+        "pnpm add zod",
+        "yarn add react",
+    ]
+
+
+@pytest.mark.parametrize(
+    "block",
+    [
+        "description: Send the weekly digest\nname: digest",
+        "description: yes",
+        "count: 3\nratio: 1.5",
+        "released: 2024-01-01",
+        "on: push",
+        "tags: [a, b]",
+        "note: 'quoted'",
+        "description: a: b",
+        "description: text # comment",
+        "description: first\n  continued",
+        "empty:",
+    ],
+)
+def test_simple_frontmatter_fast_path_matches_yaml(block: str) -> None:
+    scanner = CommandScanner(Path("/nonexistent"))
+    content = f"---\n{block}\n---\nbody\n"
+
+    try:
+        expected = yaml.safe_load(block) or {}
+    except yaml.YAMLError:
+        expected = {}
+
+    assert scanner._extract_frontmatter(content) == expected
+
+
+def test_simple_frontmatter_fast_path_defers_typed_values_to_yaml() -> None:
+    assert _parse_simple_frontmatter("description: Ship it\nmodel: sonnet") == {
+        "description": "Ship it",
+        "model": "sonnet",
+    }
+    assert _parse_simple_frontmatter("count: 3") is None
+    assert _parse_simple_frontmatter("enabled: yes") is None
+    assert _parse_simple_frontmatter("tags: [a, b]") is None
+
+
+def test_command_scanner_parallel_path_matches_serial(tmp_path: Path, monkeypatch) -> None:
+    from claude_tooling_index.scanners import commands as commands_module
+
+    commands_dir = tmp_path / "commands"
+    (commands_dir / ".disabled").mkdir(parents=True)
+    for i in range(5):
+        (commands_dir / f"cmd{i}.md").write_text(
+            f"---\ndescription: command {i}\n---\n## Setup\n- pip install pkg{i}\n"
+        )
+    (commands_dir / ".disabled" / "old.md").write_text("# /old\n")
+
+    serial = CommandScanner(commands_dir).scan()
+    monkeypatch.setattr(commands_module, "_PARALLEL_MIN_FILES", 1)
+    monkeypatch.setattr(commands_module.os, "cpu_count", lambda: 2)
+    parallel = CommandScanner(commands_dir).scan()
+
+    assert parallel == serial
+    assert [c.status for c in parallel].count("disabled") == 1
+    assert {c.description for c in parallel} >= {"command 0", "command 4"}
+
+
+def test_command_scanner_normalizes_crlf_like_text_mode(tmp_path: Path) -> None:
+    text = "---\ndescription: Deploy\n---\n## Inputs\n- target\n\n## Setup\n- brew install jq\n"
+    lf_file = tmp_path / "lf.md"
+    crlf_file = tmp_path / "crlf.md"
+    lf_file.write_bytes(text.encode("utf-8"))
+    crlf_file.write_bytes(text.replace("\n", "\r\n").encode("utf-8"))
+
+    scanner = CommandScanner(tmp_path)
+    lf = scanner._scan_command(lf_file)
+    crlf = scanner._scan_command(crlf_file)
+
+    assert crlf.description == "Deploy"
+    assert crlf.inputs == lf.inputs == ["target"]
+    assert crlf.prerequisites == lf.prerequisites
+
+
+def test_command_scanner_tool_usage_lists_code_block_hits_first(tmp_path: Path) -> None:
+    command_file = tmp_path / "tools.md"
+    command_file.write_text(
+        "Use mcp__prose__first and run_composio_tool('ZED_ACTION').\n"
+        "```\n"
+        "mcp__block__second\n"
+        "run_composio_tool('ALPHA_ACTION')\n"
+        "```\n"
+        "Again mcp__block__second.\n"
+    )
+
+    command = CommandScanner(tmp_path)._scan_command(command_file)
+
+    assert command.detected_tools == {
+        "mcp_tools": ["mcp__block__second", "mcp__prose__first"],
+        "composio_tools": ["ALPHA_ACTION", "ZED_ACTION"],
+    }
+    assert command.detected_toolkits == ["block", "alpha", "prose", "zed"]
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        ("plain notes", (False, False)),
+        ("Query the Postgres replica", (True, False)),
+        ("DROP the cache", (False, True)),
+        ("sqlite files you may Delete", (True, True)),
+        ("mysqlite and deleted do not count", (False, False)),
+    ],
+)
+def test_scan_keywords_matches_whole_words_case_insensitively(
+    content: str, expected: tuple
+) -> None:
+    assert _scan_keywords(content) == expected
+
+
+def test_command_scanner_json_safe_flat_and_nested_frontmatter() -> None:
+    scanner = CommandScanner(Path("/nonexistent"))
+    flat = {"owner": "ops", 1: 2.5, "beta": True, "note": None}
+    assert scanner._json_safe(flat) == {"owner": "ops", "1": 2.5, "beta": True, "note": None}
+
+    nested = {"when": datetime(2024, 1, 2), "tags": ["a", {"b": datetime(2024, 1, 3)}]}
+    assert scanner._json_safe(nested) == {
+        "when": "2024-01-02 00:00:00",
+        "tags": ["a", {"b": "2024-01-03 00:00:00"}],
+    }
+
+
+def test_command_scanner_reuses_unchanged_files(tmp_path: Path, monkeypatch) -> None:
+    commands_dir = tmp_path / "commands"
+    commands_dir.mkdir()
+    kept = commands_dir / "kept.md"
+    edited = commands_dir / "edited.md"
+    kept.write_text("---\ndescription: kept\n---\n")
+    edited.write_text("---\ndescription: before\n---\n")
+    (commands_dir / "broken.md").write_bytes(b"\xff\xfe")
+
+    parsed = []
+    original = CommandScanner._scan_command
+
+    def counting_scan(self, command_file: Path):
+        parsed.append(command_file.name)
+        return original(self, command_file)
+
+    monkeypatch.setattr(CommandScanner, "_scan_command", counting_scan)
+
+    scanner = CommandScanner(commands_dir)
+    first = {c.name: c for c in scanner.scan()}
+    assert first["broken"].status == "error"
+    first["kept"].capability_tags.append("mutated")
+
+    edited.write_text("---\ndescription: after, and longer\n---\n")
+    st = edited.stat()
+    os.utime(edited, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    parsed.clear()
+    second = {c.name: c for c in scanner.scan()}
+
+    assert sorted(parsed) == ["broken.md", "edited.md"]
+    assert second["kept"] is not first["kept"]
+    assert "mutated" not in second["kept"].capability_tags
+    assert second["kept"].description == "kept"
+    assert second["edited"].description == "after, and longer"
+
+    # Deleted files drop out of the cache; other scanners keep their own.
+    kept.unlink()
+    scanner.scan()
+    assert str(kept) not in scanner._cache
+    parsed.clear()
+    CommandScanner(commands_dir).scan()
+    assert sorted(parsed) == ["broken.md", "edited.md"]
@@ -4,6 +4,8 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 from claude_tooling_index.exporters import JSONExporter, MarkdownExporter
 from claude_tooling_index.models import (
     BinaryMetadata,
@@ -214,3 +216,57 @@ def test_exporters_cover_all_component_types(tmp_path: Path) -> None:
     mixed = JSONExporter(pretty=False).export_components([skill, {"name": "x"}])
     mixed_payload = json.loads(mixed)
     assert mixed_payload["count"] == 2
+
+
+def test_json_exporter_caches_field_plan_per_class(tmp_path: Path) -> None:
+    hook = HookMetadata(
+        name="hook.sh",
+        origin="in-house",
+        status="active",
+        last_modified=datetime(2026, 1, 11, 0, 0, 0),
+        install_path=tmp_path / "hook.sh",
+        language="bash",
+        error_message="boom",
+    )
+
+    exporter = JSONExporter(pretty=False)
+    data = exporter._serialize_component(hook)
+
+    assert HookMetadata in JSONExporter._field_plans
+    assert data["language"] == "bash"
+    assert data["file_size"] == 0
+    assert data["error"] == "boom"
+    assert "version" not in data
+    assert "description" not in data
+
+
+def test_json_exporter_file_methods_write_documents(tmp_path: Path) -> None:
+    skill = SkillMetadata(
+        name="my-skill",
+        origin="in-house",
+        status="active",
+        last_modified=datetime(2026, 1, 11, 0, 0, 0),
+        install_path=tmp_path / "my-skill",
+    )
+    exporter = JSONExporter(pretty=False)
+
+    scan_path = tmp_path / "scan.json"
+    exporter.export_scan_result_to_file(ScanResult(skills=[skill]), scan_path)
+    assert json.loads(scan_path.read_text())["summary"]["skills"] == 1
+
+    components_path = tmp_path / "components.json"
+    exporter.export_components_to_file([skill], components_path)
+    assert json.loads(components_path.read_text())["count"] == 1
+
+    # The dispatching wrapper still accepts either input type.
+    exporter.export_to_file([skill], components_path)
+    assert json.loads(components_path.read_text())["components"][0]["name"] == "my-skill"
+
+
+def test_json_exporter_failed_encode_leaves_no_file(tmp_path: Path) -> None:
+    output_path = tmp_path / "broken.json"
+
+    with pytest.raises(TypeError):
+        JSONExporter(pretty=False)._write_json({(1, 2): "tuple key"}, output_path)
+
+    assert not output_path.exists()
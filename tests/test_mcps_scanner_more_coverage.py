@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import json
+import os
+from datetime import datetime
 from pathlib import Path
 
-from claude_tooling_index.scanners import MCPScanner
+import pytest
+
+from claude_tooling_index.scanners import MCPScanner, _json
+from claude_tooling_index.scanners import mcps as mcps_module
 
 
 def test_mcp_scanner_covers_http_origin_duplicates_and_plugin_json(
@@ -128,3 +133,142 @@ def test_mcp_scanner_covers_http_origin_duplicates_and_plugin_json(
     assert p4.origin == "plugin"
     assert str(plugin_root_mcp) in p4.args[0]
     assert str(plugin_root_mcp) in p4.env_vars["A"]
+
+
+def test_mcp_scanner_parses_claude_json_only_when_changed(
+    mock_claude_home: Path, tmp_path: Path, monkeypatch
+) -> None:
+    claude_json = tmp_path / ".claude.json"
+    claude_json.write_text(
+        json.dumps(
+            {
+                "mcpServers": {"user-mcp": {"command": "echo"}},
+                "projects": {
+                    str(mock_claude_home): {"mcpServers": {"local-mcp": {"command": "echo"}}}
+                },
+            }
+        )
+    )
+
+    parsed = []
+    original_loads = _json.loads
+
+    def counting_loads(data):
+        parsed.append(data)
+        return original_loads(data)
+
+    monkeypatch.setattr(_json, "loads", counting_loads)
+
+    scanner = MCPScanner(mock_claude_home / "mcp.json")
+    assert {m.name for m in scanner.scan()} >= {"user-mcp", "local-mcp"}
+    assert parsed.count(claude_json.read_bytes()) == 1
+
+    # An unchanged file is not parsed again by the next scan.
+    assert {m.name for m in scanner.scan()} >= {"user-mcp", "local-mcp"}
+    assert parsed.count(claude_json.read_bytes()) == 1
+
+    # A rescan with the same scanner picks up edits to the file.
+    claude_json.write_text(json.dumps({"mcpServers": {"renamed-mcp": {"command": "echo"}}}))
+    names = {m.name for m in scanner.scan()}
+    assert "renamed-mcp" in names
+    assert "user-mcp" not in names
+    assert parsed.count(claude_json.read_bytes()) == 1
+
+
+@pytest.mark.parametrize("parallel_min_files", [1, 100])
+def test_mcp_scanner_plugin_configs_keep_precedence(
+    mock_claude_home: Path, monkeypatch, parallel_min_files: int
+) -> None:
+    # Both the thread-pool and the serial read path must keep the order.
+    monkeypatch.setattr(mcps_module, "_PARALLEL_MIN_FILES", parallel_min_files)
+    plugin = mock_claude_home / "plugins" / "cache" / "market" / "demo"
+    (plugin / ".claude-plugin").mkdir(parents=True)
+    (plugin / ".claude-plugin" / "plugin.json").write_text(
+        json.dumps({"mcpServers": {"srv": {"command": "from-plugin-json"}}})
+    )
+    (plugin / "1.0.0").mkdir()
+    (plugin / "1.0.0" / ".mcp.json").write_text(
+        json.dumps({"srv": {"command": "from-versioned"}, "extra": {"command": "x"}})
+    )
+    (plugin / ".mcp.json").write_text(json.dumps({"srv": {"command": "from-shallow"}}))
+    (plugin / "2.0.0").mkdir()
+    (plugin / "2.0.0" / ".mcp.json").write_text("{not json")
+
+    mcps = MCPScanner(mock_claude_home / "mcp.json")._scan_plugin_mcps(set())
+    by_name = {m.name: m for m in mcps}
+
+    # Every .mcp.json is read before any plugin.json, shallow before versioned.
+    assert [m.name for m in mcps] == [
+        "plugin:market:srv",
+        "plugin:demo:srv",
+        "plugin:demo:extra",
+    ]
+    assert by_name["plugin:market:srv"].command == "from-shallow"
+    assert by_name["plugin:demo:srv"].command == "from-versioned"
+
+
+def test_resolve_plugin_vars_copies_only_what_it_changes() -> None:
+    untouched = {"command": "node", "args": ["srv.js"], "env": {"A": "1"}}
+    assert mcps_module._resolve_plugin_vars(untouched, "/p") is untouched
+
+    config = {
+        "command": "${CLAUDE_PLUGIN_ROOT}/bin/srv",
+        "args": ["--root", "${CLAUDE_PLUGIN_ROOT}", 3],
+        "env": {"A": "1"},
+    }
+    resolved = mcps_module._resolve_plugin_vars(config, "/p")
+
+    assert resolved == {
+        "command": "/p/bin/srv",
+        "args": ["--root", "/p", 3],
+        "env": {"A": "1"},
+    }
+    assert resolved["env"] is config["env"]
+    assert config["command"] == "${CLAUDE_PLUGIN_ROOT}/bin/srv"
+
+
+def test_mcp_scanner_shares_config_mtime_within_a_scan(
+    mock_claude_home: Path, tmp_path: Path
+) -> None:
+    claude_json = tmp_path / ".claude.json"
+    claude_json.write_text(
+        json.dumps(
+            {
+                "mcpServers": {
+                    "a": {"command": "echo"},
+                    "b": {"command": "~/bin/b"},
+                }
+            }
+        )
+    )
+    os.utime(claude_json, (1_600_000_000, 1_600_000_000))
+
+    scanner = MCPScanner(mock_claude_home / "mcp.json")
+    by_name = {m.name: m for m in scanner.scan()}
+    assert by_name["a"].last_modified == datetime.fromtimestamp(1_600_000_000)
+    assert by_name["a"].last_modified is by_name["b"].last_modified
+    assert by_name["a"].install_path == Path("echo")
+    assert by_name["b"].install_path == Path("~/bin/b").expanduser()
+
+    # The next scan sees the file's new mtime.
+    os.utime(claude_json, (1_700_000_000, 1_700_000_000))
+    by_name = {m.name: m for m in scanner.scan()}
+    assert by_name["a"].last_modified == datetime.fromtimestamp(1_700_000_000)
+
+
+def test_mcp_scanner_results_do_not_share_cached_config(
+    mock_claude_home: Path, tmp_path: Path
+) -> None:
+    (tmp_path / ".claude.json").write_text(
+        json.dumps({"mcpServers": {"srv": {"command": "echo", "args": ["a"], "env": {"K": "/v"}}}})
+    )
+    scanner = MCPScanner(mock_claude_home / "mcp.json")
+    scanner.redact_env = False
+
+    first = {m.name: m for m in scanner.scan()}["srv"]
+    first.args.append("mutated")
+    first.env_vars["K"] = "mutated"
+
+    second = {m.name: m for m in scanner.scan()}["srv"]
+    assert second.args == ["a"]
+    assert second.env_vars == {"K": "/v"}
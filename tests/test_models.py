@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from claude_tooling_index.models import (
+    ComponentMetadata,
+    ExtendedScanResult,
+    HookMetadata,
+    ScanResult,
+    SkillMetadata,
+)
+
+
+def _skill(name: str = "s1") -> SkillMetadata:
+    return SkillMetadata(
+        name=name,
+        origin="in-house",
+        status="active",
+        last_modified=datetime(2024, 1, 1),
+        install_path=Path("/tmp") / name,
+    )
+
+
+def test_models_use_slots_without_instance_dict() -> None:
+    skill = _skill()
+
+    assert "name" in ComponentMetadata.__slots__
+    assert "version" in SkillMetadata.__slots__
+    assert "name" not in SkillMetadata.__slots__
+    assert not hasattr(skill, "__dict__")
+    assert not hasattr(ScanResult(), "__dict__")
+    assert not hasattr(ExtendedScanResult(), "__dict__")
+    assert skill.type == "skill"
+
+    with pytest.raises(AttributeError):
+        skill.not_a_field = True  # type: ignore[attr-defined]
+
+
+def test_scan_result_all_components_and_total_count() -> None:
+    result = ScanResult(skills=[_skill("a"), _skill("b")])
+
+    components = result.all_components
+    assert [c.name for c in components] == ["a", "b"]
+    assert result.total_count == 2
+    assert ExtendedScanResult(core=result).total_count == 2
+
+    # A fresh list each call, so callers can mutate it freely.
+    components.append(_skill("c"))
+    assert result.total_count == 2
+    assert result.all_components is not components
+
+    # The count follows later changes to the component lists.
+    result.skills.append(_skill("c"))
+    assert result.total_count == 3
+    result.skills = result.skills[:1]
+    assert result.total_count == 1
+
+
+def test_component_enum_like_strings_are_interned() -> None:
+    def fresh(value: str) -> str:
+        # Build the string at runtime so it is not a shared compile-time constant.
+        return "".join(list(value))
+
+    hooks = [
+        HookMetadata(
+            name=f"h{i}",
+            origin=fresh("in-house"),
+            status=fresh("active"),
+            last_modified=datetime(2024, 1, 1),
+            install_path=Path("/tmp") / f"h{i}",
+            platform=fresh("claude"),
+            trigger=fresh("post_tool_use"),
+            language=fresh("python"),
+        )
+        for i in range(2)
+    ]
+    a, b = hooks
+
+    assert a.origin is b.origin
+    assert a.status is b.status
+    assert a.platform is b.platform
+    assert a.type is b.type
+    assert a.trigger is b.trigger
+    assert a.language is b.language
+
+
+def test_scan_result_iter_all_chains_results_by_category() -> None:
+    a = ScanResult(skills=[_skill("a-skill")], hooks=[_skill("a-hook")])
+    b = ScanResult(skills=[_skill("b-skill")], hooks=[_skill("b-hook")])
+
+    assert [c.name for c in a.iter_all(b)] == ["a-skill", "b-skill", "a-hook", "b-hook"]
+    assert [c.name for c in a.iter_all()] == [c.name for c in a.all_components]
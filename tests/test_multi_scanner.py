@@ -6,6 +6,7 @@ import pytest
 
 from claude_tooling_index.models import ScanResult
 from claude_tooling_index.multi_scanner import MultiToolingScanner
+from claude_tooling_index.scanner import ToolingScanner, _detect_claude_home_cached
 
 
 class TestMultiToolingScanner:
@@ -142,6 +143,32 @@ command = "python3"
         assert len(result.skills) == 1
         assert result.skills[0].platform == "claude"
 
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_scan_all_skips_missing_codex_home(
+        self, mock_claude_home: Path, tmp_path: Path, parallel: bool
+    ):
+        scanner = MultiToolingScanner(
+            claude_home=mock_claude_home, codex_home=tmp_path / "missing-codex"
+        )
+
+        with pytest.warns(UserWarning, match="skipping codex scan"):
+            result = scanner.scan_all(platform="all", parallel=parallel)
+
+        assert not any("codex" in e for e in result.errors)
+
+    def test_scan_all_reuses_home_detection_from_existence_check(
+        self, mock_claude_home: Path
+    ):
+        ToolingScanner.invalidate_home_cache()
+        scanner = MultiToolingScanner()
+
+        with pytest.warns(UserWarning, match="skipping codex scan"):
+            result = scanner.scan_all(platform="all")
+
+        info = _detect_claude_home_cached.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+        assert not result.errors
+
     def test_scan_all_parallel_vs_sequential(
         self, mock_claude_home: Path, mock_codex_home: Path
     ):
@@ -164,6 +191,25 @@ command = "python3"
 
         assert result.scan_time is not None
 
+    def test_scan_all_passes_one_scan_time_to_each_platform(
+        self, mock_claude_home: Path, mock_codex_home: Path, monkeypatch
+    ):
+        scanner = MultiToolingScanner(
+            claude_home=mock_claude_home, codex_home=mock_codex_home
+        )
+        seen = []
+        original = ToolingScanner.scan_all
+
+        def recording_scan_all(self, parallel=True, scan_time=None):
+            result = original(self, parallel=parallel, scan_time=scan_time)
+            seen.append(result.scan_time)
+            return result
+
+        monkeypatch.setattr(ToolingScanner, "scan_all", recording_scan_all)
+        result = scanner.scan_all(platform="all")
+
+        assert seen == [result.scan_time]
+
     def test_merge_results_combines_all_lists(self):
         from datetime import datetime
 
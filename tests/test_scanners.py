@@ -3,8 +3,11 @@ from __future__ import annotations
 import json
 import os
 import sqlite3
+from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 from claude_tooling_index.scanners import (
     BinaryScanner,
     CommandScanner,
@@ -370,6 +373,58 @@ def test_event_queue_scanner_extracts_basic_metrics(mock_claude_home: Path) -> N
     assert metrics.tool_frequency["read_file"] == 1
 
 
+def test_event_queue_scanner_date_range_skips_invalid_timestamps(mock_claude_home: Path) -> None:
+    event_queue = mock_claude_home / "data" / "event_queue.jsonl"
+    stamps = [1_700_000_500_000, "soon", 10**20, 1_700_000_000_000, 0, 1_700_000_900_000]
+    event_queue.write_text(
+        "\n".join(json.dumps({"hook_event_type": "Stop", "timestamp": ts}) for ts in stamps)
+    )
+
+    metrics = EventQueueScanner(event_queue).scan()
+    assert metrics is not None
+    assert metrics.total_events == len(stamps)
+    assert metrics.date_range_start == datetime.fromtimestamp(1_700_000_000)
+    assert metrics.date_range_end == datetime.fromtimestamp(1_700_000_900)
+
+
+def test_event_queue_scanner_skips_blank_and_undecodable_lines(mock_claude_home: Path) -> None:
+    event_queue = mock_claude_home / "data" / "event_queue.jsonl"
+    good = json.dumps({"hook_event_type": "Stop", "session_id": "s1"}).encode()
+    event_queue.write_bytes(b"\n".join([good, b"   ", b"\xff\xfe{", b"{not json", good + b"\r"]))
+
+    metrics = EventQueueScanner(event_queue).scan()
+    assert metrics is not None
+    assert metrics.total_events == 2
+    assert metrics.event_types == {"Stop": 2}
+
+
+def test_event_queue_scanner_parallel_ranges_match_serial(
+    mock_claude_home: Path, monkeypatch
+) -> None:
+    from claude_tooling_index.scanners import event_queue as event_queue_module
+
+    event_queue = mock_claude_home / "data" / "event_queue.jsonl"
+    events = [
+        {
+            "hook_event_type": "PreToolUse" if i % 3 else "Stop",
+            "session_id": f"s{i % 7}",
+            "timestamp": 1_700_000_000_000 + (i * 7919) % 500 * 1000,
+            "payload": {"permission_mode": ["auto", "plan"][i % 2], "tool_name": f"T{i % 4}"},
+        }
+        for i in range(200)
+    ]
+    event_queue.write_text("\n".join(json.dumps(e) for e in events) + "\n")
+
+    serial = EventQueueScanner(event_queue).scan()
+    monkeypatch.setattr(event_queue_module, "_PARALLEL_MIN_BYTES", 1)
+    monkeypatch.setattr(event_queue_module.os, "cpu_count", lambda: 3)
+    parallel = EventQueueScanner(event_queue).scan()
+
+    assert parallel == serial
+    assert parallel.total_events == 200
+    assert list(parallel.event_types) == ["Stop", "PreToolUse"]
+
+
 def test_user_settings_scanner_parses_basic_fields(tmp_path: Path, mock_claude_home: Path) -> None:
     claude_json = tmp_path / ".claude.json"
     claude_json.write_text(
@@ -481,6 +536,26 @@ def test_growth_scanner_counts_edges_patterns_and_level(mock_claude_home: Path)
     assert gm.projects_with_edges == 1
 
 
+def test_growth_scanner_counts_by_category_in_one_pass(mock_claude_home: Path) -> None:
+    growth_dir = mock_claude_home / "agentic-growth"
+    edges = growth_dir / "edges"
+    for category, names in {
+        "alpha": ["EDGE-001.md", "EDGE-002.md", "notes.md", "EDGE-003.txt"],
+        "beta": ["README.md"],
+        "index.md": ["EDGE-009.md"],
+    }.items():
+        (edges / category).mkdir(parents=True)
+        for name in names:
+            (edges / category / name).write_text("x\n")
+    (edges / "EDGE-loose.md").write_text("x\n")
+
+    gm = GrowthScanner(growth_dir).scan()
+    assert gm is not None
+    assert gm.total_edges == 3
+    assert gm.edges_by_category == {"alpha": 2}
+    assert gm.total_patterns == 0
+
+
 def test_insights_scanner_and_search(tmp_path: Path, mock_claude_home: Path) -> None:
     db_path = mock_claude_home / "data" / "insights.db"
     conn = sqlite3.connect(str(db_path))
@@ -521,6 +596,114 @@ def test_insights_scanner_and_search(tmp_path: Path, mock_claude_home: Path) ->
     results = scanner.search_insights("danger", limit=5)
     assert results
     assert results[0]["category"] == "warning"
+    scanner.close()
+
+
+def test_insights_scanner_returns_latest_ten_per_category(mock_claude_home: Path) -> None:
+    db_path = mock_claude_home / "data" / "insights.db"
+    conn = sqlite3.connect(str(db_path))
+    try:
+        conn.execute(
+            "CREATE TABLE insights "
+            "(category TEXT, project_path TEXT, insight_text TEXT, timestamp DATETIME)"
+        )
+        rows = [
+            (category, "/x/proj", f"{category} {i}", f"2024-01-{i + 1:02d}")
+            for category in ("warning", "pattern", "tradeoff")
+            for i in range(12)
+        ]
+        rows.append(("tradeoff", "/x/proj", "t" * 300, "2025-01-01"))
+        conn.executemany("INSERT INTO insights VALUES (?, ?, ?, ?)", rows)
+        conn.commit()
+    finally:
+        conn.close()
+
+    metrics = InsightsScanner(db_path).scan()
+
+    assert metrics is not None
+    assert metrics.by_category == {"warning": 12, "pattern": 12, "tradeoff": 13}
+    assert metrics.recent_warnings == [f"warning {i}" for i in range(11, 1, -1)]
+    assert metrics.recent_patterns == [f"pattern {i}" for i in range(11, 1, -1)]
+    assert metrics.recent_tradeoffs[0] == "t" * 200
+    assert len(metrics.recent_tradeoffs) == 10
+    assert metrics.processed_sessions == 0
+
+
+def test_insights_search_escapes_fts_syntax(mock_claude_home: Path) -> None:
+    db_path = mock_claude_home / "data" / "insights.db"
+    conn = sqlite3.connect(str(db_path))
+    try:
+        conn.execute(
+            "CREATE TABLE insights "
+            "(category TEXT, project_path TEXT, insight_text TEXT, timestamp DATETIME)"
+        )
+        conn.execute("CREATE VIRTUAL TABLE insights_fts USING fts5(insight_text)")
+        texts = ["retry the flaky-test job", "flaky network", "stable job"]
+        for rowid, text in enumerate(texts, start=1):
+            conn.execute(
+                "INSERT INTO insights(rowid, category, project_path, insight_text) "
+                "VALUES (?, 'pattern', NULL, ?)",
+                (rowid, text),
+            )
+            conn.execute(
+                "INSERT INTO insights_fts(rowid, insight_text) VALUES (?, ?)",
+                (rowid, text),
+            )
+        conn.commit()
+    finally:
+        conn.close()
+
+    scanner = InsightsScanner(db_path)
+
+    # Unquoted, "-" and ":" are FTS5 operators and the query would fail.
+    assert [r["text"] for r in scanner.search_insights("flaky-test")] == [texts[0]]
+    assert scanner.search_insights("insight_text:job") == []
+    assert [r["text"] for r in scanner.search_insights("job flaky")] == [texts[0]]
+    assert {r["text"] for r in scanner.search_insights("flaky")} == set(texts[:2])
+    assert scanner.search_insights("flaky", limit=1)[0]["project"] == "unknown"
+
+    # One read-only connection serves every search until close().
+    conn = scanner._conn
+    assert conn is not None
+    scanner.search_insights("job")
+    assert scanner._conn is conn
+    with pytest.raises(sqlite3.OperationalError, match="readonly"):
+        conn.execute("DELETE FROM insights")
+    scanner.close()
+    assert scanner._conn is None
+
+
+def test_insights_search_reopens_replaced_database(mock_claude_home: Path) -> None:
+    db_path = mock_claude_home / "data" / "insights.db"
+
+    def write_db(path: Path, text: str) -> None:
+        conn = sqlite3.connect(str(path))
+        try:
+            conn.execute(
+                "CREATE TABLE insights "
+                "(category TEXT, project_path TEXT, insight_text TEXT, timestamp DATETIME)"
+            )
+            conn.execute(
+                "INSERT INTO insights VALUES ('pattern', NULL, ?, '2024-01-01')",
+                (text,),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    write_db(db_path, "old insight")
+    scanner = InsightsScanner(db_path)
+    assert [r["text"] for r in scanner.search_insights("insight")] == ["old insight"]
+    old_conn = scanner._conn
+
+    # Atomically replaced, as a rebuild would; the old handle still sees the old inode.
+    replacement = db_path.with_name("insights.db.new")
+    write_db(replacement, "new insight")
+    os.replace(replacement, db_path)
+
+    assert [r["text"] for r in scanner.search_insights("insight")] == ["new insight"]
+    assert scanner._conn is not old_conn
+    scanner.close()
 
 
 def test_mcp_scanner_reads_user_project_plugin_and_legacy(mock_claude_home: Path, tmp_path: Path) -> None:
@@ -570,3 +753,69 @@ def test_mcp_scanner_reads_user_project_plugin_and_legacy(mock_claude_home: Path
 
     names = {m.name for m in mcps}
     assert {"user-mcp", "proj-mcp", "legacy-mcp", "claude-in-chrome"}.issubset(names)
+
+
+def test_transcript_scanner_skips_non_assistant_and_malformed_lines(
+    mock_claude_home: Path,
+) -> None:
+    project_dir = mock_claude_home / "projects" / "demo"
+    project_dir.mkdir(parents=True)
+
+    assistant = {
+        "type": "assistant",
+        "message": {"model": "m1", "usage": {"input_tokens": 7}, "content": []},
+    }
+    lines = [
+        json.dumps({"type": "user", "message": {"usage": {"input_tokens": 100}}}),
+        "{not json",
+        json.dumps(["assistant"]),
+        json.dumps({"type": "summary", "summary": "assistant"}),
+        json.dumps(assistant, separators=(",", ":")),
+        json.dumps(assistant),
+    ]
+    (project_dir / "session.jsonl").write_text("\n".join(lines) + "\n")
+
+    metrics = TranscriptScanner(mock_claude_home / "projects").scan(sample_limit=0)
+    assert metrics is not None
+    assert metrics.total_input_tokens == 14
+    assert metrics.model_usage == {"m1": 2}
+
+
+def test_transcript_scanner_parallel_batches_match_serial(
+    mock_claude_home: Path, monkeypatch
+) -> None:
+    from claude_tooling_index.scanners import transcripts
+
+    for p in range(3):
+        project_dir = mock_claude_home / "projects" / f"p{p}"
+        project_dir.mkdir(parents=True)
+        # Each file also uses its own tool once; top_tools breaks those ties by
+        # first appearance, so batches must be merged in serial file order.
+        line = json.dumps(
+            {
+                "type": "assistant",
+                "message": {
+                    "model": f"m{p % 2}",
+                    "usage": {"input_tokens": p + 1, "output_tokens": 1},
+                    "content": [
+                        {"type": "tool_use", "name": "Read"},
+                        {"type": "tool_use", "name": f"Tool{p}"},
+                    ],
+                },
+            }
+        )
+        (project_dir / "s.jsonl").write_text(line + "\n")
+
+    scanner = TranscriptScanner(mock_claude_home / "projects")
+    serial = scanner.scan(sample_limit=0)
+
+    monkeypatch.setattr(transcripts, "_PARALLEL_MIN_FILES", 1)
+    monkeypatch.setattr(transcripts.os, "cpu_count", lambda: 2)
+    parallel = scanner.scan(sample_limit=0)
+
+    assert parallel == serial
+    assert parallel.top_tools == serial.top_tools
+    assert parallel.total_transcripts == 3
+    assert parallel.total_input_tokens == 6
+    assert parallel.tool_usage == {"Read": 3, "Tool0": 1, "Tool1": 1, "Tool2": 1}
+    assert parallel.model_usage == {"m0": 2, "m1": 1}
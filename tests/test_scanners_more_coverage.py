@@ -3,6 +3,8 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
+import pytest
+
 from claude_tooling_index.multi_scanner import MultiToolingScanner
 from claude_tooling_index.scanners import BinaryScanner, HookScanner
 
@@ -26,10 +28,10 @@ def test_hook_scanner_detects_multiple_languages_and_error_path(
     # Force one file down the scanner error branch.
     original_scan_hook = HookScanner._scan_hook
 
-    def raise_for_one(self: HookScanner, hook_file: Path):
+    def raise_for_one(self: HookScanner, hook_file: Path, st: os.stat_result):
         if hook_file.name == "b.sh":
             raise RuntimeError("boom")
-        return original_scan_hook(self, hook_file)
+        return original_scan_hook(self, hook_file, st)
 
     monkeypatch.setattr(HookScanner, "_scan_hook", raise_for_one)
 
@@ -42,6 +44,116 @@ def test_hook_scanner_detects_multiple_languages_and_error_path(
     assert by_name["b.sh"].status == "error"
 
 
+def test_hook_scanner_follows_symlinks_and_uses_entry_stat(mock_claude_home: Path) -> None:
+    hooks_dir = mock_claude_home / "hooks"
+    target = mock_claude_home / "shared_hook.sh"
+    target.write_text("#!/bin/sh\necho hi\n")
+    os.chmod(target, 0o755)
+    (hooks_dir / "pre_tool_use.sh").symlink_to(target)
+    (hooks_dir / "dangling.sh").symlink_to(mock_claude_home / "missing.sh")
+    (hooks_dir / "subdir").mkdir()
+
+    hooks = HookScanner(hooks_dir).scan()
+
+    assert [h.name for h in hooks] == ["pre_tool_use.sh"]
+    assert hooks[0].file_size == target.stat().st_size
+    assert hooks[0].is_executable is True
+    assert hooks[0].trigger_event == "pre_tool_use"
+
+
+def test_hook_scanner_analyzes_only_a_bounded_prefix(mock_claude_home: Path, monkeypatch) -> None:
+    from claude_tooling_index.scanners import hooks as hooks_module
+
+    monkeypatch.setattr(hooks_module, "_MAX_HOOK_BYTES", 64)
+    hooks_dir = mock_claude_home / "hooks"
+    head = "#!/bin/sh\necho ${EARLY_TOKEN}\n".ljust(64, "#")
+    (hooks_dir / "big.sh").write_text(head + "\nrm -rf ${LATE_TOKEN} # destroy\n")
+    (hooks_dir / "exact.sh").write_text(head)
+
+    by_name = {h.name: h for h in HookScanner(hooks_dir).scan()}
+
+    big = by_name["big.sh"]
+    assert big.content_truncated is True
+    assert big.required_env_vars == ["EARLY_TOKEN"]
+    assert big.risk_level == "low"
+    assert big.file_size > 64
+    assert by_name["exact.sh"].content_truncated is False
+
+
+def test_hook_scanner_skips_content_analysis_for_compiled_hooks(mock_claude_home: Path) -> None:
+    hooks_dir = mock_claude_home / "hooks"
+    (hooks_dir / "pre_tool_use").write_bytes(
+        b"\x7fELF\x00\x00mcp__github__create_issue\x00${API_TOKEN}\x00delete\x00"
+    )
+
+    (hook,) = HookScanner(hooks_dir).scan()
+
+    assert hook.language == "cpp"
+    assert hook.trigger_event == "pre_tool_use"
+    assert hook.detected_tools == {}
+    assert hook.detected_toolkits == []
+    assert hook.required_env_vars == []
+    assert hook.side_effects == []
+    assert hook.risk_level == "low"
+
+
+def test_hook_scanner_reads_only_the_head_of_compiled_hooks(
+    mock_claude_home: Path, monkeypatch
+) -> None:
+    from claude_tooling_index.scanners import hooks as hooks_module
+
+    hooks_dir = mock_claude_home / "hooks"
+    (hooks_dir / "compiled").write_bytes(b"\x7fELF" + b"\x00" * 4096)
+    (hooks_dir / "script.out").write_bytes(b"#!/bin/sh\n" + b"echo hi\n" * 512)
+
+    consumed = {}
+    real_open = open
+
+    class _RecordingFile:
+        def __init__(self, path) -> None:
+            self._name = Path(path).name
+            self._f = real_open(path, "rb")
+
+        def __enter__(self):
+            return self._f
+
+        def __exit__(self, *exc) -> None:
+            consumed[self._name] = self._f.tell()
+            self._f.close()
+
+    monkeypatch.setattr(
+        hooks_module, "open", lambda path, mode: _RecordingFile(path), raising=False
+    )
+
+    by_name = {h.name: h for h in HookScanner(hooks_dir).scan()}
+
+    assert by_name["compiled"].language == "cpp"
+    assert consumed["compiled"] == hooks_module._SHEBANG_MAX_BYTES
+    assert by_name["script.out"].language == "bash"
+    assert consumed["script.out"] == (hooks_dir / "script.out").stat().st_size
+
+
+def test_hook_scanner_thread_pool_matches_serial_scan(mock_claude_home: Path, monkeypatch) -> None:
+    from claude_tooling_index.scanners import hooks as hooks_module
+
+    hooks_dir = mock_claude_home / "hooks"
+    (hooks_dir / ".disabled").mkdir()
+    for i in range(5):
+        (hooks_dir / f"pre_tool_use_{i}.sh").write_text(f"#!/bin/sh\necho ${{TOKEN_{i}}}\n")
+    (hooks_dir / ".disabled" / "session_start.py").write_text("print('x')\n")
+
+    def summary(hooks):
+        return [(h.name, h.status, h.required_env_vars) for h in hooks]
+
+    serial = summary(HookScanner(hooks_dir).scan())
+    monkeypatch.setattr(hooks_module, "_PARALLEL_MIN_FILES", 2)
+    parallel = summary(HookScanner(hooks_dir).scan())
+
+    assert parallel == serial
+    assert ("session_start.py", "disabled", []) in parallel
+    assert len(parallel) == 6
+
+
 def test_binary_scanner_detects_magic_numbers_shebang_and_error_path(
     mock_claude_home: Path, monkeypatch
 ) -> None:
@@ -71,7 +183,7 @@ def test_binary_scanner_detects_magic_numbers_shebang_and_error_path(
 
     original_scan_binary = BinaryScanner._scan_binary
 
-    def raise_for_one(self: BinaryScanner, binary_file: Path):
+    def raise_for_one(self: BinaryScanner, binary_file: os.DirEntry):
         if binary_file.name == "a.py":
             raise RuntimeError("boom")
         return original_scan_binary(self, binary_file)
@@ -87,6 +199,62 @@ def test_binary_scanner_detects_magic_numbers_shebang_and_error_path(
     assert by_name["a.py"].status == "error"
 
 
+@pytest.mark.parametrize(
+    "shebang,expected",
+    [
+        ("#!/usr/bin/env python3", "python"),
+        ("#!/bin/sh", "bash"),
+        ("#!/usr/bin/env zsh", "bash"),
+        ("#!/home/shared/bin/python", "python"),
+        ("#!/usr/bin/env node", "javascript"),
+        ("#!/usr/bin/ruby", "ruby"),
+        ("#!/usr/bin/perl", "perl"),
+        ("#!/usr/bin/env lua", "unknown"),
+    ],
+)
+def test_binary_scanner_shebang_precedence(tmp_path: Path, shebang: str, expected: str) -> None:
+    tool = tmp_path / "tool"
+    tool.write_text(f"{shebang}\nbody\n")
+
+    assert BinaryScanner(tmp_path)._detect_language(tool) == expected
+
+
+def test_binary_scanner_parallel_path_matches_serial(
+    mock_claude_home: Path, monkeypatch
+) -> None:
+    from claude_tooling_index.scanners import binaries as binaries_module
+
+    bin_dir = mock_claude_home / "bin"
+    for i in range(5):
+        tool = bin_dir / f"tool{i}.sh"
+        tool.write_text("#!/usr/bin/env bash\necho hi\n")
+        os.chmod(tool, 0o755 if i % 2 else 0o644)
+    (bin_dir / ".disabled").mkdir()
+    retired = bin_dir / ".disabled" / "retired.sh"
+    retired.write_text("#!/usr/bin/env bash\necho bye\n")
+    os.chmod(retired, 0o755)
+
+    serial = BinaryScanner(bin_dir).scan()
+    assert serial[-1].name == "retired.sh"
+    assert serial[-1].status == "disabled"
+    monkeypatch.setattr(binaries_module, "_PARALLEL_MIN_FILES", 1)
+    parallel = BinaryScanner(bin_dir).scan()
+
+    assert [b.name for b in parallel] == [b.name for b in serial]
+    assert [b.status for b in parallel] == [b.status for b in serial]
+    assert {b.language for b in parallel} == {"bash"}
+
+
+def test_binary_scanner_reports_unreadable_bin_dir(tmp_path: Path) -> None:
+    # A missing bin/ is empty, but other listing failures reach the caller.
+    assert BinaryScanner(tmp_path / "missing").scan() == []
+
+    not_a_dir = tmp_path / "bin"
+    not_a_dir.write_text("")
+    with pytest.raises(NotADirectoryError):
+        BinaryScanner(not_a_dir).scan()
+
+
 def test_multi_scanner_records_claude_scan_failure(monkeypatch, tmp_path: Path) -> None:
     # Patch Path.home to a temp without ~/.claude so ToolingScanner auto-detect fails.
     monkeypatch.setattr(Path, "home", lambda: tmp_path)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 import sqlite3
 from pathlib import Path
 
+import pytest
+
 from claude_tooling_index.models import ExtendedScanResult, ScanResult
 from claude_tooling_index.scanner import ToolingScanner
 
@@ -100,3 +104,103 @@ def test_tooling_scanner_scan_extended_includes_phase6_metrics(
     # Metrics are optional; ensure no crash and at least one metric is present.
     assert extended.event_metrics is not None
 
+    # close() releases the insights search connection and is safe to repeat.
+    assert scanner.insights_scanner.search_insights("w")
+    assert scanner.insights_scanner._conn is not None
+    scanner.close()
+    assert scanner.insights_scanner._conn is None
+    scanner.close()
+
+
+def test_tooling_scanner_caches_detected_home(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    ToolingScanner.invalidate_home_cache()
+    (tmp_path / ".claude").mkdir()
+
+    assert ToolingScanner().claude_home == tmp_path / ".claude"
+
+    # A cached hit skips the existence probe until the cache is invalidated.
+    (tmp_path / ".claude").rmdir()
+    assert ToolingScanner().claude_home == tmp_path / ".claude"
+
+    ToolingScanner.invalidate_home_cache()
+    with pytest.raises(ValueError, match="~/.claude directory not found"):
+        ToolingScanner()
+
+
+def test_tooling_scanner_scan_extended_reuses_metrics_until_inputs_change(
+    mock_claude_home: Path, monkeypatch
+) -> None:
+    scanner = ToolingScanner(claude_home=mock_claude_home)
+    real_scan = scanner.todos_scanner.scan
+    calls = []
+
+    def counting_scan():
+        calls.append(1)
+        return real_scan()
+
+    monkeypatch.setattr(scanner.todos_scanner, "scan", counting_scan)
+    todos_dir = mock_claude_home / "todos"
+    todos_dir.mkdir(exist_ok=True)
+    (todos_dir / "t.json").write_text(json.dumps([{"status": "completed"}]))
+
+    first = scanner.scan_extended(parallel=False)
+    second = scanner.scan_extended(parallel=False)
+    assert len(calls) == 1
+    assert first.task_metrics is not None
+    # Cache hits hand out copies, so callers cannot alter the cached metrics.
+    assert second.task_metrics == first.task_metrics
+    assert second.task_metrics is not first.task_metrics
+    assert second.core is not first.core
+
+    (todos_dir / "t2.json").write_text(json.dumps([{"status": "pending"}]))
+    scanner.scan_extended(parallel=False)
+    assert len(calls) == 2
+
+    scanner.invalidate_metrics_cache()
+    scanner.scan_extended(parallel=False)
+    assert len(calls) == 3
+
+
+def test_tooling_scanner_metrics_cache_key_tracks_files_read_in_place(
+    mock_claude_home: Path,
+) -> None:
+    scanner = ToolingScanner(claude_home=mock_claude_home)
+    project_dir = mock_claude_home / "projects" / "p1"
+    (project_dir / "session" / "tool-results").mkdir(parents=True)
+    transcript = project_dir / "t.jsonl"
+    transcript.write_text("{}\n")
+    key = scanner._metrics_cache_key()
+
+    # A transcript growing in place changes the key, even with its mtime unchanged.
+    st = transcript.stat()
+    with open(transcript, "a") as f:
+        f.write("{}\n")
+    os.utime(transcript, ns=(st.st_atime_ns, st.st_mtime_ns))
+    grown = scanner._metrics_cache_key()
+    assert grown != key
+
+    # So does a same-size rewrite with a newer mtime.
+    transcript.write_text("[]\n[]\n")
+    os.utime(transcript, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    rewritten = scanner._metrics_cache_key()
+    assert rewritten != grown
+
+    # Subtrees below the transcript level are not walked.
+    (project_dir / "session" / "tool-results" / "r.txt").write_text("x" * 100)
+    assert scanner._metrics_cache_key() == rewritten
+
+
+def test_tooling_scanner_scan_all_async_matches_sync(mock_claude_home: Path) -> None:
+    skill_dir = mock_claude_home / "skills" / "s1"
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text("---\nname: s1\ndescription: hi\n---\n")
+
+    scanner = ToolingScanner(claude_home=mock_claude_home)
+    async_result = asyncio.run(scanner.scan_all_async())
+    sync_result = scanner.scan_all(parallel=False)
+
+    assert [s.name for s in async_result.skills] == [s.name for s in sync_result.skills]
+    assert async_result.total_count == sync_result.total_count
+    assert async_result.scan_time is not None
+    assert async_result.errors == sync_result.errors
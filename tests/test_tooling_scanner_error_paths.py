@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 
+import pytest
+
 from claude_tooling_index.scanner import ToolingScanner
 
 
@@ -40,3 +43,56 @@ def test_tooling_scanner_scan_extended_handles_metric_scanner_failures(
     assert any("Error scanning user settings" in e for e in extended.core.errors)
     assert any("Error scanning growth" in e for e in extended.core.errors)
 
+
+
+def test_tooling_scanner_scan_extended_parallel_collects_failures(
+    mock_claude_home: Path, monkeypatch
+) -> None:
+    scanner = ToolingScanner(claude_home=mock_claude_home)
+
+    def boom(**_kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(scanner.insights_scanner, "scan", boom)
+    monkeypatch.setattr(scanner.transcript_scanner, "scan", boom)
+
+    extended = scanner.scan_extended(parallel=True)
+    assert extended.insight_metrics is None
+    assert extended.transcript_metrics is None
+    assert not any("user settings" in e for e in extended.core.errors)
+    assert any("Error scanning insights: boom" in e for e in extended.core.errors)
+    assert any("Error scanning transcripts: boom" in e for e in extended.core.errors)
+
+
+def test_tooling_scanner_scan_extended_runs_metric_scanners_concurrently(
+    mock_claude_home: Path, monkeypatch
+) -> None:
+    scanner = ToolingScanner(claude_home=mock_claude_home)
+    # Both scanners must be in flight at once for the barrier to release.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def wait_for_peer(**_kwargs):
+        barrier.wait()
+        return None
+
+    monkeypatch.setattr(scanner.insights_scanner, "scan", wait_for_peer)
+    monkeypatch.setattr(scanner.sessions_scanner, "scan", wait_for_peer)
+
+    extended = scanner.scan_extended(parallel=True)
+    assert not any("insights" in e or "sessions" in e for e in extended.core.errors)
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [(None, None), ("", None), ("bogus", None), ("2", 4), ("12", 12)],
+)
+def test_scan_worker_count_honors_env(monkeypatch, raw, expected) -> None:
+    from claude_tooling_index import scanner as scanner_module
+
+    monkeypatch.setattr(scanner_module.os, "cpu_count", lambda: 2)
+    if raw is None:
+        monkeypatch.delenv("TOOLING_INDEX_SCAN_WORKERS", raising=False)
+    else:
+        monkeypatch.setenv("TOOLING_INDEX_SCAN_WORKERS", raw)
+
+    assert scanner_module._scan_worker_count() == (expected or 10)